@@ -10,6 +10,8 @@ from framework.core.xmlstats import XmlTagCountWriter
 from framework.core.xmlstats import XmlTagCounter
 from framework.core.xmlutils import XmlElements
 from framework.core.xmlutils import XsiIncludeElementsReader
+from framework.core.xmlutils import add_xml_profile_arguments
+from framework.core.xmlutils import configure_xml_profiles_from_arguments
 from framework.utils.loggingutils import configure_logging
 from pathlib import Path
 from typing import List
@@ -132,6 +134,7 @@ def parse_arguments() -> Namespace:
             'data/templates/ParlaMint-taxonomy-UD-SYN.ana.xml',
             'data/templates/ParlaMint-taxonomy-NER.ana.xml'
         ])
+    add_xml_profile_arguments(parser)
     parser.add_argument(
         '-l',
         '--log-level',
@@ -144,4 +147,5 @@ def parse_arguments() -> Namespace:
 if __name__ == '__main__':
     args = parse_arguments()
     configure_logging(args.log_level)
+    configure_xml_profiles_from_arguments(args)
     main(args.corpus_dir, args.root_file, args.taxonomy_files)
@@ -1,27 +1,46 @@
 #!/usr/bin/env python
 """Build ParlaMint-RO corpus by converting sessions into XML format."""
+from argparse import ArgumentTypeError
 from argparse import Namespace, ArgumentParser
-from ast import literal_eval
+from collections import deque
+from concurrent.futures import Future
+from framework.core.conversion.buildmanifest import BuildManifest
+from framework.core.conversion.buildmanifest import MANIFEST_FILE
+from framework.core.conversion.buildmanifest import compute_file_hash
+from framework.core.conversion.buildmanifest import compute_framework_version
 from framework.core.conversion.corpusroot.legislativetermsreader import LegislativeTermsReader
-from framework.core.conversion.corpusroot.personlistmanipulator import PersonListManipulator
+from framework.core.conversion.corpusroot.personregistry import PersonRegistry
+from framework.core.conversion.corpusroot.personregistry import REGISTRY_FILE
 from framework.core.conversion.corpusroot.organizationslistreader import OrganizationsListReader
 from framework.core.conversion.corpusroot.rootcorpusfilebuilder import RootCorpusFileBuilder
 from framework.core.conversion.corpusroot.sessionspeakersreader import SessionSpeakersReader
+from framework.core.conversion.corpussetup import build_speaker_info_provider
+from framework.core.conversion.corpussetup import prepare_corpus_directory
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
 from framework.core.conversion.jsontoxml import SessionTranscriptConverter
-from framework.core.conversion.namemapping.namecorrectionsreader import NameCorrectionsReader
-from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from framework.core.conversion.namedtuples import SpeakerResolutionSnapshot
 from framework.core.conversion.namemapping.speakerinfoprovider import SpeakerInfoProvider
-from framework.core.conversion.namemapping.speakerinforeader import SpeakerInfoReader
+from framework.core.conversion.namemapping.speakerinfoprovider import create_speaker_info_provider
+from framework.core.conversion.sessionstatssidecar import remove_session_stats
+from framework.core.conversion.transcriptprefetcher import TranscriptPrefetcher
+from framework.core.conversion.wordcounter import TokenizerBackend
+from framework.core.conversion.wordcounter import WordCounter
+from framework.core.conversion.writebehindqueue import WriteBehindQueue
 from framework.core.xmlutils import XmlElements
 from framework.core.xmlutils import XsiIncludeElementsReader
+from framework.core.xmlutils import add_xml_profile_arguments
+from framework.core.xmlutils import configure_xml_profiles_from_arguments
+from framework.core.xmlutils import load_xml
 from framework.utils.loggingutils import configure_logging
+from multiprocessing import Pool
 from pathlib import Path
 from typing import Dict
 from typing import Generator
 from typing import List
+from typing import Tuple
 import logging
-import pandas as pd
 import sys
+import zlib
 
 
 def iter_files(directory: str,
@@ -38,13 +57,13 @@ def iter_files(directory: str,
     Returns
     -------
     file_path: generator of pathlib.Path
-        The generator that returns the path of each file.
+        The generator that returns the path of each file, in the order of file names.
     """
     root_path = Path(directory)
     if max_files is None:
         max_files = sys.maxsize
     count = 0
-    for file_path in root_path.glob('*.json'):
+    for file_path in sorted(root_path.glob('*.json')):
         if count < max_files:
             count += 1
             yield file_path
@@ -52,6 +71,53 @@ def iter_files(directory: str,
             break
 
 
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse the shard of the input files to convert.
+
+    Parameters
+    ----------
+    value: str, required
+        The shard in the format `k/N`, where `N` is the number of shards
+        and `k` is the number of the shard, from 1 to `N`.
+
+    Returns
+    -------
+    (shard_number, num_shards): tuple of (int, int)
+        The number of the shard and the number of shards.
+    """
+    parts = value.split('/')
+    if len(parts) != 2 or not all(part.isdigit() for part in parts):
+        raise ArgumentTypeError(f"Invalid shard '{value}'; expected k/N.")
+    shard_number, num_shards = int(parts[0]), int(parts[1])
+    if not 1 <= shard_number <= num_shards:
+        raise ArgumentTypeError(
+            f"Invalid shard '{value}'; k must be between 1 and N.")
+    return shard_number, num_shards
+
+
+def is_in_shard(input_file: Path, shard: Tuple[int, int]) -> bool:
+    """Check whether the input file belongs to the specified shard.
+
+    The files are assigned to shards by the hash of their names,
+    so each shard gets the same files regardless of the machine it runs on.
+
+    Parameters
+    ----------
+    input_file: Path, required
+        The path of the session transcript in JSON format.
+    shard: tuple of (int, int), required
+        The number of the shard and the number of shards.
+
+    Returns
+    -------
+    is_in_shard: bool
+        True if the file is converted by the shard; otherwise False.
+    """
+    shard_number, num_shards = shard
+    file_hash = zlib.crc32(Path(input_file).name.encode('utf-8'))
+    return file_hash % num_shards == shard_number - 1
+
+
 def build_output_file_path(input_file: str, output_dir: str) -> str:
     """Build the path of the output file.
 
@@ -77,115 +143,328 @@ def build_output_file_path(input_file: str, output_dir: str) -> str:
     return str(output_file)
 
 
-def read_personal_information(personal_info_file: str) -> List[SpeakerInfo]:
-    """Read personal information from the specified file.
+def convert_session(input_file: Path,
+                    output_file: str,
+                    args: Namespace,
+                    speaker_info_provider: SpeakerInfoProvider,
+                    legislative_terms: DateIntervalIndex,
+                    word_counter: WordCounter,
+                    pending_transcript: Future = None,
+                    xml_writer: WriteBehindQueue = None) -> bool:
+    """Convert the session transcript from the input file to XML.
 
     Parameters
     ----------
-    personal_info_file: str, required
-        The path of the CSV file containing personal info.
+    input_file: Path, required
+        The path of the session transcript in JSON format.
+    output_file: str, required
+        The path of the output XML file.
+    args: argparse.Namespace, required
+        The command-line arguments.
+    speaker_info_provider: SpeakerInfoProvider, required
+        The speaker info provider.
+    legislative_terms: DateIntervalIndex, required
+        The index of legislative terms by date.
+    word_counter: WordCounter, required
+        The word counter used for session statistics.
+    pending_transcript: Future, optional
+        The future result of loading the session transcript in the background.
+        If `None` then the transcript is loaded by the converter.
+    xml_writer: WriteBehindQueue, optional
+        The queue used for saving the session in the background.
+        If `None` then the session is saved before the function returns.
 
     Returns
     -------
-    personal_info: list of SpeakerInfo
-        The personal info as a list of SpeakerInfo instances.
+    converted: bool
+        True if the session was converted; False otherwise.
     """
+    try:
+        session_transcript = None
+        if pending_transcript is not None:
+            session_transcript = pending_transcript.result()
+        converter = SessionTranscriptConverter(
+            input_file,
+            args.session_template,
+            speaker_info_provider,
+            legislative_terms,
+            output_file,
+            word_counter=word_counter,
+            stream_body=args.stream_body,
+            session_transcript=session_transcript,
+            xml_writer=xml_writer)
+        converter.covert(args.build_sample)
+        return True
+    except Exception as e:
+        remove_faulty_file(output_file)
+        logging.exception("Failed to build session XML from %s. Exception: %r",
+                          input_file, e)
+        return False
+
+
+def remove_faulty_file(file_path: str):
+    """Remove the specified session file and its statistics record if they exist.
 
-    def is_empty(value: str) -> bool:
-        return pd.isnull(value) or pd.isna(value) or len(value) == 0
-
-    names = set()
-    personal_info = []
-    df = pd.read_csv(personal_info_file,
-                     converters={
-                         'first_name': literal_eval,
-                         'last_name': literal_eval
-                     })
-
-    for row in df.itertuples():
-        if row.full_name in names:
-            continue
-        profile_image = None if is_empty(
-            row.profile_image) else row.profile_image
-        item = SpeakerInfo(row.first_name,
-                           row.last_name,
-                           sex=row.sex,
-                           profile_image=profile_image)
-        personal_info.append(item)
-        names.add(row.full_name)
-    return personal_info
-
-
-def build_speaker_info_provider(
-        speaker_name_map: str,
-        speaker_profile_info: str) -> SpeakerInfoProvider:
-    """Build the speaker info provider.
+    Parameters
+    ----------
+    file_path: str, required
+        The path of the file to remove.
+    """
+    faulty_file = Path(file_path)
+    if faulty_file.exists():
+        faulty_file.unlink()
+    remove_session_stats(file_path)
+
+
+# The state of the worker process when converting sessions in parallel.
+worker_state = {}
+
+
+def init_worker(args: Namespace, snapshot: SpeakerResolutionSnapshot):
+    """Initialize the state of a worker process.
 
     Parameters
     ----------
-    speaker_name_map: str, required
-        The path of the CSV file that maps written names to actual names of the speakers.
-    speaker_profile_info: str, required
-        The path of the CSV file containing profile info of the speakers.
+    args: argparse.Namespace, required
+        The command-line arguments.
+    snapshot: SpeakerResolutionSnapshot, required
+        The data used for resolving speakers, as loaded by the parent process.
+    """
+    if not logging.getLogger().handlers:
+        configure_logging(args.log_level)
+    configure_xml_profiles_from_arguments(args)
+    root_xml = load_xml(args.corpus_root_template)
+    worker_state['args'] = args
+    worker_state['speaker_info_provider'] = create_speaker_info_provider(
+        snapshot)
+    worker_state['legislative_terms'] = LegislativeTermsReader(
+        root_xml.getroot()).get_legislative_term_index()
+    worker_state['word_counter'] = WordCounter(args.word_tokenizer)
+
+
+def convert_session_in_worker(
+        session_file: Tuple[Path, str]) -> Tuple[bool, Dict[str, str]]:
+    """Convert a session transcript within a worker process.
+
+    Parameters
+    ----------
+    session_file: tuple of (Path, str), required
+        The paths of the input JSON file and of the output XML file.
 
     Returns
     -------
-    speaker_info_provider: SpeakerInfoProvider
+    (converted, id_map): tuple of (bool, dict of (str, str))
+        The result of the conversion, and the speaker ids built for the session.
+    """
+    input_file, output_file = session_file
+    speaker_info_provider = worker_state['speaker_info_provider']
+    converted = convert_session(input_file, output_file, worker_state['args'],
+                                speaker_info_provider,
+                                worker_state['legislative_terms'],
+                                worker_state['word_counter'])
+    return converted, speaker_info_provider.export_id_map()
+
+
+def iter_converted_sessions(
+    session_files: List[Tuple[Path, str]], args: Namespace,
+    speaker_info_provider: SpeakerInfoProvider,
+    legislative_terms: DateIntervalIndex
+) -> Generator[Tuple[bool, Dict[str, str]], None, None]:
+    """Convert the session transcripts one after the other.
+
+    Parameters
+    ----------
+    session_files: list of (Path, str) tuples, required
+        The paths of the input JSON files and of the output XML files.
+    args: argparse.Namespace, required
+        The command-line arguments.
+    speaker_info_provider: SpeakerInfoProvider, required
         The speaker info provider.
-    """ ""
-    name_corrections_reader = NameCorrectionsReader()
-    profile_info_reader = SpeakerInfoReader()
+    legislative_terms: DateIntervalIndex, required
+        The index of legislative terms by date.
 
-    name_corrections = name_corrections_reader.read(speaker_name_map)
-    speaker_info = profile_info_reader.read(speaker_profile_info)
-    return SpeakerInfoProvider(name_corrections, speaker_info)
+    Returns
+    -------
+    results: generator of (bool, dict of (str, str)) tuples
+        The result of the conversion of each session and the speaker ids built for it,
+        in the order of the input files.
+    """
+    word_counter = WordCounter(args.word_tokenizer)
+    # The results are delayed until the sessions are saved
+    # so that the root file can read them.
+    pending_results = deque()
+    input_files = [input_file for input_file, _ in session_files]
+    with TranscriptPrefetcher(input_files, args.read_ahead) as prefetcher, \
+            WriteBehindQueue(args.write_behind) as xml_writer:
+        for session_file, transcript in zip(session_files, prefetcher):
+            input_file, output_file = session_file
+            converted = convert_session(input_file, output_file, args,
+                                        speaker_info_provider,
+                                        legislative_terms, word_counter,
+                                        transcript, xml_writer)
+            pending_results.append((input_file, output_file, converted,
+                                    speaker_info_provider.export_id_map()))
+            while len(pending_results) > 0:
+                is_full = len(pending_results) > xml_writer.max_pending
+                _, oldest_file, _, _ = pending_results[0]
+                if not is_full and not xml_writer.is_saved(oldest_file):
+                    break
+                yield wait_for_session(xml_writer, *pending_results.popleft())
+        while len(pending_results) > 0:
+            yield wait_for_session(xml_writer, *pending_results.popleft())
+
+
+def wait_for_session(xml_writer: WriteBehindQueue, input_file: Path,
+                     output_file: str, converted: bool,
+                     id_map: Dict[str, str]) -> Tuple[bool, Dict[str, str]]:
+    """Wait until the converted session is saved.
 
+    Parameters
+    ----------
+    xml_writer: WriteBehindQueue, required
+        The queue saving the sessions in the background.
+    input_file: Path, required
+        The path of the session transcript in JSON format.
+    output_file: str, required
+        The path of the output XML file.
+    converted: bool, required
+        The result of the conversion of the session.
+    id_map: dict of (str, str), required
+        The speaker ids built for the session.
 
-def read_name_map(file_path: str) -> Dict[str, str]:
-    """Read the name map from the specified CSV file.
+    Returns
+    -------
+    (converted, id_map): tuple of (bool, dict of (str, str))
+        The result of the conversion, which fails if the session could not be saved,
+        and the speaker ids built for the session.
+    """
+    try:
+        xml_writer.wait(output_file)
+    except Exception as e:
+        remove_faulty_file(output_file)
+        logging.exception("Failed to save session XML from %s. Exception: %r",
+                          input_file, e)
+        converted = False
+    return converted, id_map
+
+
+def iter_converted_sessions_in_parallel(
+    session_files: List[Tuple[Path, str]], args: Namespace,
+    speaker_info_provider: SpeakerInfoProvider
+) -> Generator[Tuple[bool, Dict[str, str]], None, None]:
+    """Convert the session transcripts in a pool of worker processes.
 
     Parameters
     ----------
-    file_path: str, required
-        The path of the CSV file containing name mapping data.
+    session_files: list of (Path, str) tuples, required
+        The paths of the input JSON files and of the output XML files.
+    args: argparse.Namespace, required
+        The command-line arguments.
+    speaker_info_provider: SpeakerInfoProvider, required
+        The speaker info provider whose snapshot is sent to the workers.
 
     Returns
     -------
-    name_map: dict of (str,str)
-        The dictionary mapping names as they appear in the transcripts to the correct names.
+    results: generator of (bool, dict of (str, str)) tuples
+        The result of the conversion of each session and the speaker ids built for it,
+        in the order of the input files.
     """
-    df = pd.read_csv(file_path)
-    name_map = {row.name.lower(): row.correct_name for row in df.itertuples()}
-    return name_map
+    logging.info("Converting sessions using %s worker processes.",
+                 args.workers)
+    snapshot = speaker_info_provider.create_snapshot()
+    with Pool(args.workers, initializer=init_worker,
+              initargs=(args, snapshot)) as pool:
+        yield from pool.imap(convert_session_in_worker, session_files)
+
+
+def build_common_inputs(args: Namespace) -> Dict[str, object]:
+    """Build the inputs shared by all sessions, as recorded in the build manifest.
 
+    Parameters
+    ----------
+    args: argparse.Namespace, required
+        The command-line arguments.
 
-def prepare_corpus_directory(corpus_directory: str,
-                             included_files: List[Path]) -> Path:
-    """Create the corpus directory and copy the included files.
+    Returns
+    -------
+    inputs: dict of (str, object)
+        The hashes of the shared input files, the version of the framework,
+        and the options that change the contents of the session files.
+    """
+    return {
+        'session_template': compute_file_hash(args.session_template),
+        'corpus_root_template': compute_file_hash(args.corpus_root_template),
+        'speaker_name_map': compute_file_hash(args.speaker_name_map),
+        'profile_info': compute_file_hash(args.profile_info),
+        'framework_version': compute_framework_version(),
+        'build_sample': args.build_sample,
+        'name_match_threshold': args.name_match_threshold,
+        'word_tokenizer': args.word_tokenizer,
+        'xml_format': args.xml_format
+    }
+
+
+def iter_session_results(
+    session_files: List[Tuple[Path, str]], is_skipped: List[bool],
+    results: Generator[Tuple[bool, Dict[str, str]], None,
+                       None], manifest: BuildManifest
+) -> Generator[Tuple[bool, Dict[str, str]], None, None]:
+    """Combine the results of the converted sessions with the skipped ones.
 
     Parameters
     ----------
-    corpus_directory: str, required
-        The path of the corpus directory.
-    included_files: list of Path, required
-        The paths of the included files to copy to corpus directory.
+    session_files: list of (Path, str) tuples, required
+        The paths of the input JSON files and of the output XML files.
+    is_skipped: list of bool, required
+        For each session, whether it is up to date and was not converted.
+    results: generator of (bool, dict of (str, str)) tuples, required
+        The results of the sessions that were converted.
+    manifest: BuildManifest, required
+        The manifest providing the speaker ids of the skipped sessions.
 
     Returns
     -------
-    corpus_dir: Path
-        The path representing the corpus directory.
+    results: generator of (bool, dict of (str, str)) tuples
+        The result of each session and its speaker ids, in the order of the input files.
     """
-    logging.info("Preparing corpus directory %s.", corpus_directory)
-    corpus_dir = Path(corpus_directory)
-    corpus_dir.mkdir(exist_ok=True, parents=True)
+    for (_, output_file), skipped in zip(session_files, is_skipped):
+        if skipped:
+            yield True, manifest.get_speaker_ids(output_file)
+        else:
+            yield next(results)
 
-    for included_file in included_files:
-        logging.info("Copying included file %s to %s.", included_file,
-                     corpus_directory)
-        contents = included_file.read_text()
-        dest_file = corpus_dir / included_file.name
-        dest_file.write_text(contents)
-    return corpus_dir
+
+def add_corpus_file(root_builder: RootCorpusFileBuilder,
+                    input_file: Path,
+                    output_file: str,
+                    skipped: bool = False) -> bool:
+    """Add the session file to the root file of the corpus.
+
+    Parameters
+    ----------
+    root_builder: RootCorpusFileBuilder, required
+        The builder of the root file.
+    input_file: Path, required
+        The path of the session transcript in JSON format.
+    output_file: str, required
+        The path of the session file.
+    skipped: bool, optional
+        Whether the session is up to date and was not converted, in which case
+        its speakers are added from the person registry of an earlier build. Default is False.
+
+    Returns
+    -------
+    added: bool
+        True if the session file was added; False otherwise.
+    """
+    try:
+        root_builder.add_corpus_file(output_file, reuse_speakers=skipped)
+        return True
+    except Exception as e:
+        remove_faulty_file(output_file)
+        logging.exception("Failed to build session XML from %s. Exception: %r",
+                          input_file, e)
+        return False
 
 
 def main(args):
@@ -198,40 +477,76 @@ def main(args):
     output_dir = prepare_corpus_directory(
         args.output_directory, taxonomy_files + participant_description_files)
     speaker_info_provider = build_speaker_info_provider(
-        args.speaker_name_map, args.profile_info)
+        args.speaker_name_map, args.profile_info, args.name_match_threshold,
+        args.speaker_data_cache)
 
     org_list_reader = OrganizationsListReader(
         str(output_dir / participant_description_files[0].name))
-    pers_list_manipulator = PersonListManipulator(
-        str(output_dir / participant_description_files[1].name))
+    person_registry = PersonRegistry(
+        str(output_dir / participant_description_files[1].name),
+        str(output_dir / REGISTRY_FILE), args.person_list_checkpoint)
     root_file_path = str(output_dir / Path("ParlaMint-RO.xml"))
     root_builder = RootCorpusFileBuilder(root_file_path,
                                          args.corpus_root_template,
                                          speaker_info_provider,
-                                         pers_list_manipulator,
-                                         org_list_reader, args.build_sample)
+                                         person_registry,
+                                         org_list_reader,
+                                         args.build_sample,
+                                         checkpoint_interval=args.checkpoint)
     total, processed, failed = 0, 0, 0
     sample_size = args.sample_size if args.build_sample else None
     legislative_terms = LegislativeTermsReader(
-        root_builder.xml_root).get_legislative_terms()
-    for f in iter_files(args.input_directory, max_files=sample_size):
-        total = total + 1
-        try:
-            output_file = build_output_file_path(f, str(output_dir))
-            converter = SessionTranscriptConverter(f, args.session_template,
-                                                   speaker_info_provider,
-                                                   legislative_terms,
-                                                   output_file)
-            converter.covert(args.build_sample)
-            root_builder.add_corpus_file(output_file)
-            processed = processed + 1
-        except Exception as e:
-            failed = failed + 1
-            faulty_file = Path(output_file)
-            if faulty_file.exists():
-                faulty_file.unlink()
-            logging.exception(
-                "Failed to build session XML from %s. Exception: %r", f, e)
+        root_builder.xml_root).get_legislative_term_index()
+    session_files = [
+        (f, build_output_file_path(f, str(output_dir)))
+        for f in iter_files(args.input_directory, max_files=sample_size)
+        if args.shard is None or is_in_shard(f, args.shard)
+    ]
+    manifest = BuildManifest(str(output_dir / MANIFEST_FILE))
+    common_inputs = build_common_inputs(args)
+    session_inputs = [
+        dict(common_inputs, transcript=compute_file_hash(f))
+        for f, _ in session_files
+    ]
+    is_skipped = [
+        not args.rebuild and manifest.is_up_to_date(output_file, inputs)
+        for (_, output_file), inputs in zip(session_files, session_inputs)
+    ]
+    pending_files = [
+        session_file
+        for session_file, skipped in zip(session_files, is_skipped)
+        if not skipped
+    ]
+    logging.info("Skipping %s unchanged sessions.",
+                 len(session_files) - len(pending_files))
+    if args.workers > 1 and len(pending_files) > 0:
+        results = iter_converted_sessions_in_parallel(pending_files, args,
+                                                      speaker_info_provider)
+    else:
+        results = iter_converted_sessions(pending_files, args,
+                                          speaker_info_provider,
+                                          legislative_terms)
+    results = iter_session_results(session_files, is_skipped, results,
+                                   manifest)
+
+    # The root file is updated in the order of the input files
+    # so that the output is the same regardless of the number of workers.
+    try:
+        for (f, output_file), inputs, skipped, (converted, id_map) in zip(
+                session_files, session_inputs, is_skipped, results):
+            total = total + 1
+            speaker_info_provider.merge_id_map(id_map)
+            converted = converted and add_corpus_file(root_builder, f,
+                                                      output_file, skipped)
+            if converted:
+                processed = processed + 1
+            else:
+                failed = failed + 1
+            manifest.record_session(output_file, inputs, converted, id_map)
+    finally:
+        root_builder.finalize()
+        manifest.save()
+        person_registry.close()
 
     logging.info("Processed: %s/%s", processed, total)
     if failed > 0:
@@ -267,6 +582,17 @@ def parse_arguments() -> Namespace:
     parser.add_argument('--profile-info',
                         help="The CSV file containing profile info.",
                         default='data/speakers/profile-info.csv')
+    parser.add_argument(
+        '--name-match-threshold',
+        help="When present, the names missing from the speaker name map are "
+        "replaced by the most similar known name if the similarity, between "
+        "0 and 1, is at least this value.",
+        type=float)
+    parser.add_argument(
+        '--speaker-data-cache',
+        help="When present, the directory where the data read from the "
+        "speaker name map and profile info files is cached, keyed by the "
+        "hash of the files.")
     parser.add_argument('-o',
                         '--output-directory',
                         help="The directory where to save corpus files.",
@@ -279,7 +605,64 @@ def parse_arguments() -> Namespace:
                         help="The number of files to include in the sample.",
                         type=int,
                         default=10)
-
+    parser.add_argument(
+        '--shard',
+        help="Convert only the shard k of N of the input files, e.g. 2/4. "
+        "The shards are built in separate output directories and combined "
+        "with merge-corpus-shards.py.",
+        type=parse_shard)
+    parser.add_argument(
+        '--workers',
+        help="The number of worker processes used for converting sessions.",
+        type=int,
+        default=1)
+    parser.add_argument(
+        '--stream-body',
+        help="When present, write the utterances of each session to the output "
+        "file as soon as they are built instead of keeping the whole session "
+        "in memory.",
+        action='store_true')
+    parser.add_argument(
+        '--read-ahead',
+        help="The number of session transcripts loaded in background threads "
+        "ahead of the one being converted, when converting sessions in the "
+        "main process. Use 0 to load each transcript when it is converted.",
+        type=int,
+        default=2)
+    parser.add_argument(
+        '--write-behind',
+        help="The maximum number of converted sessions waiting to be saved "
+        "by a background thread, when converting sessions in the main "
+        "process. Use 0 to save each session before converting the next one.",
+        type=int,
+        default=2)
+    parser.add_argument(
+        '--checkpoint',
+        help="The number of added sessions after which the root file of the "
+        "corpus and the list of persons are saved. Use 0 to save them only "
+        "at the end of the run.",
+        type=int,
+        default=0)
+    parser.add_argument(
+        '--person-list-checkpoint',
+        help="The number of speaker updates after which the list of persons "
+        "is saved. Use 0 to save it only at the end of the run.",
+        type=int,
+        default=0)
+    parser.add_argument(
+        '--rebuild',
+        help="When present, convert all sessions instead of skipping the ones "
+        "whose inputs did not change since the previous build.",
+        action='store_true')
+    parser.add_argument(
+        '--word-tokenizer',
+        help="The tokenizer used for counting words: the tokenizer of the "
+        "full Romanian model, or the rules of a blank Romanian pipeline, "
+        "which loads faster but was not checked to give the same counts.",
+        choices=[TokenizerBackend.Model, TokenizerBackend.Blank],
+        default=TokenizerBackend.Model)
+
+    add_xml_profile_arguments(parser)
     parser.add_argument(
         '-l',
         '--log-level',
@@ -293,4 +676,5 @@ def parse_arguments() -> Namespace:
 if __name__ == '__main__':
     args = parse_arguments()
     configure_logging(args.log_level, 'build_corpus.log')
+    configure_xml_profiles_from_arguments(args)
     main(args)
@@ -4,18 +4,25 @@ import argparse
 import logging
 import pandas as pd
 from framework.utils.loggingutils import configure_logging
-from framework.utils.sessionutils import load_speakers
+from framework.utils.speakercensus import SpeakerCensus
+from framework.utils.speakercensus import build_name_records
+from framework.utils.speakercensus import build_speaker_records
 from framework.utils.dataframeutils import save_data_frame
 
 
 def main(args):
-    """Build a list of unique speaker names."""
-    speaker_names = set()
-    for speaker in load_speakers(args.sessions_dir):
-        name = speaker['full_name']
-        speaker_names.add(name)
-    records = [{'name': name, 'correct_name': ''} for name in speaker_names]
-    save_data_frame(pd.DataFrame.from_records(records), args.names_list)
+    """Build a list of unique speaker names, Parliament members, and guests."""
+    census = SpeakerCensus(args.workers,
+                           args.census_cache).take(args.sessions_dir)
+    logging.info("Found %s unique speaker names.", len(census))
+    save_data_frame(pd.DataFrame.from_records(build_name_records(census)),
+                    args.names_list)
+    if args.members_file is not None:
+        members = build_speaker_records(census, guests=False)
+        save_data_frame(pd.DataFrame.from_records(members), args.members_file)
+    if args.guests_file is not None:
+        guests = build_speaker_records(census, guests=True)
+        save_data_frame(pd.DataFrame.from_records(guests), args.guests_file)
     logging.info("That's all folks!")
 
 
@@ -38,6 +45,29 @@ def parse_arguments():
         help="The path of the CSV file where to save the list of unique names.",
         type=str,
         default="./data/speakers/speaker-names.csv")
+    parser.add_argument(
+        '--save-members-to',
+        help="The path of the CSV file where to save the Parliament members.",
+        type=str,
+        dest='members_file',
+        default=None)
+    parser.add_argument(
+        '--save-guests-to',
+        help="The path of the CSV file where to save the guest speakers.",
+        type=str,
+        dest='guests_file',
+        default=None)
+    parser.add_argument('--workers',
+                        help="The number of processes scanning the sessions. "
+                        "Defaults to the number of CPUs.",
+                        type=int,
+                        default=None)
+    parser.add_argument(
+        '--census-cache',
+        help="The JSON file caching the speakers of each session, "
+        "so that only new or changed sessions are scanned again.",
+        type=str,
+        default="./data/speakers/.speaker-census-cache.json")
     parser.add_argument(
         '-l',
         '--log-level',
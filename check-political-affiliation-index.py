@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Checks the index of political affiliation against a linear scan of the coalition/opposition relations."""
+from argparse import ArgumentParser
+from datetime import date
+from datetime import timedelta
+from framework.core.conversion.corpusroot.coalitionoppositionrelationreader import CoalitionOppositionRelationReader
+from framework.core.conversion.corpusroot.politicalaffiliationindex import PoliticalStatus
+from framework.core.conversion.corpusroot.politicalaffiliationindex import build_political_affiliation_index
+from framework.core.conversion.corpusroot.politicalaffiliationindex import parse_date
+from framework.core.conversion.namedtuples import CoalitionOppositionRelation
+from framework.utils.loggingutils import configure_logging
+from typing import Iterable
+from typing import List
+import logging
+import sys
+
+
+def parse_relation_dates(
+        relation: CoalitionOppositionRelation) -> CoalitionOppositionRelation:
+    """Parse the dates of the relation the same way as the index does.
+
+    Parameters
+    ----------
+    relation: CoalitionOppositionRelation, required
+        The relation with the dates in ISO format.
+
+    Returns
+    -------
+    relation: CoalitionOppositionRelation
+        The relation with the parsed dates.
+    """
+    return relation._replace(start_date=parse_date(relation.start_date,
+                                                   date.min),
+                             end_date=parse_date(relation.end_date))
+
+
+def find_relation(relations: List[CoalitionOppositionRelation],
+                  value: date) -> CoalitionOppositionRelation:
+    """Find the first relation in effect on the specified date by scanning the relations.
+
+    Parameters
+    ----------
+    relations: list of CoalitionOppositionRelation, required
+        The relations with the parsed dates.
+    value: date, required
+        The date to look up.
+
+    Returns
+    -------
+    relation: CoalitionOppositionRelation
+        The first relation in effect on the date if found; otherwise None.
+    """
+    for relation in relations:
+        end_date = date.max if relation.end_date is None else relation.end_date
+        if relation.start_date <= value <= end_date:
+            return relation
+    return None
+
+
+def get_political_status(relation: CoalitionOppositionRelation,
+                         acronym: str) -> str:
+    """Get the political status of the parliamentary group in the relation.
+
+    Parameters
+    ----------
+    relation: CoalitionOppositionRelation, required
+        The relation, or None.
+    acronym: str, required
+        The acronym of the parliamentary group.
+
+    Returns
+    -------
+    political_status: str
+        One of the values of `PoliticalStatus` if the group is part of the relation; otherwise None.
+    """
+    if relation is None:
+        return None
+    if acronym in relation.coalition:
+        return PoliticalStatus.Coalition
+    if acronym in relation.opposition:
+        return PoliticalStatus.Opposition
+    return None
+
+
+def iter_dates(relations: List[CoalitionOppositionRelation]) -> Iterable[date]:
+    """Iterate over each day spanned by the relations, including the day before and after.
+
+    Parameters
+    ----------
+    relations: list of CoalitionOppositionRelation, required
+        The relations with the parsed dates.
+
+    Returns
+    -------
+    dates: iterable of date
+        The days to check.
+    """
+    bounds = [r.start_date for r in relations if r.start_date != date.min]
+    bounds.extend(r.end_date for r in relations if r.end_date is not None)
+    if len(bounds) == 0:
+        return
+    day, last_day = min(bounds) - timedelta(days=1), max(bounds) + timedelta(
+        days=1)
+    while day <= last_day:
+        yield day
+        day = day + timedelta(days=1)
+
+
+def main(args):
+    """Compare the answers of the index with the ones of a linear scan."""
+    index = build_political_affiliation_index(args.data_directory)
+    relations = [
+        parse_relation_dates(relation) for relation in
+        CoalitionOppositionRelationReader().read(args.data_directory)
+    ]
+    acronyms = sorted({
+        acronym
+        for relation in relations
+        for acronym in relation.coalition + relation.opposition
+    })
+    num_dates, num_mismatches = 0, 0
+    for day in iter_dates(relations):
+        num_dates = num_dates + 1
+        expected = find_relation(relations, day)
+        if index.get_relation(day) != expected:
+            num_mismatches = num_mismatches + 1
+            logging.error("Relation mismatch on %s: expected %s, found %s.",
+                          day, expected, index.get_relation(day))
+        for acronym in acronyms:
+            status = index.get_political_status(acronym, day)
+            if status != get_political_status(expected, acronym):
+                num_mismatches = num_mismatches + 1
+                logging.error("Status mismatch for %s on %s: found %s.",
+                              acronym, day, status)
+    logging.info("Checked %s relations and %s groups on %s dates.",
+                 len(relations), len(acronyms), num_dates)
+    if num_mismatches > 0:
+        logging.error("Found %s mismatches.", num_mismatches)
+        sys.exit(1)
+    logging.info("That's all folks!")
+
+
+def parse_arguments():
+    """Parse the command-line arguments.
+
+    Returns
+    -------
+    args: argparse.Namespace
+        The command-line arguments.
+    """
+    parser = ArgumentParser(
+        description='Check the index of political affiliation.')
+    parser.add_argument(
+        '--data-directory',
+        help="The directory containing the CSV files with coalition/opposition "
+        "relations and parliamentary groups.",
+        type=str,
+        default="./data/")
+    parser.add_argument(
+        '-l',
+        '--log-level',
+        help="The level of details to print when running.",
+        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        default='info')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    configure_logging(args.log_level)
+    main(args)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""Checks that the in-memory conversion of session transcripts gives the same files as the file-based one."""
+from argparse import ArgumentParser
+from framework.core.conversion.corpusroot.legislativetermsreader import LegislativeTermsReader
+from framework.core.conversion.corpussetup import build_speaker_info_provider
+from framework.core.conversion.jsontoxml import SessionTranscriptConverter
+from framework.core.xmlutils import load_xml
+from framework.utils.loggingutils import configure_logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import logging
+import sys
+
+
+def convert_session(input_file: Path, output_file: Path, options: dict,
+                    in_memory: bool, stream_body: bool) -> bytes:
+    """Convert the session transcript and read the resulting file.
+
+    Parameters
+    ----------
+    input_file: Path, required
+        The path of the session transcript in JSON format.
+    output_file: Path, required
+        The path of the output file.
+    options: dict, required
+        The session template, the speaker info provider and the legislative terms used by the converter.
+    in_memory: bool, required
+        Whether to convert the session in memory or through the output file.
+    stream_body: bool, required
+        Whether to stream the session body to the output file.
+
+    Returns
+    -------
+    contents: bytes
+        The contents of the output file.
+    """
+    converter = SessionTranscriptConverter(str(input_file),
+                                           output_file=str(output_file),
+                                           in_memory=in_memory,
+                                           stream_body=stream_body,
+                                           **options)
+    converter.covert()
+    return output_file.read_bytes()
+
+
+def main(args):
+    """Convert each session in memory and through the file, and compare the results."""
+    corpus_root = load_xml(args.corpus_root_template).getroot()
+    options = {
+        'session_template':
+        args.session_template,
+        'speaker_info_provider':
+        build_speaker_info_provider(args.speaker_name_map, args.profile_info),
+        'legislative_terms':
+        LegislativeTermsReader(corpus_root).get_legislative_term_index()
+    }
+    input_files = sorted(Path(args.input_directory).glob('*.json'))
+    input_files = input_files[:args.max_files]
+    num_mismatches = 0
+    with TemporaryDirectory() as output_directory:
+        for input_file in input_files:
+            output_file = Path(output_directory) / f'{input_file.stem}.xml'
+            expected = convert_session(input_file, output_file, options, False,
+                                       False)
+            for stream_body in [False, True]:
+                contents = convert_session(input_file, output_file, options,
+                                           True, stream_body)
+                if contents != expected:
+                    num_mismatches = num_mismatches + 1
+                    logging.error(
+                        "The in-memory conversion of %s (stream body: %s) "
+                        "differs from the file-based one.", input_file,
+                        stream_body)
+    logging.info("Checked %s session files.", len(input_files))
+    if num_mismatches > 0:
+        logging.error("Found %s mismatches.", num_mismatches)
+        sys.exit(1)
+    logging.info("That's all folks!")
+
+
+def parse_arguments():
+    """Parse the command-line arguments.
+
+    Returns
+    -------
+    args: argparse.Namespace
+        The command-line arguments.
+    """
+    parser = ArgumentParser(
+        description='Check the in-memory conversion of session transcripts.')
+    parser.add_argument(
+        '-i',
+        '--input-directory',
+        help="The directory containing session transcripts in JSON format.",
+        default='data/sessions/')
+    parser.add_argument('--session-template',
+                        help="The path of the session template file.",
+                        default='data/templates/session-template.xml')
+    parser.add_argument('--corpus-root-template',
+                        help="The path of the corpus root template.",
+                        default='data/templates/corpus-root-template.xml')
+    parser.add_argument(
+        '--speaker-name-map',
+        help="The path of the CSV file mapping speaker names to correct names.",
+        type=str,
+        default='data/speakers/speaker-name-map.csv')
+    parser.add_argument('--profile-info',
+                        help="The CSV file containing profile info.",
+                        default='data/speakers/profile-info.csv')
+    parser.add_argument('--max-files',
+                        help="The maximum number of session files to check.",
+                        type=int,
+                        default=10)
+    parser.add_argument(
+        '-l',
+        '--log-level',
+        help="The level of details to print when running.",
+        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        default='info')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    configure_logging(args.log_level)
+    main(args)
@@ -4,40 +4,17 @@ from argparse import ArgumentParser
 import logging
 import pandas as pd
 from framework.utils.loggingutils import configure_logging
-from framework.utils.sessionutils import load_speakers
+from framework.utils.speakercensus import SpeakerCensus
+from framework.utils.speakercensus import build_speaker_records
 from framework.utils.dataframeutils import save_data_frame
 
 
-def is_guest(speaker):
-    """Determine whether the provided speaker is a guest or a member of the Parliament.
-
-    Parameters
-    ----------
-    speaker: dict, required
-        The speaker.
-
-    Returns
-    -------
-    is_guest: bool
-        True if the speaker is a guest; False if the speaker is a member of the Parliament.
-    """
-    profile_url = speaker['profile_url']
-    return profile_url is None or len(profile_url) == 0
-
-
 def main(args):
     """Filter speakers into Parliament members and guests."""
-    guests, members = {}, {}
-    for speaker in load_speakers(args.sessions_dir):
-        speaker_name = speaker['full_name']
-        guest_speaker = is_guest(speaker)
-        if guest_speaker and speaker_name not in guests:
-            guests[speaker_name] = speaker
-        if (not guest_speaker) and (speaker_name not in members):
-            members[speaker_name] = speaker
-
-    guests = list(guests.values())
-    members = list(members.values())
+    census = SpeakerCensus(args.workers,
+                           args.census_cache).take(args.sessions_dir)
+    guests = build_speaker_records(census, guests=True)
+    members = build_speaker_records(census, guests=False)
     save_data_frame(pd.DataFrame.from_records(guests), args.guests_file)
     save_data_frame(pd.DataFrame.from_records(members), args.members_file)
     logging.info("That's all folks!")
@@ -69,6 +46,17 @@ def parse_arguments():
         type=str,
         dest='guests_file',
         default="./data/speakers/guest-speakers.csv")
+    parser.add_argument('--workers',
+                        help="The number of processes scanning the sessions. "
+                        "Defaults to the number of CPUs.",
+                        type=int,
+                        default=None)
+    parser.add_argument(
+        '--census-cache',
+        help="The JSON file caching the speakers of each session, "
+        "so that only new or changed sessions are scanned again.",
+        type=str,
+        default="./data/speakers/.speaker-census-cache.json")
     parser.add_argument(
         '-l',
         '--log-level',
@@ -0,0 +1,187 @@
+"""Defines the manifest used for rebuilding the corpus incrementally."""
+from pathlib import Path
+from typing import Dict
+from typing import List
+import hashlib
+import json
+import logging
+
+MANIFEST_FILE = '.build-manifest.json'
+MANIFEST_VERSION = 1
+
+
+def compute_file_hash(file_path: str) -> str:
+    """Compute the SHA-256 hash of the contents of the specified file.
+
+    Parameters
+    ----------
+    file_path: str, required
+        The path of the file.
+
+    Returns
+    -------
+    file_hash: str
+        The hexadecimal digest of the file contents.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_framework_version() -> str:
+    """Compute the version of the framework from its source files.
+
+    Any change to the source code of the framework changes the version,
+    so the sessions converted by a previous version of the code are rebuilt.
+
+    Returns
+    -------
+    framework_version: str
+        The hexadecimal digest of the source files of the framework.
+    """
+    package_dir = Path(__file__).resolve().parents[2]
+    digest = hashlib.sha256()
+    for source_file in sorted(package_dir.rglob('*.py')):
+        digest.update(str(source_file.relative_to(package_dir)).encode())
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Keeps track of the inputs from which each session file of the corpus was built."""
+
+    def __init__(self, manifest_file: str):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        manifest_file: str, required
+            The path of the manifest file. If the file exists, the manifest of
+            the previous build is loaded from it.
+        """
+        self.__manifest_file = Path(manifest_file)
+        self.__sessions = self.__load_sessions()
+
+    def is_up_to_date(self, output_file: str, inputs: Dict[str,
+                                                           object]) -> bool:
+        """Check whether the session file was built from the provided inputs.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the session file.
+        inputs: dict of (str, object), required
+            The hashes of the input files and the options used for building the session.
+
+        Returns
+        -------
+        is_up_to_date: bool
+            True if the session file exists and was successfully built from
+            the same inputs; otherwise False.
+        """
+        session = self.__sessions.get(Path(output_file).name)
+        if session is None or not session['converted']:
+            return False
+        return session['inputs'] == inputs and Path(output_file).exists()
+
+    def get_built_session_files(self) -> List[str]:
+        """Get the names of the session files that were built successfully.
+
+        Returns
+        -------
+        session_files: list of str
+            The sorted names of the session files.
+        """
+        return sorted(file_name
+                      for file_name, session in self.__sessions.items()
+                      if session['converted'])
+
+    def get_inputs(self, output_file: str) -> Dict[str, object]:
+        """Get the inputs recorded for the session file.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the session file.
+
+        Returns
+        -------
+        inputs: dict of (str, object)
+            The hashes of the input files and the options used for building the session.
+        """
+        session = self.__sessions.get(Path(output_file).name)
+        if session is None:
+            return {}
+        return dict(session['inputs'])
+
+    def get_speaker_ids(self, output_file: str) -> Dict[str, str]:
+        """Get the ids of the speakers recorded for the session file.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the session file.
+
+        Returns
+        -------
+        speaker_ids: dict of (str, str)
+            The dictionary mapping speaker ids to speaker names.
+        """
+        session = self.__sessions.get(Path(output_file).name)
+        if session is None:
+            return {}
+        return dict(session['speaker_ids'])
+
+    def record_session(self, output_file: str, inputs: Dict[str, object],
+                       converted: bool, speaker_ids: Dict[str, str]):
+        """Record the result of building a session file.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the session file.
+        inputs: dict of (str, object), required
+            The hashes of the input files and the options used for building the session.
+        converted: bool, required
+            True if the session file was built successfully; otherwise False.
+        speaker_ids: dict of (str, str), required
+            The dictionary mapping the ids of the speakers from the session to their names.
+        """
+        self.__sessions[Path(output_file).name] = {
+            'inputs': inputs,
+            'converted': converted,
+            'speaker_ids': speaker_ids
+        }
+
+    def save(self):
+        """Save the manifest to its file."""
+        contents = {'version': MANIFEST_VERSION, 'sessions': self.__sessions}
+        temp_file = self.__manifest_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(contents, f, indent=2, sort_keys=True)
+        temp_file.replace(self.__manifest_file)
+
+    def __load_sessions(self) -> Dict[str, dict]:
+        """Load the sessions recorded by the previous build.
+
+        Returns
+        -------
+        sessions: dict of (str, dict)
+            The records of the session files, keyed by file name.
+        """
+        if not self.__manifest_file.exists():
+            return {}
+        try:
+            with open(self.__manifest_file, 'r', encoding='utf-8') as f:
+                contents = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning("Could not read build manifest %s: %r.",
+                            self.__manifest_file, e)
+            return {}
+        if contents.get('version') != MANIFEST_VERSION:
+            logging.info("Ignoring build manifest %s of version %s.",
+                         self.__manifest_file, contents.get('version'))
+            return {}
+        return contents['sessions']
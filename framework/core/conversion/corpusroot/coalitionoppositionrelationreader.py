@@ -1,6 +1,6 @@
 """Defines a class for reading coalition/opposition info from CSV files."""
 from framework.core.conversion.namedtuples import CoalitionOppositionRelation
-from pathlib import Path
+from framework.utils.fileutils import find_files
 from typing import List
 import pandas as pd
 
@@ -27,9 +27,8 @@ class CoalitionOppositionRelationReader:
         relations: list of CoalitionOppositionRelation
             The list of coalition/opposition relations.
         """
-        data_dir = Path(data_directory)
         relations = []
-        for f in data_dir.glob(f'**/{file_name_pattern}'):
+        for f in find_files(data_directory, file_name_pattern):
             df = pd.read_csv(str(f))
             for row in df.itertuples():
                 coalition = self.__build_list(row.coalition)
@@ -1,6 +1,7 @@
 """Defines a class for reading legislative terms."""
 
 from datetime import date
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
 from framework.core.conversion.namedtuples import LegislativeTerm
 from framework.core.xmlutils import Languages
 from framework.core.xmlutils import OrganizationRoles
@@ -53,6 +54,16 @@ class LegislativeTermsReader:
 
         return list(self.__load_legislative_terms())
 
+    def get_legislative_term_index(self) -> DateIntervalIndex:
+        """Get the index of the legislative terms by date.
+
+        Returns
+        -------
+        term_index: DateIntervalIndex
+            The index of the legislative terms.
+        """
+        return DateIntervalIndex(self.get_legislative_terms())
+
     def __load_legislative_terms(
             self) -> Generator[LegislativeTerm, None, None]:
         """Load legislative terms from the XML.
@@ -1,5 +1,6 @@
 """Class for readint the list of organizations and their data."""
 from datetime import date
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
 from framework.core.conversion.namedtuples import Event
 from framework.core.xmlutils import OrganizationRoles
 from framework.core.xmlutils import XmlAttributes
@@ -66,10 +67,7 @@ class OrganizationsListReader(XmlDataReader):
         legislative_terms: list of (str, str, date, date) tuples
             The legislative terms as tuples of (id, organization id, start date, end date).
         """
-        if self.__legislative_terms is None:
-            terms = list(self.__load_organization_events(self.parliament))
-            self.__legislative_terms = terms
-        return self.__legislative_terms
+        return self.__legislative_term_index.items
 
     @property
     def executive_terms(self) -> List[Tuple[str, str, date, date]]:
@@ -80,10 +78,7 @@ class OrganizationsListReader(XmlDataReader):
         terms: list of (str, str, date, date) tuples
             The executive terms as tuples of (id, organization id, start date, end date).
         """
-        if self.__executive_terms is None:
-            terms = list(self.__load_organization_events(self.government))
-            self.__executive_terms = terms
-        return self.__executive_terms
+        return self.__executive_term_index.items
 
     def get_legislative_term(self, session_date: date) -> Event:
         """Get the legislative term for the specified session date.
@@ -98,7 +93,8 @@ class OrganizationsListReader(XmlDataReader):
         event: Event
             The event for the specified date if found; otherwise an Event with all properties set to None.
         """
-        return self.__find_event_for_date(self.legislative_terms, session_date)
+        return self.__find_event_for_date(self.__legislative_term_index,
+                                          session_date)
 
     def get_executive_term(self, session_date: date) -> Event:
         """Get the executive term for the specified session date.
@@ -113,16 +109,33 @@ class OrganizationsListReader(XmlDataReader):
         event: Event
             The event for the specified date if found; otherwise an Event with all properties set to None.
         """
-        return self.__find_event_for_date(self.executive_terms, session_date)
+        return self.__find_event_for_date(self.__executive_term_index,
+                                          session_date)
+
+    @property
+    def __legislative_term_index(self) -> DateIntervalIndex:
+        """Get the index of the legislative terms by date."""
+        if self.__legislative_terms is None:
+            self.__legislative_terms = DateIntervalIndex(
+                self.__load_organization_events(self.parliament))
+        return self.__legislative_terms
+
+    @property
+    def __executive_term_index(self) -> DateIntervalIndex:
+        """Get the index of the executive terms by date."""
+        if self.__executive_terms is None:
+            self.__executive_terms = DateIntervalIndex(
+                self.__load_organization_events(self.government))
+        return self.__executive_terms
 
-    def __find_event_for_date(self, events: List[Event],
+    def __find_event_for_date(self, events: DateIntervalIndex,
                               session_date: date) -> Event:
         """Find the event for provided date.
 
         Parameters
         ----------
-        events: list of Event, required
-            The list where to search for the event.
+        events: DateIntervalIndex, required
+            The index where to search for the event.
         session_date: date, required
             The date of the session.
 
@@ -131,11 +144,9 @@ class OrganizationsListReader(XmlDataReader):
         event: Event
             The event for the specified date if found; otherwise an event with None for all properties.
         """
-        for event in events:
-            _, _, start_date, end = event
-            end_date = date.max if end is None else end
-            if start_date <= session_date <= end_date:
-                return event
+        event = events.find(session_date)
+        if event is not None:
+            return event
         logging.error("Could not find event for session date %s.",
                       session_date)
         return Event(None, None, None, None)
@@ -1,8 +1,8 @@
 """Defines a class for reading parliamentary groups from CSV files."""
 from typing import List
 from framework.core.conversion.namedtuples import ParliamentaryGroup
+from framework.utils.fileutils import find_files
 import pandas as pd
-from pathlib import Path
 
 
 class ParliamentaryGroupsReader:
@@ -27,9 +27,8 @@ class ParliamentaryGroupsReader:
         parliamentarty_groups: list of ParliamentaryGroup
             The list of unique parliamentary groups.
         """
-        data_dir = Path(data_directory)
         parla_groups = set()
-        for f in data_dir.glob(f'**/{file_name_pattern}'):
+        for f in find_files(data_directory, file_name_pattern):
             df = pd.read_csv(str(f))
             for row in df.itertuples():
                 grp = ParliamentaryGroup(row.Acronym, row.Name)
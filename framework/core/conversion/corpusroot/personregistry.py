@@ -0,0 +1,518 @@
+"""Class for keeping the persons and their affiliations in a SQLite database."""
+from copy import deepcopy
+from framework.core.conversion.namedtuples import Event, PersonalInformation
+from framework.core.xmlutils import XmlAttributes
+from framework.core.xmlutils import XmlDataReader
+from framework.core.xmlutils import XmlElements
+from framework.core.xmlutils import save_xml_streamed
+from itertools import groupby
+from lxml import etree
+from typing import Callable
+from typing import Iterable
+from typing import List
+import heapq
+import logging
+import sqlite3
+
+REGISTRY_FILE = '.person-registry.sqlite'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    build_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS persons (
+    person_id TEXT PRIMARY KEY,
+    sex TEXT NOT NULL,
+    profile_image TEXT,
+    build_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS name_parts (
+    person_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    element TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (person_id, position)
+);
+CREATE TABLE IF NOT EXISTS affiliations (
+    person_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    org_id TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT,
+    build_id INTEGER NOT NULL,
+    PRIMARY KEY (person_id, event_id)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS session_persons (
+    session_id TEXT NOT NULL,
+    person_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    PRIMARY KEY (session_id, person_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS persons_by_build ON persons (build_id, person_id);
+CREATE INDEX IF NOT EXISTS affiliations_by_build
+    ON affiliations (build_id, person_id, event_id);
+"""
+
+UPSERT_PERSON = """
+INSERT INTO persons (person_id, sex, profile_image, build_id)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (person_id) DO UPDATE SET
+    sex = excluded.sex,
+    profile_image = excluded.profile_image,
+    build_id = excluded.build_id
+"""
+
+UPSERT_AFFILIATION = """
+INSERT INTO affiliations (person_id, event_id, org_id, start_date, end_date, build_id)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (person_id, event_id) DO UPDATE SET
+    org_id = excluded.org_id,
+    start_date = excluded.start_date,
+    end_date = excluded.end_date,
+    build_id = excluded.build_id
+"""
+
+
+class PersonRegistry(XmlDataReader):
+    """Keeps the persons, their names and affiliations in a SQLite database.
+
+    The database persists between runs. Each run is recorded as a new build
+    and the rows updated by the run are marked with its id, so the contents of
+    the `listPerson` element are generated only from the persons and
+    affiliations of the current build. The database also records the persons
+    and affiliations of each session, so the sessions that did not change
+    since an earlier build are added from its rows with `reuse_session()`.
+
+    The `listPerson` element is written in one pass over the sorted rows,
+    one person at a time. The persons already present in the XML file are
+    kept as they are and only get the new affiliations.
+    """
+
+    def __init__(self,
+                 xml_file: str,
+                 registry_file: str,
+                 checkpoint_interval: int = 0):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        xml_file: str, required
+            The path of the XML file containing the `listPerson` element.
+        registry_file: str, required
+            The path of the SQLite database file.
+        checkpoint_interval: int, optional
+            The number of updates after which the changes are saved to the
+            database and to the XML file. When 0 (default), the changes are saved only by `flush()`.
+        """
+        XmlDataReader.__init__(self, xml_file)
+        self.__checkpoint_interval = checkpoint_interval
+        self.__num_pending_updates = 0
+        self.__children = sorted(self.xml_root, key=get_person_sort_key)
+        self.__xml_persons = {
+            person.get(XmlAttributes.xml_id)
+            for person in self.xml_root.iterdescendants(tag=XmlElements.person)
+        }
+        self.__connection = sqlite3.connect(registry_file)
+        self.__connection.executescript(SCHEMA)
+        with self.__connection:
+            cursor = self.__connection.execute(
+                "INSERT INTO builds (started_at) VALUES (datetime('now'))")
+        self.__build_id = cursor.lastrowid
+        self.__persons = set()
+        self.__affiliations = set()
+        self.__session_id = None
+        self.__pending_persons = []
+        self.__pending_affiliations = []
+        self.__pending_sessions = []
+        self.__pending_session_persons = []
+
+    def begin_session(self, session_id: str):
+        """Record the persons added from now on as the persons of the session.
+
+        The persons recorded for the session by earlier builds are replaced.
+
+        Parameters
+        ----------
+        session_id: str, required
+            The id of the session.
+        """
+        self.__session_id = session_id
+        self.__pending_sessions.append((session_id, ))
+
+    def reuse_session(self, session_id: str) -> bool:
+        """Add the persons and affiliations recorded for the session by an earlier build.
+
+        Parameters
+        ----------
+        session_id: str, required
+            The id of the session.
+
+        Returns
+        -------
+        reused: bool
+            True if the persons of the session were added; False if the
+            session is not recorded in the database and has to be added with
+            `begin_session()` and `add_or_update_person()`.
+        """
+        cursor = self.__connection.execute(
+            "SELECT 1 FROM sessions WHERE session_id = ?", (session_id, ))
+        if cursor.fetchone() is None:
+            return False
+        rows = self.__connection.execute(
+            """SELECT person_id, event_id FROM session_persons
+            WHERE session_id = ?""", (session_id, )).fetchall()
+        persons = {
+            person_id
+            for person_id, _ in rows if person_id not in self.__persons
+        }
+        affiliations = {
+            row
+            for row in rows if row[1] != '' and row not in self.__affiliations
+        }
+        registry_persons = persons - self.__xml_persons
+        with self.__connection:
+            num_persons = self.__connection.executemany(
+                "UPDATE persons SET build_id = ? WHERE person_id = ?",
+                [(self.__build_id, person_id)
+                 for person_id in registry_persons]).rowcount
+            num_affiliations = self.__connection.executemany(
+                """UPDATE affiliations SET build_id = ?
+                WHERE person_id = ? AND event_id = ?""",
+                [(self.__build_id, person_id, event_id)
+                 for person_id, event_id in affiliations]).rowcount
+        if num_persons != len(registry_persons) or num_affiliations != len(
+                affiliations):
+            logging.warning("Could not find the persons of session %s.",
+                            session_id)
+            return False
+        self.__persons.update(persons)
+        self.__affiliations.update(affiliations)
+        self.__count_update()
+        return True
+
+    def add_or_update_person(self,
+                             person_id: str,
+                             personal_info: PersonalInformation,
+                             legislative_term: Event,
+                             executive_term: Event = None):
+        """Add or update person.
+
+        Parameters
+        ----------
+        person_id: str, required
+            The id of the person to add or update.
+        personal_info: PersonalInformation, required
+            The personal information.
+        legislative_term: Event, required
+            The legislative term in which the person appears.
+        executive_term: Event, optional
+            The executive term of the person. Default is None.
+        """
+        person_id = person_id.replace('#', '')
+        if person_id not in self.__persons:
+            self.__persons.add(person_id)
+            if person_id not in self.__xml_persons:
+                self.__pending_persons.append((person_id, personal_info))
+        self.__record_session_person(person_id, '')
+        self.__update_affiliation(person_id, legislative_term)
+        if executive_term is not None:
+            self.__update_affiliation(person_id, executive_term)
+        self.__count_update()
+
+    def flush(self):
+        """Save the pending changes to the database and generate the XML file."""
+        if self.__num_pending_updates == 0 and len(
+                self.__pending_sessions) == 0:
+            return
+        with self.__connection:
+            self.__save_persons()
+            self.__connection.executemany(UPSERT_AFFILIATION,
+                                          self.__pending_affiliations)
+            self.__save_sessions()
+        self.__pending_persons = []
+        self.__pending_affiliations = []
+        self.__pending_sessions = []
+        self.__pending_session_persons = []
+        save_xml_streamed(self.xml_root, self.__iter_person_list(),
+                          self.xml_file)
+        self.__num_pending_updates = 0
+
+    def close(self):
+        """Save the pending changes and close the database."""
+        self.flush()
+        self.__connection.close()
+
+    def __count_update(self):
+        """Count an update and save the changes when the checkpoint is reached."""
+        self.__num_pending_updates += 1
+        if self.__num_pending_updates == self.__checkpoint_interval:
+            self.flush()
+
+    def __record_session_person(self, person_id: str, event_id: str):
+        """Record the person and the affiliation as part of the current session.
+
+        Parameters
+        ----------
+        person_id: str, required
+            The id of the person.
+        event_id: str, required
+            The id of the event of the affiliation, or an empty string for the person itself.
+        """
+        if self.__session_id is not None:
+            self.__pending_session_persons.append(
+                (self.__session_id, person_id, event_id))
+
+    def __update_affiliation(self, person_id: str, event: Event):
+        """Add the affiliation of the person to the event if it doesn't exist.
+
+        Parameters
+        ----------
+        person_id: str, required
+            The id of the person.
+        event: Event, required
+            The event from which to extract affiliation info.
+        """
+        organization_id, term_id, start_date, end_date = event
+        if term_id is None:
+            logging.error("No value for term id in event %s.", event)
+            return
+        self.__record_session_person(person_id, term_id)
+        if (person_id, term_id) in self.__affiliations:
+            return
+        self.__affiliations.add((person_id, term_id))
+        end_date = end_date.strftime(
+            "%Y-%m-%d") if end_date is not None else None
+        self.__pending_affiliations.append(
+            (person_id, term_id, organization_id,
+             start_date.strftime("%Y-%m-%d"), end_date, self.__build_id))
+
+    def __save_persons(self):
+        """Save the pending persons and their name parts to the database."""
+        persons, name_parts = [], []
+        for person_id, personal_info in self.__pending_persons:
+            sex = personal_info.sex if personal_info.sex is not None else 'U'
+            persons.append(
+                (person_id, sex, personal_info.profile_image, self.__build_id))
+            parts = [(XmlElements.forename, part)
+                     for part in personal_info.first_name]
+            parts.extend((XmlElements.surname, capitalize_name(part))
+                         for part in personal_info.last_name)
+            name_parts.extend(
+                (person_id, position, element, value)
+                for position, (element, value) in enumerate(parts))
+        self.__connection.executemany(UPSERT_PERSON, persons)
+        self.__connection.executemany(
+            "DELETE FROM name_parts WHERE person_id = ?",
+            [(person_id, ) for person_id, _ in self.__pending_persons])
+        self.__connection.executemany(
+            "INSERT INTO name_parts VALUES (?, ?, ?, ?)", name_parts)
+
+    def __save_sessions(self):
+        """Replace the persons recorded for the pending sessions."""
+        self.__connection.executemany(
+            "DELETE FROM session_persons WHERE session_id = ?",
+            self.__pending_sessions)
+        self.__connection.executemany(
+            "INSERT OR IGNORE INTO sessions (session_id) VALUES (?)",
+            self.__pending_sessions)
+        self.__connection.executemany(
+            "INSERT OR IGNORE INTO session_persons VALUES (?, ?, ?)",
+            self.__pending_session_persons)
+
+    def __iter_person_list(self) -> Iterable[etree.Element]:
+        """Create the children of the person list for the current build, sorted by id.
+
+        Returns
+        -------
+        children: iterable of etree.Element
+            The children of the XML file, with their new affiliations,
+            merged with the persons of the current build.
+        """
+        get_affiliations = create_group_lookup(
+            self.__connection.execute(
+                """SELECT person_id, event_id, org_id, start_date, end_date
+                FROM affiliations WHERE build_id = ?
+                ORDER BY person_id, event_id""", (self.__build_id, )))
+        children = heapq.merge((deepcopy(child) for child in self.__children),
+                               self.__iter_registry_persons(),
+                               key=get_person_sort_key)
+        for child in children:
+            person_id = child.get(XmlAttributes.xml_id)
+            if child.tag == XmlElements.person and person_id is not None:
+                add_affiliations(child, get_affiliations(person_id))
+            yield child
+
+    def __iter_registry_persons(self) -> Iterable[etree.Element]:
+        """Create the elements of the persons of the current build, sorted by id.
+
+        Returns
+        -------
+        persons: iterable of etree.Element
+            The person elements, without affiliations.
+        """
+        get_name_parts = create_group_lookup(
+            self.__connection.execute(
+                """SELECT n.person_id, n.element, n.value
+                FROM name_parts n JOIN persons p ON p.person_id = n.person_id
+                WHERE p.build_id = ? ORDER BY n.person_id, n.position""",
+                (self.__build_id, )))
+        cursor = self.__connection.execute(
+            """SELECT person_id, sex, profile_image FROM persons
+            WHERE build_id = ? ORDER BY person_id""", (self.__build_id, ))
+        for person_id, sex, profile_image in cursor:
+            yield create_person(person_id, get_name_parts(person_id), sex,
+                                profile_image)
+
+
+def get_person_sort_key(element: etree.Element) -> str:
+    """Get the key by which the children of the person list are sorted.
+
+    Parameters
+    ----------
+    element: etree.Element, required
+        The child of the person list.
+
+    Returns
+    -------
+    sort_key: str
+        The id of the person, or an empty string for other elements.
+    """
+    if element.tag != XmlElements.person:
+        return ''
+
+    person_id = element.get(XmlAttributes.xml_id)
+    return person_id if person_id is not None else ''
+
+
+def get_affiliation_sort_key(element: etree.Element) -> str:
+    """Get the key by which the children of a person are sorted.
+
+    Parameters
+    ----------
+    element: etree.Element, required
+        The child of the person.
+
+    Returns
+    -------
+    sort_key: str
+        The event id of the affiliation, or an empty string for other elements.
+    """
+    if element.tag != XmlElements.affiliation:
+        return ''
+    return element.get(XmlAttributes.ana)
+
+
+def create_group_lookup(rows: Iterable[tuple]) -> Callable[[str], List[tuple]]:
+    """Create a function returning the rows of a person from the rows sorted by person id.
+
+    The rows are read only once, so the persons must be looked up in ascending order of their ids.
+
+    Parameters
+    ----------
+    rows: iterable of tuple, required
+        The rows whose first value is the person id, sorted by person id.
+
+    Returns
+    -------
+    get_rows: callable
+        The function returning the rows of the person with the given id.
+    """
+    groups = groupby(rows, key=lambda row: row[0])
+    current_id, current_group = next(groups, (None, None))
+
+    def get_rows(person_id: str) -> List[tuple]:
+        nonlocal current_id, current_group
+        while current_id is not None and current_id < person_id:
+            current_id, current_group = next(groups, (None, None))
+        if current_id != person_id:
+            return []
+        return list(current_group)
+
+    return get_rows
+
+
+def capitalize_name(name: str) -> str:
+    """Capitalize the given name.
+
+    Parameters
+    ----------
+    name: str, required
+        The name to capitalize.
+
+    Returns
+    -------
+    capitalized_name: str
+        The capitalized name.
+    """
+    parts = name.split(sep='-')
+    return '-'.join([part.capitalize() for part in parts])
+
+
+def create_person(person_id: str, name_parts: List[tuple], sex: str,
+                  profile_image: str) -> etree.Element:
+    """Create a person element with the provided info.
+
+    Parameters
+    ----------
+    person_id: str, required
+        The id of the person element.
+    name_parts: list of tuple, required
+        The rows of the name parts, as (person id, element name, value).
+    sex: str, required
+        The sex of the person.
+    profile_image: str, required
+        The URL of the profile image of the person, or None.
+
+    Returns
+    -------
+    person: etree.Element
+        The person element.
+    """
+    person = etree.Element(XmlElements.person)
+    person.set(XmlAttributes.xml_id, person_id)
+
+    person_name = etree.SubElement(person, XmlElements.persName)
+    for _, element_name, value in name_parts:
+        name_part = etree.SubElement(person_name, element_name)
+        name_part.text = value
+
+    sex_element = etree.SubElement(person, XmlElements.sex)
+    sex_element.set(XmlAttributes.value, sex)
+
+    if profile_image is not None:
+        figure = etree.SubElement(person, XmlElements.figure)
+        graphic = etree.SubElement(figure, XmlElements.graphic)
+        graphic.set(XmlAttributes.url, profile_image)
+
+    return person
+
+
+def add_affiliations(person: etree.Element, affiliations: List[tuple]):
+    """Add the affiliations that the person doesn't have yet.
+
+    Parameters
+    ----------
+    person: etree.Element, required
+        The person element.
+    affiliations: list of tuple, required
+        The rows of the affiliations, as (person id, event id, organization id, start date, end date).
+    """
+    existing_ids = {
+        affiliation.get(XmlAttributes.ana)
+        for affiliation in person.iterdescendants(tag=XmlElements.affiliation)
+    }
+    for _, event_id, organization_id, start_date, end_date in affiliations:
+        if event_id in existing_ids:
+            continue
+        affiliation = etree.SubElement(person, XmlElements.affiliation)
+        affiliation.set(XmlAttributes.ana, event_id)
+        affiliation.set(XmlAttributes.ref, organization_id)
+        affiliation.set(XmlAttributes.role, "member")
+        affiliation.set(XmlAttributes.event_start, start_date)
+        if end_date is not None:
+            affiliation.set(XmlAttributes.event_end, end_date)
+    person[:] = sorted(person, key=get_affiliation_sort_key)
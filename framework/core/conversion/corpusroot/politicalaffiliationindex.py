@@ -0,0 +1,143 @@
+"""Defines an index of the political affiliation of the parliamentary groups."""
+from datetime import date
+from framework.core.conversion.corpusroot.coalitionoppositionrelationreader import CoalitionOppositionRelationReader
+from framework.core.conversion.corpusroot.parliamentarygroupsreader import ParliamentaryGroupsReader
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
+from framework.core.conversion.namedtuples import CoalitionOppositionRelation
+from framework.core.conversion.namedtuples import ParliamentaryGroup
+from functools import lru_cache
+from typing import List
+import logging
+
+
+class PoliticalStatus:
+    """Political status of a parliamentary group."""
+
+    Coalition = 'coalition'
+    Opposition = 'opposition'
+
+
+class PoliticalAffiliationIndex:
+    """Answers date queries on the coalition/opposition relations and looks up parliamentary groups."""
+
+    def __init__(self, relations: List[CoalitionOppositionRelation],
+                 parliamentary_groups: List[ParliamentaryGroup]):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        relations: list of CoalitionOppositionRelation, required
+            The coalition/opposition relations, with the dates in ISO format.
+        parliamentary_groups: list of ParliamentaryGroup, required
+            The parliamentary groups.
+        """
+        self.__relations = DateIntervalIndex(
+            relation._replace(start_date=parse_date(relation.start_date,
+                                                    date.min),
+                              end_date=parse_date(relation.end_date))
+            for relation in relations)
+        self.__groups = {
+            group.Acronym: group
+            for group in parliamentary_groups
+        }
+
+    def get_relation(self, value: date) -> CoalitionOppositionRelation:
+        """Get the coalition/opposition relation on the specified date.
+
+        Parameters
+        ----------
+        value: date, required
+            The date to look up.
+
+        Returns
+        -------
+        relation: CoalitionOppositionRelation
+            The relation in effect on the date if found; otherwise None.
+        """
+        return self.__relations.find(value)
+
+    def get_political_status(self, acronym: str, value: date) -> str:
+        """Get the political status of the parliamentary group on the specified date.
+
+        Parameters
+        ----------
+        acronym: str, required
+            The acronym of the parliamentary group.
+        value: date, required
+            The date to look up.
+
+        Returns
+        -------
+        political_status: str
+            One of the values of `PoliticalStatus` if the group is part of the
+            relation in effect on the date; otherwise None.
+        """
+        relation = self.get_relation(value)
+        if relation is None:
+            return None
+        if acronym in relation.coalition:
+            return PoliticalStatus.Coalition
+        if acronym in relation.opposition:
+            return PoliticalStatus.Opposition
+        return None
+
+    def get_parliamentary_group(self, acronym: str) -> ParliamentaryGroup:
+        """Get the parliamentary group with the specified acronym.
+
+        Parameters
+        ----------
+        acronym: str, required
+            The acronym of the parliamentary group.
+
+        Returns
+        -------
+        parliamentary_group: ParliamentaryGroup
+            The parliamentary group if found; otherwise None.
+        """
+        return self.__groups.get(acronym)
+
+
+def parse_date(value: str, default: date = None) -> date:
+    """Parse the date read from a CSV file.
+
+    Parameters
+    ----------
+    value: str, required
+        The date in ISO format; missing values are read as NaN.
+    default: date, optional
+        The value to return when the date is missing.
+
+    Returns
+    -------
+    date: datetime.date
+        The parsed date, or the default value if the date is missing.
+    """
+    if not isinstance(value, str) or len(value.strip()) == 0:
+        return default
+    return date.fromisoformat(value.strip())
+
+
+@lru_cache(maxsize=None)
+def build_political_affiliation_index(
+        data_directory: str) -> PoliticalAffiliationIndex:
+    """Build the index of political affiliation from the CSV files in the specified directory.
+
+    The index is built once for each directory.
+
+    Parameters
+    ----------
+    data_directory: str, required
+        The path of the directory containing the CSV files with
+        coalition/opposition relations and parliamentary groups.
+
+    Returns
+    -------
+    index: PoliticalAffiliationIndex
+        The index of political affiliation.
+    """
+    relations = CoalitionOppositionRelationReader().read(data_directory)
+    parliamentary_groups = ParliamentaryGroupsReader().read(data_directory)
+    logging.info(
+        "Loaded %s coalition/opposition relations and %s parliamentary groups.",
+        len(relations), len(parliamentary_groups))
+    return PoliticalAffiliationIndex(relations, parliamentary_groups)
@@ -3,10 +3,12 @@ from babel.dates import format_date
 from datetime import datetime
 from framework.core.constants import SAMPLE_TAG
 from framework.core.conversion.corpusroot.organizationslistreader import OrganizationsListReader
-from framework.core.conversion.corpusroot.personlistmanipulator import PersonListManipulator
+from framework.core.conversion.corpusroot.personregistry import PersonRegistry
 from framework.core.conversion.corpusroot.sessionspeakersreader import SessionSpeakersReader
 from framework.core.conversion.namedtuples import PersonalInformation
 from framework.core.conversion.namemapping.speakerinfoprovider import SpeakerInfoProvider
+from framework.core.conversion.sessionstatssidecar import load_session_stats
+from framework.core.xmlstats import CorpusStatsAccumulator
 from framework.core.xmlstats import CorpusStatsWriter
 from framework.core.xmlstats import SessionStatsReader
 from framework.core.xmlutils import Languages
@@ -17,19 +19,28 @@ from framework.core.xmlutils import XmlDataManipulator
 from framework.core.xmlutils import XmlElements
 from lxml import etree
 from pathlib import Path
+from typing import List
 
 
 class RootCorpusFileBuilder(XmlDataManipulator):
-    """Builds the root file of the corpus."""
+    """Builds the root file of the corpus.
+
+    The statistics and the speakers of each component file are read from the
+    record saved when the session was converted, if it exists, instead of
+    parsing the component file. The component files, their statistics and
+    the span of their dates are collected in memory and written to the root file by `finalize()`,
+    or every `checkpoint_interval` files.
+    """
 
     def __init__(self,
                  file_path: str,
                  template_file: str,
                  speaker_info_provider: SpeakerInfoProvider,
-                 person_list_manipulator: PersonListManipulator,
+                 person_registry: PersonRegistry,
                  organizations_list_reader: OrganizationsListReader,
                  is_sample: bool,
-                 append: bool = False):
+                 append: bool = False,
+                 checkpoint_interval: int = 0):
         """Create a new instance of the class.
 
         Parameters
@@ -40,49 +51,93 @@ class RootCorpusFileBuilder(XmlDataManipulator):
             The path of the corpus root template file.
         speaker_info_provider: SpeakerInfoProvider, required
             An instance of SpeakerInfoProvider used for filling speaker info.
-        person_list_manipulator: PersonListManipulator, required
-            An instance of PersonListManipulator used for updating the list of speakers.
+        person_registry: PersonRegistry, required
+            An instance of PersonRegistry used for updating the list of speakers.
         organizations_list_reader: OrganizationsListReader, required
             An instance of OrganizationsListReader used for readin organization data.
         is_sample: bool, required
             A flag indicating whether the root file is part of a sample or full corpus.
         append: bool, optional
             A flag indicating whether to append to existing file or to start from scratch.
+        checkpoint_interval: int, optional
+            The number of added files after which the root file and the list of
+            persons are saved. When 0 (default), they are saved only by `finalize()`.
         """
         root_file = file_path if append else template_file
         XmlDataManipulator.__init__(self, root_file)
         self.__file_path = file_path
         self.__speaker_info_provider = speaker_info_provider
-        self.__person_list = person_list_manipulator
+        self.__person_list = person_registry
         self.__org_list = organizations_list_reader
+        self.__checkpoint_interval = checkpoint_interval
+        self.__component_files = []
+        self.__stats = CorpusStatsAccumulator()
+        self.__session_dates = []
         self.__update_corpus_title(is_sample)
 
-    def add_corpus_file(self, corpus_file: str):
+    def add_corpus_file(self, corpus_file: str, reuse_speakers: bool = False):
         """Add the specified file to the corpus root file.
 
         Parameters
         ----------
         corpus_file: str, required
             The path of the file to add to the corpus.
+        reuse_speakers: bool, optional
+            Whether to add the speakers of the session from the person registry
+            when an earlier build recorded them, instead of looking up their profiles.
+            Should be set only for the sessions that did not change since that build. Default is False.
         """
-        self.__update_statistics(corpus_file)
-        self.__update_speakers_list(corpus_file)
-        self.__add_component_file(corpus_file)
+        provider = load_session_stats(corpus_file)
+        if provider is None:
+            provider = SessionStatsReader(corpus_file)
+            speaker_ids, gov_members = SessionSpeakersReader(
+                corpus_file).get_speaker_ids()
+        else:
+            speaker_ids, gov_members = provider.get_speaker_ids()
+        session_date = provider.get_session_date()
+        if session_date is None:
+            raise ValueError(f"Could not find session date in {corpus_file}.")
+        session_id = Path(corpus_file).name
+        if not reuse_speakers or not self.__person_list.reuse_session(
+                session_id):
+            self.__person_list.begin_session(session_id)
+            self.__update_speakers_list(session_date, speaker_ids, gov_members)
+        self.__stats.add(provider)
+        self.__session_dates.append(session_date)
+        self.__component_files.append(corpus_file)
+        if len(self.__component_files) == self.__checkpoint_interval:
+            self.finalize()
+
+    def finalize(self):
+        """Write the pending changes to the root file and save the list of persons."""
+        self.__person_list.flush()
+        if len(self.__component_files) == 0:
+            return
+        CorpusStatsWriter(self.xml_root, self.__stats).update_statistics()
+        self.__update_corpus_span(min(self.__session_dates))
+        self.__update_corpus_span(max(self.__session_dates))
+        for component_file in self.__component_files:
+            self.__add_component_file(component_file)
         self.__sort_component_files()
         self.save_changes(self.__file_path)
+        self.__component_files = []
+        self.__stats = CorpusStatsAccumulator()
+        self.__session_dates = []
 
-    def __update_speakers_list(self, component_path: str):
+    def __update_speakers_list(self, session_date: datetime.date,
+                               speaker_ids: List[str], gov_members: List[str]):
         """Update the list of speakers with the speakers from the session transcript.
 
         Parameters
         ----------
-        component_path: str, required
-            The path of the corpus component file.
+        session_date: datetime.date, required
+            The date of the session.
+        speaker_ids: list of str, required
+            The unique ids of the speakers of the session.
+        gov_members: list of str, required
+            The unique ids of the speakers who are government members.
         """
-        speaker_reader = SessionSpeakersReader(component_path)
-        speaker_ids, gov_members = speaker_reader.get_speaker_ids()
         for speaker_id in speaker_ids:
-            session_date = speaker_reader.session_date
             term = self.__org_list.get_legislative_term(session_date)
             pi = self.__speaker_info_provider.get_personal_info(speaker_id)
             profile = PersonalInformation(pi.first_name, pi.last_name, pi.sex,
@@ -119,19 +174,6 @@ class RootCorpusFileBuilder(XmlDataManipulator):
         include_element.set("href", Path(component_path).name)
         self.xml_root.append(include_element)
 
-    def __update_statistics(self, component_path: str):
-        """Update the dates and values of `tagUsage` element with the values from the corpus component file.
-
-        Parameters
-        ----------
-        component_path: str, required
-            The path of the corpus component file.
-        """
-        provider = SessionStatsReader(component_path)
-        writer = CorpusStatsWriter(self.xml_root, provider)
-        writer.update_statistics()
-        self.__update_corpus_span(provider.get_session_date())
-
     def __update_corpus_span(self, session_date: datetime.date):
         """Update the date span of the corpus with the given date.
 
@@ -46,29 +46,30 @@ class SessionSpeakersReader(XmlDataManipulator):
         for utterance in self.xml_root.iterdescendants(tag=XmlElements.u):
             speaker_id = utterance.get(XmlAttributes.who)
             ids.add(speaker_id)
-            if self.__is_of_a_government_member(utterance):
+            if is_of_a_government_member(utterance):
                 gov_members.add(speaker_id)
         return list(ids), list(gov_members)
 
-    def __is_of_a_government_member(self, utterance: etree.Element) -> bool:
-        """Check if the utterance is of a government member.
 
-        Parameters
-        ----------
-        utterance: etree.Element, required
-            The utterance to check.
+def is_of_a_government_member(utterance: etree.Element) -> bool:
+    """Check if the utterance is of a government member.
 
-        Returns
-        -------
-        is_goverment_member: bool
-            True if the speaker is a government member; false otherwise.
-        """
-        note = utterance.getprevious()
-        if note is None:
-            return False
-        if note.tag != XmlElements.note:
-            return False
-        if note.text is None:
-            return False
+    Parameters
+    ----------
+    utterance: etree.Element, required
+        The utterance to check.
+
+    Returns
+    -------
+    is_goverment_member: bool
+        True if the speaker is a government member; false otherwise.
+    """
+    note = utterance.getprevious()
+    if note is None:
+        return False
+    if note.tag != XmlElements.note:
+        return False
+    if note.text is None:
+        return False
 
-        return 'ministru' in note.text.lower()
+    return 'ministru' in note.text.lower()
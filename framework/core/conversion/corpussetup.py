@@ -0,0 +1,70 @@
+"""Defines functions for setting up the build of the corpus."""
+from framework.core.conversion.namemapping.namecorrectionsreader import NameCorrectionsReader
+from framework.core.conversion.namemapping.speakerinfoprovider import SpeakerInfoProvider
+from framework.core.conversion.namemapping.speakerinforeader import SpeakerInfoReader
+from pathlib import Path
+from typing import List
+import logging
+
+
+def build_speaker_info_provider(
+        speaker_name_map: str,
+        speaker_profile_info: str,
+        name_match_threshold: float = None,
+        cache_directory: str = None) -> SpeakerInfoProvider:
+    """Build the speaker info provider.
+
+    Parameters
+    ----------
+    speaker_name_map: str, required
+        The path of the CSV file that maps written names to actual names of the speakers.
+    speaker_profile_info: str, required
+        The path of the CSV file containing profile info of the speakers.
+    name_match_threshold: float, optional
+        The minimum similarity of a known name that replaces a name missing from the name map.
+    cache_directory: str, optional
+        The directory where to cache the data read from the CSV files.
+
+    Returns
+    -------
+    speaker_info_provider: SpeakerInfoProvider
+        The speaker info provider.
+    """
+    name_corrections_reader = NameCorrectionsReader(cache_directory)
+    profile_info_reader = SpeakerInfoReader(cache_directory)
+
+    name_corrections = name_corrections_reader.read(speaker_name_map)
+    speaker_info = profile_info_reader.read(speaker_profile_info)
+    return SpeakerInfoProvider(name_corrections,
+                               speaker_info,
+                               name_match_threshold,
+                               prewarm_name_cache=True)
+
+
+def prepare_corpus_directory(corpus_directory: str,
+                             included_files: List[Path]) -> Path:
+    """Create the corpus directory and copy the included files.
+
+    Parameters
+    ----------
+    corpus_directory: str, required
+        The path of the corpus directory.
+    included_files: list of Path, required
+        The paths of the included files to copy to corpus directory.
+
+    Returns
+    -------
+    corpus_dir: Path
+        The path representing the corpus directory.
+    """
+    logging.info("Preparing corpus directory %s.", corpus_directory)
+    corpus_dir = Path(corpus_directory)
+    corpus_dir.mkdir(exist_ok=True, parents=True)
+
+    for included_file in included_files:
+        logging.info("Copying included file %s to %s.", included_file,
+                     corpus_directory)
+        contents = included_file.read_text()
+        dest_file = corpus_dir / included_file.name
+        dest_file.write_text(contents)
+    return corpus_dir
@@ -0,0 +1,102 @@
+"""Defines an index of the items valid between two dates."""
+from bisect import bisect_right
+from datetime import date
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+
+
+class DateIntervalIndex:
+    """Finds the item whose interval of dates contains a given date.
+
+    The items are named tuples with the fields `start_date` and `end_date`;
+    an `end_date` of None means that the interval is still open.
+    When several intervals contain a date, the item that comes first in
+    the original order is returned, as when scanning the items one by one.
+    """
+
+    def __init__(self, items: Iterable[NamedTuple]):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        items: iterable of named tuples, required
+            The items to index.
+        """
+        self.__items = list(items)
+        order = sorted(range(len(self.__items)),
+                       key=lambda i: self.__items[i].start_date)
+        self.__order = order
+        self.__start_dates = [self.__items[i].start_date for i in order]
+        self.__end_dates = [
+            self.__get_end_date(self.__items[i]) for i in order
+        ]
+        self.__max_end_dates = []
+        max_end_date = date.min
+        for end_date in self.__end_dates:
+            max_end_date = max(max_end_date, end_date)
+            self.__max_end_dates.append(max_end_date)
+        self.__cache = {}
+
+    @property
+    def items(self) -> List[NamedTuple]:
+        """Get the indexed items in their original order."""
+        return self.__items
+
+    def __len__(self) -> int:
+        """Get the number of indexed items."""
+        return len(self.__items)
+
+    def find(self, value: date) -> NamedTuple:
+        """Find the item whose interval contains the provided date.
+
+        Parameters
+        ----------
+        value: date, required
+            The date to look up.
+
+        Returns
+        -------
+        item: named tuple
+            The item whose interval contains the date if found; otherwise None.
+        """
+        if value not in self.__cache:
+            self.__cache[value] = self.__find(value)
+        return self.__cache[value]
+
+    def __find(self, value: date) -> NamedTuple:
+        """Search the item whose interval contains the provided date.
+
+        Parameters
+        ----------
+        value: date, required
+            The date to look up.
+
+        Returns
+        -------
+        item: named tuple
+            The item whose interval contains the date if found; otherwise None.
+        """
+        position = bisect_right(self.__start_dates, value) - 1
+        best = None
+        while position >= 0 and self.__max_end_dates[position] >= value:
+            if self.__end_dates[position] >= value:
+                index = self.__order[position]
+                best = index if best is None else min(best, index)
+            position = position - 1
+        return None if best is None else self.__items[best]
+
+    def __get_end_date(self, item: NamedTuple) -> date:
+        """Get the end date of the item's interval.
+
+        Parameters
+        ----------
+        item: named tuple, required
+            The item.
+
+        Returns
+        -------
+        end_date: date
+            The end date of the interval, or `date.max` if the interval is open.
+        """
+        return date.max if item.end_date is None else item.end_date
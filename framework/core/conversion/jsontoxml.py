@@ -1,9 +1,10 @@
 """Module responsible for conversion from JSON to  XML."""
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
 from framework.core.conversion.jsonutils import SessionTranscript
-from framework.core.conversion.namedtuples import LegislativeTerm
 from framework.core.conversion.namemapping.speakerinfoprovider import SpeakerInfoProvider
 from framework.core.conversion.sessions.meetingelementcontentsbuilder import MeetingElementContentsBuilder
 from framework.core.conversion.sessions.sessionbodybuilder import SessionBodyBuilder
+from framework.core.conversion.sessions.sessionbodywriter import SessionBodyWriter
 from framework.core.conversion.sessions.sessionchairmenbuilder import SessionChairmenBuilder
 from framework.core.conversion.sessions.sessiondatebuilder import SessionDateBuilder
 from framework.core.conversion.sessions.sessionheadingbuilder import SessionHeadingBuilder
@@ -12,22 +13,36 @@ from framework.core.conversion.sessions.sessionidnobuilder import SessionIdNoBui
 from framework.core.conversion.sessions.sessionstartendtimebuilder import SessionStartEndTimeBuilder
 from framework.core.conversion.sessions.sessionsummarybuilder import SessionSummaryBuilder
 from framework.core.conversion.sessions.sessiontitlebuilder import SessionTitleBuilder
-from framework.core.xmlstats import SessionStatsCalculator
+from framework.core.conversion.sessionstatsaccumulator import SessionStatsAccumulator
+from framework.core.conversion.sessionstatssidecar import SessionStatsSidecar
+from framework.core.conversion.wordcounter import WordCounter
+from framework.core.conversion.writebehindqueue import WriteBehindQueue
+from framework.core.xmlstats import SessionStatsReader
 from framework.core.xmlstats import SessionStatsWriter
+from framework.core.xmlutils import XmlDataReader
 from framework.core.xmlutils import XmlElements
-from typing import List
+from framework.core.xmlutils import save_xml
+from lxml import etree
 import logging
-import spacy
 
-nlp_pipeline = spacy.load('ro_core_news_lg')
+# The tokenizer is loaded on first use.
+default_word_counter = WordCounter()
 
 
 class SessionTranscriptConverter:
     """Convert session transcript from JSON to XML."""
 
-    def __init__(self, input_file: str, session_template: str,
+    def __init__(self,
+                 input_file: str,
+                 session_template: str,
                  speaker_info_provider: SpeakerInfoProvider,
-                 legislative_terms: List[LegislativeTerm], output_file: str):
+                 legislative_terms: DateIntervalIndex,
+                 output_file: str,
+                 in_memory: bool = True,
+                 word_counter: WordCounter = None,
+                 stream_body: bool = False,
+                 session_transcript: SessionTranscript = None,
+                 xml_writer: WriteBehindQueue = None):
         """Create a new instance of the class.
 
         Parameters
@@ -38,16 +53,41 @@ class SessionTranscriptConverter:
             The path of the XML file containing session template.
         speaker_info_provider: SpeakerInfoProvider, required
             The instance of SpeakerInfoProvider used to get speaker data.
-        legislative_terms: list of LegislativeTerm, required
-            The list of legislative terms.
+        legislative_terms: DateIntervalIndex, required
+            The index of legislative terms by date.
         output_file: str, required
             The path of the output file.
+        in_memory: bool, optional
+            When True (default), all builders work on a single XML tree which
+            is saved to the output file only once, at the end of the conversion;
+            otherwise each builder loads the output file and saves its changes.
+        word_counter: WordCounter, optional
+            The word counter used for session statistics.
+            If `None` then a shared counter using the tokenizer of the model is used.
+        stream_body: bool, optional
+            When True, the utterances are written to the output file as soon as
+            they are built so the session body is never kept in memory as a whole.
+            Requires `in_memory` to be True.
+        session_transcript: SessionTranscript, optional
+            The transcript loaded from the input file. If `None` then the
+            transcript is loaded when converting the session.
+        xml_writer: WriteBehindQueue, optional
+            The queue used for saving the XML tree of the session in the background.
+            If `None` then the tree is saved before the conversion returns.
         """
+        if stream_body and not in_memory:
+            raise ValueError(
+                "Streaming the session body requires in-memory conversion.")
         self.__input_file = input_file
         self.__session_template = session_template
         self.__speaker_info_provider = speaker_info_provider
         self.__legislative_terms = legislative_terms
         self.__output_file = output_file
+        self.__in_memory = in_memory
+        self.__word_counter = word_counter if word_counter is not None else default_word_counter
+        self.__stream_body = stream_body
+        self.__session_transcript = session_transcript
+        self.__xml_writer = xml_writer
 
     def covert(self, is_sample: bool = False):
         """Convert session transcript to XML format.
@@ -59,30 +99,90 @@ class SessionTranscriptConverter:
         """
         logging.info("Converting from {} to {}.".format(
             self.__input_file, self.__output_file))
-        session_transcript = SessionTranscript(self.__input_file)
-        self.__build_session_id(session_transcript)
-        self.__build_session_title(session_transcript, is_sample)
-        self.__build_meeting_contents(session_transcript)
-        self.__build_idno_contents(session_transcript)
-        self.__build_date_contents(session_transcript)
-        self.__build_session_summary(session_transcript)
-        self.__build_session_heading(session_transcript)
-        self.__build_session_start_time(session_transcript)
-        self.__build_session_chairmen(session_transcript)
-        self.__build_session_body(session_transcript)
-        self.__build_session_end_time(session_transcript)
-        self.__update_session_stats(self.__output_file)
-
-    def __update_session_stats(self, output_file: str):
+        session_transcript = self.__session_transcript
+        if session_transcript is None:
+            session_transcript = SessionTranscript(self.__input_file)
+        body_writer = SessionBodyWriter() if self.__stream_body else None
+        xml_tree = self.__build_session_id(session_transcript)
+        self.__build_session_title(session_transcript, xml_tree, is_sample)
+        self.__build_meeting_contents(session_transcript, xml_tree)
+        self.__build_idno_contents(session_transcript, xml_tree)
+        self.__build_date_contents(session_transcript, xml_tree)
+        session_stats = self.__create_session_stats(xml_tree)
+        self.__build_session_summary(session_transcript, xml_tree,
+                                     session_stats)
+        self.__build_session_heading(session_transcript, xml_tree,
+                                     session_stats)
+        self.__build_session_start_time(session_transcript, xml_tree,
+                                        session_stats)
+        self.__build_session_chairmen(session_transcript, xml_tree,
+                                      session_stats)
+        self.__build_session_body(session_transcript, xml_tree, body_writer,
+                                  session_stats)
+        self.__build_session_end_time(session_transcript, xml_tree,
+                                      session_stats)
+        self.__update_session_stats(xml_tree, session_stats)
+        self.__save_session_stats(xml_tree, session_stats)
+        if body_writer is not None:
+            body_writer.save(xml_tree, self.__output_file)
+        elif xml_tree is None:
+            return
+        elif self.__xml_writer is not None:
+            self.__xml_writer.save(xml_tree, self.__output_file)
+        else:
+            save_xml(xml_tree, self.__output_file)
+
+    def __create_session_stats(
+            self, xml_tree: etree._ElementTree) -> SessionStatsAccumulator:
+        """Create the statistics of the session from the elements built so far.
+
+        Parameters
+        ----------
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+
+        Returns
+        -------
+        session_stats: SessionStatsAccumulator
+            The statistics of the session.
+        """
+        reader = XmlDataReader(self.__output_file, xml_tree)
+        session_stats = SessionStatsAccumulator(self.__word_counter)
+        session_stats.add_document(reader.xml_root)
+        return session_stats
+
+    def __save_session_stats(self, xml_tree: etree._ElementTree,
+                             session_stats: SessionStatsAccumulator):
+        """Save the statistics of the session used by the corpus root file.
+
+        Parameters
+        ----------
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics accumulated while building the session.
+        """
+        reader = SessionStatsReader(self.__output_file, xml_tree)
+        speaker_ids, gov_members = session_stats.get_speaker_ids()
+        sidecar = SessionStatsSidecar(reader.get_session_date(),
+                                      reader.get_num_words(),
+                                      reader.get_num_speeches(),
+                                      reader.get_tag_counts(), speaker_ids,
+                                      gov_members)
+        sidecar.save(self.__output_file)
+
+    def __update_session_stats(self, xml_tree: etree._ElementTree,
+                               session_stats: SessionStatsAccumulator):
         """Update the nodes containing session statistics.
 
         Parameters
         ----------
-        output_file: str, required
-            The path of the output XML file.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics accumulated while building the session.
         """
-        stats_provider = SessionStatsCalculator(output_file,
-                                                nlp_pipeline.tokenizer)
+        output_file = self.__output_file
         name_map = {
             "body": XmlElements.body,
             "desc": XmlElements.desc,
@@ -95,139 +195,205 @@ class SessionTranscriptConverter:
             "text": XmlElements.text,
             "u": XmlElements.u,
         }
-        aggregator = SessionStatsWriter(output_file, stats_provider, name_map)
+        aggregator = SessionStatsWriter(output_file, session_stats, name_map,
+                                        xml_tree)
         aggregator.update_statistics()
 
-    def __build_session_body(self, session_transcript: SessionTranscript):
+    def __build_session_body(self, session_transcript: SessionTranscript,
+                             xml_tree: etree._ElementTree,
+                             body_writer: SessionBodyWriter,
+                             session_stats: SessionStatsAccumulator):
         """Build the session body.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        body_writer: SessionBodyWriter, required
+            The writer of the session body; `None` when the body is not streamed.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
         builder = SessionBodyBuilder(session_transcript,
                                      self.__speaker_info_provider,
-                                     self.__output_file)
+                                     self.__output_file, xml_tree, body_writer,
+                                     session_stats)
         builder.build_session_body()
 
-    def __build_session_chairmen(self, session_transcript: SessionTranscript):
+    def __build_session_chairmen(self, session_transcript: SessionTranscript,
+                                 xml_tree: etree._ElementTree,
+                                 session_stats: SessionStatsAccumulator):
         """Build the node containing the information about the session chairmen.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
         builder = SessionChairmenBuilder(session_transcript,
-                                         self.__output_file)
+                                         self.__output_file, xml_tree,
+                                         session_stats)
         builder.build_session_chairmen()
 
-    def __build_session_end_time(self, session_transcript: SessionTranscript):
+    def __build_session_end_time(self, session_transcript: SessionTranscript,
+                                 xml_tree: etree._ElementTree,
+                                 session_stats: SessionStatsAccumulator):
         """Build the node containing the end time of the session.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
         builder = SessionStartEndTimeBuilder(session_transcript,
-                                             self.__output_file)
+                                             self.__output_file, xml_tree,
+                                             session_stats)
         builder.build_session_end_time()
 
-    def __build_session_start_time(self,
-                                   session_transcript: SessionTranscript):
+    def __build_session_start_time(self, session_transcript: SessionTranscript,
+                                   xml_tree: etree._ElementTree,
+                                   session_stats: SessionStatsAccumulator):
         """Build the node containing end time of the session.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
         builder = SessionStartEndTimeBuilder(session_transcript,
-                                             self.__output_file)
+                                             self.__output_file, xml_tree,
+                                             session_stats)
         builder.build_session_start_time()
 
-    def __build_session_heading(self, session_transcript: SessionTranscript):
+    def __build_session_heading(self, session_transcript: SessionTranscript,
+                                xml_tree: etree._ElementTree,
+                                session_stats: SessionStatsAccumulator):
         """Build the session heading.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
-        builder = SessionHeadingBuilder(session_transcript, self.__output_file)
+        builder = SessionHeadingBuilder(session_transcript, self.__output_file,
+                                        xml_tree, session_stats)
         builder.build_session_heading()
 
-    def __build_session_summary(self, session_transcript: SessionTranscript):
+    def __build_session_summary(self, session_transcript: SessionTranscript,
+                                xml_tree: etree._ElementTree,
+                                session_stats: SessionStatsAccumulator):
         """Build the session summary.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
+        session_stats: SessionStatsAccumulator, required
+            The statistics of the session.
         """
-        builder = SessionSummaryBuilder(session_transcript, self.__output_file)
+        builder = SessionSummaryBuilder(session_transcript, self.__output_file,
+                                        xml_tree, session_stats)
         builder.build_summary()
 
-    def __build_date_contents(self, session_transcript: SessionTranscript):
+    def __build_date_contents(self, session_transcript: SessionTranscript,
+                              xml_tree: etree._ElementTree):
         """Build contents of date elements.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
         """
-        builder = SessionDateBuilder(session_transcript, self.__output_file)
+        builder = SessionDateBuilder(session_transcript, self.__output_file,
+                                     xml_tree)
         builder.build_date_contents()
 
-    def __build_idno_contents(self, session_transcript: SessionTranscript):
+    def __build_idno_contents(self, session_transcript: SessionTranscript,
+                              xml_tree: etree._ElementTree):
         """Build idno element.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
         """
-        builder = SessionIdNoBuilder(session_transcript, self.__output_file)
+        builder = SessionIdNoBuilder(session_transcript, self.__output_file,
+                                     xml_tree)
         builder.build_session_idno()
 
-    def __build_meeting_contents(self, session_transcript: SessionTranscript):
+    def __build_meeting_contents(self, session_transcript: SessionTranscript,
+                                 xml_tree: etree._ElementTree):
         """Build meeting element.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
         """
         builder = MeetingElementContentsBuilder(session_transcript,
                                                 self.__legislative_terms,
-                                                self.__output_file)
+                                                self.__output_file, xml_tree)
         builder.build_meeting_info()
 
     def __build_session_title(self, session_transcript: SessionTranscript,
-                              is_sample: bool):
+                              xml_tree: etree._ElementTree, is_sample: bool):
         """Build session title.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session; if `None` the output file is used.
         is_sample: bool, required
             Determines whether to build the title of a sample session or not.
         """
-        builder = SessionTitleBuilder(session_transcript, self.__output_file)
+        builder = SessionTitleBuilder(session_transcript, self.__output_file,
+                                      xml_tree)
         builder.build_session_title(add_sample_tag=is_sample)
 
-    def __build_session_id(self, session_transcript: SessionTranscript):
+    def __build_session_id(
+            self, session_transcript: SessionTranscript) -> etree._ElementTree:
         """Build session id.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
+
+        Returns
+        -------
+        xml_tree: etree.ElementTree
+            The XML tree of the session when converting in memory; otherwise `None`.
         """
+        output_file = None if self.__in_memory else self.__output_file
         session_id_builder = SessionIdBuilder(self.__session_template,
-                                              session_transcript,
-                                              self.__output_file)
+                                              session_transcript, output_file)
         session_id_builder.build_session_id()
+        return session_id_builder.xml_tree if self.__in_memory else None
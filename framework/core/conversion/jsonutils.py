@@ -1,11 +1,19 @@
 """Utility components for JSON files."""
+from babel.dates import format_date
 import json
 import datetime
 from typing import List
 
 
 class SessionTranscript:
-    """Ecapsulates session transcription JSON."""
+    """Ecapsulates session transcription JSON.
+
+    The transcript is decoded once and the values derived from it are cached,
+    so the same instance can be shared by all the builders of a session.
+    """
+
+    __slots__ = ('__json', '__session_date', '__formatted_dates', '__summary',
+                 '__body')
 
     def __init__(self, input_file):
         """Create a new instance of the class.
@@ -16,6 +24,10 @@ class SessionTranscript:
             The path of the JSON file containing session transcript.
         """
         self.__json = load_json(input_file)
+        self.__session_date = None
+        self.__formatted_dates = {}
+        self.__summary = None
+        self.__body = None
 
     @property
     def session_id(self):
@@ -30,16 +42,35 @@ class SessionTranscript:
     @property
     def session_date(self):
         """Get the session date."""
-        session_start = self.__json['start'] if 'start' in self.__json else None
-        if session_start is None:
-            raise ValueError(
-                "Start section of session transcription not found.")
-        start_time = session_start['start_time']
-        if start_time is None:
-            raise ValueError("Start time of session not found.")
+        if self.__session_date is None:
+            self.__session_date = self.__parse_session_date()
+        return self.__session_date
 
-        start_time = datetime.datetime.fromisoformat(start_time)
-        return start_time.date()
+    def format_session_date(self, pattern: str, locale: str = None) -> str:
+        """Format the session date using the provided pattern.
+
+        Parameters
+        ----------
+        pattern: str, required
+            The date pattern as expected by `babel.dates.format_date`.
+        locale: str, optional
+            The locale used for formatting. If `None` the default locale is used.
+
+        Returns
+        -------
+        formatted_date: str
+            The formatted session date.
+        """
+        key = (pattern, locale)
+        if key not in self.__formatted_dates:
+            if locale is None:
+                formatted_date = format_date(self.session_date, pattern)
+            else:
+                formatted_date = format_date(self.session_date,
+                                             pattern,
+                                             locale=locale)
+            self.__formatted_dates[key] = formatted_date
+        return self.__formatted_dates[key]
 
     @property
     def transcript_url(self):
@@ -47,9 +78,13 @@ class SessionTranscript:
         return self.__json['full_transcript_url']
 
     @property
-    def summary(self):
+    def summary(self) -> List['SummarySegment']:
         """Get the summary section from session transcript."""
-        return [SummarySegment(segment) for segment in self.__json['summary']]
+        if self.__summary is None:
+            self.__summary = [
+                SummarySegment(segment) for segment in self.__json['summary']
+            ]
+        return self.__summary
 
     @property
     def start_mark(self) -> str:
@@ -76,9 +111,32 @@ class SessionTranscript:
         return start['chairmen']
 
     @property
-    def body(self):
+    def body(self) -> List['BodySegment']:
         """Get the session body from the transcript."""
-        return [BodySegment(segment) for segment in self.__json['sections']]
+        if self.__body is None:
+            self.__body = [
+                BodySegment(segment) for segment in self.__json['sections']
+            ]
+        return self.__body
+
+    def __parse_session_date(self) -> datetime.date:
+        """Parse the session date from the start time of the session.
+
+        Returns
+        -------
+        session_date: datetime.date
+            The date of the session.
+        """
+        session_start = self.__json['start'] if 'start' in self.__json else None
+        if session_start is None:
+            raise ValueError(
+                "Start section of session transcription not found.")
+        start_time = session_start['start_time']
+        if start_time is None:
+            raise ValueError("Start time of session not found.")
+
+        start_time = datetime.datetime.fromisoformat(start_time)
+        return start_time.date()
 
 
 def load_json(file_name: str) -> dict:
@@ -101,6 +159,8 @@ def load_json(file_name: str) -> dict:
 class SummaryContentLine:
     """Encapsulates a content line of a summary segment."""
 
+    __slots__ = ('__line', )
+
     def __init__(self, content_line: dict):
         """Create a new  instance of the class.
 
@@ -137,9 +197,14 @@ class SummaryContentLine:
 class SummarySegment:
     """Encapsulates a segment of session summary."""
 
+    __slots__ = ('__segment', '__contents')
+
     def __init__(self, summary_segment: dict):
         """Create a new instance of the class."""
         self.__segment = summary_segment
+        self.__contents = [
+            SummaryContentLine(c) for c in summary_segment['contents']
+        ]
 
     @property
     def number(self) -> int:
@@ -161,12 +226,14 @@ class SummarySegment:
         contents: iterable of SummarySegmentContents
             The contents of the session summary segment.
         """
-        return [SummaryContentLine(c) for c in self.__segment['contents']]
+        return self.__contents
 
 
 class Speaker:
     """Encapsulates speaker information."""
 
+    __slots__ = ('__speaker', '__is_empty')
+
     def __init__(self, speaker: dict):
         """Create a new instance of the class."""
         self.__speaker = speaker if speaker is not None else {
@@ -197,6 +264,8 @@ class Speaker:
 class SessionContentLine:
     """Encapsulates a content line from the session transcript."""
 
+    __slots__ = ('__content', )
+
     def __init__(self, content_line):
         """Create a new instance of the class."""
         self.__content = content_line if content_line is not None else {
@@ -224,21 +293,25 @@ class SessionContentLine:
 class BodySegment:
     """Encapsulates a segment of the session body."""
 
+    __slots__ = ('__segment', '__speaker', '__contents')
+
     def __init__(self, segment):
         """Create a new instance of the class."""
         self.__segment = segment
+        self.__speaker = Speaker(segment['speaker'])
+        self.__contents = [
+            SessionContentLine(line) for line in segment['contents']
+        ]
 
     @property
     def speaker(self) -> Speaker:
         """Get the speaker of the segment."""
-        return Speaker(self.__segment['speaker'])
+        return self.__speaker
 
     @property
     def contents(self) -> List[SessionContentLine]:
         """Get the contents of the segment."""
-        return [
-            SessionContentLine(line) for line in self.__segment['contents']
-        ]
+        return self.__contents
 
     @property
     def is_empty(self) -> bool:
@@ -8,6 +8,12 @@ NameCorrection = namedtuple('NameCorrection', ['written_name', 'actual_name'])
 PersonalInformation = namedtuple(
     'PersonalInformation', ["first_name", "last_name", "sex", "profile_image"])
 
+SpeakerResolutionSnapshot = namedtuple(
+    'SpeakerResolutionSnapshot',
+    ['name_corrections', 'personal_info', 'name_match_threshold'])
+
+NameMatch = namedtuple('NameMatch', ['name', 'score'])
+
 LegislativeTerm = namedtuple(
     'LegislativeTerm',
     ['term_id', 'number', 'start_date', 'end_date', 'description'])
@@ -0,0 +1,98 @@
+"""Defines functions for loading the CSV files with speaker data."""
+from ast import literal_eval
+from framework.core.conversion.buildmanifest import compute_file_hash
+from framework.core.conversion.buildmanifest import compute_framework_version
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+import csv
+import logging
+import pickle
+import re
+
+SIMPLE_NAME_LIST = re.compile(
+    r"\[\s*(?:'[^'\\]*'\s*(?:,\s*'[^'\\]*'\s*)*,?)?\]")
+QUOTED_NAME_PART = re.compile(r"'([^'\\]*)'")
+
+
+def iter_csv_rows(file_path: str) -> Iterator[Dict[str, str]]:
+    """Iterate over the rows of the CSV file.
+
+    Parameters
+    ----------
+    file_path: str, required
+        The path of the CSV file with a header row.
+
+    Returns
+    -------
+    rows: iterator of dict of (str, str)
+        The rows of the file as dictionaries keyed by column name.
+        The byte order mark, if any, is not part of the first column name.
+    """
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as csv_file:
+        yield from csv.DictReader(csv_file)
+
+
+def parse_name_list(value: str) -> List[str]:
+    """Parse the list of name parts written as a Python list literal.
+
+    The lists of single-quoted strings without escapes are parsed
+    with a regular expression; other lists are evaluated as literals.
+
+    Parameters
+    ----------
+    value: str, required
+        The list literal, e.g. `['Ion', 'Vasile']`.
+
+    Returns
+    -------
+    name_parts: list of str
+        The parts of the name.
+    """
+    value = value.strip()
+    if SIMPLE_NAME_LIST.fullmatch(value):
+        return QUOTED_NAME_PART.findall(value)
+    return list(literal_eval(value))
+
+
+def load_with_cache(file_path: str, cache_directory: str,
+                    load: Callable[[str], object]) -> object:
+    """Load the data from the file, or from its cached snapshot if it exists.
+
+    The snapshot is a pickle file whose name contains the hash of the
+    source file and the version of the framework, so any change of the
+    source file or of the code that loads it invalidates the snapshot.
+
+    Parameters
+    ----------
+    file_path: str, required
+        The path of the file to load.
+    cache_directory: str, required
+        The directory of the snapshots. When None, the file is loaded without caching.
+    load: callable, required
+        The function that loads the data from the file.
+
+    Returns
+    -------
+    data: object
+        The data loaded from the file.
+    """
+    if cache_directory is None:
+        return load(file_path)
+    file_hash = compute_file_hash(file_path)
+    framework_version = compute_framework_version()
+    cache_name = f'{Path(file_path).stem}-{file_hash}-{framework_version[:16]}.pickle'
+    cache_file = Path(cache_directory) / cache_name
+    if cache_file.exists():
+        logging.info("Loading %s from cache %s.", file_path, cache_file)
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    data = load(file_path)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix('.tmp')
+    with open(temp_file, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    temp_file.replace(cache_file)
+    return data
@@ -1,12 +1,25 @@
 """Defines class for reading name corrections."""
 from framework.core.conversion.namedtuples import NameCorrection
-import pandas as pd
+from framework.core.conversion.namemapping.csvloader import iter_csv_rows
+from framework.core.conversion.namemapping.csvloader import load_with_cache
 from typing import List
+import logging
 
 
 class NameCorrectionsReader:
     """Reads name corrections from file."""
 
+    def __init__(self, cache_directory: str = None):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        cache_directory: str, optional
+            The directory where to cache the corrections read from a file.
+            When None (default), the file is read every time.
+        """
+        self.__cache_directory = cache_directory
+
     def read(self, file_path: str) -> List[NameCorrection]:
         """Read name corrections from provided file.
 
@@ -20,8 +33,28 @@ class NameCorrectionsReader:
         corrections: list of NameCorrection
             The name corrections from the file.
         """
-        df = pd.read_csv(file_path)
-        return [
-            NameCorrection(row.name, row.correct_name.strip())
-            for row in df.itertuples()
-        ]
+        return load_with_cache(file_path, self.__cache_directory,
+                               self.__read_corrections)
+
+    def __read_corrections(self, file_path: str) -> List[NameCorrection]:
+        """Read name corrections from the CSV file.
+
+        Parameters
+        ----------
+        file_path: str, required
+            The path of the file containing name corrections.
+
+        Returns
+        -------
+        corrections: list of NameCorrection
+            The name corrections from the file.
+        """
+        corrections = []
+        for row in iter_csv_rows(file_path):
+            correct_name = row['correct_name'].strip()
+            if len(correct_name) == 0:
+                logging.warning("No correct name for '%s'; skipping.",
+                                row['name'])
+                continue
+            corrections.append(NameCorrection(row['name'], correct_name))
+        return corrections
@@ -0,0 +1,141 @@
+"""Defines a class for finding the known names that are similar to a given name."""
+from collections import Counter
+from framework.core.conversion.namedtuples import NameCorrection
+from framework.core.conversion.namedtuples import NameMatch
+from framework.core.conversion.namemapping.namenormalizer import tokenize_name
+from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from typing import Iterable
+from typing import List
+from typing import Set
+
+
+class NameMatchIndex:
+    """Finds the known names that are similar to a given name.
+
+    The names are split into character n-grams (trigrams by default) and
+    each n-gram points to the names that contain it. The similarity of two
+    names is the Dice coefficient of their sets of n-grams, so only the names
+    that share at least one n-gram with the searched name are scored.
+    """
+
+    def __init__(self, names: Iterable[str], ngram_size: int = 3):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        names: iterable of str, required
+            The known names.
+        ngram_size: int, optional
+            The number of characters of the n-grams. Default is 3.
+        """
+        self.__ngram_size = ngram_size
+        self.__names = sorted(set(names))
+        self.__ngram_counts = []
+        self.__postings = {}
+        for position, name in enumerate(self.__names):
+            ngrams = self.__get_ngrams(name)
+            self.__ngram_counts.append(len(ngrams))
+            for ngram in ngrams:
+                self.__postings.setdefault(ngram, []).append(position)
+
+    def __len__(self) -> int:
+        """Get the number of known names."""
+        return len(self.__names)
+
+    def find(self,
+             name: str,
+             limit: int = 5,
+             min_score: float = 0.0) -> List[NameMatch]:
+        """Find the known names that are the most similar to the provided name.
+
+        Parameters
+        ----------
+        name: str, required
+            The name to search for.
+        limit: int, optional
+            The maximum number of names to return. Default is 5.
+        min_score: float, optional
+            The minimum similarity of the returned names, between 0 and 1. Default is 0.
+
+        Returns
+        -------
+        matches: list of NameMatch
+            The similar names and their similarity, from the most similar to the least similar.
+        """
+        ngrams = self.__get_ngrams(name)
+        if len(ngrams) == 0:
+            return []
+        shared_counts = Counter()
+        for ngram in ngrams:
+            shared_counts.update(self.__postings.get(ngram, []))
+        matches = []
+        for position, shared_count in shared_counts.items():
+            num_ngrams = len(ngrams) + self.__ngram_counts[position]
+            score = 2 * shared_count / num_ngrams
+            if score >= min_score:
+                matches.append(NameMatch(self.__names[position], score))
+        matches.sort(key=lambda match: (-match.score, match.name))
+        return matches[:limit]
+
+    def find_best(self, name: str, min_score: float) -> NameMatch:
+        """Find the known name that is the most similar to the provided name.
+
+        Parameters
+        ----------
+        name: str, required
+            The name to search for.
+        min_score: float, required
+            The minimum similarity of the returned name, between 0 and 1.
+
+        Returns
+        -------
+        match: NameMatch
+            The most similar name if its similarity is at least `min_score`; otherwise None.
+        """
+        matches = self.find(name, limit=1, min_score=min_score)
+        return matches[0] if len(matches) > 0 else None
+
+    def __get_ngrams(self, name: str) -> Set[str]:
+        """Get the character n-grams of the normalized name.
+
+        Parameters
+        ----------
+        name: str, required
+            The name.
+
+        Returns
+        -------
+        ngrams: set of str
+            The n-grams of the name padded with spaces.
+        """
+        tokens = tokenize_name(name)
+        if len(tokens) == 0:
+            return set()
+        padded_name = ' {} '.format(' '.join(tokens))
+        return {
+            padded_name[i:i + self.__ngram_size]
+            for i in range(len(padded_name) - self.__ngram_size + 1)
+        }
+
+
+def build_name_match_index(
+        name_corrections: Iterable[NameCorrection],
+        personal_info: Iterable[SpeakerInfo]) -> NameMatchIndex:
+    """Build the index of the known actual names of the speakers.
+
+    Parameters
+    ----------
+    name_corrections: iterable of NameCorrection, required
+        The name corrections, whose actual names are indexed.
+    personal_info: iterable of SpeakerInfo, required
+        The personal info of the speakers, whose full names are indexed.
+
+    Returns
+    -------
+    index: NameMatchIndex
+        The index of the names.
+    """
+    names = [correction.actual_name for correction in name_corrections]
+    names.extend(' '.join(info.first_name + info.last_name)
+                 for info in personal_info)
+    return NameMatchIndex(names)
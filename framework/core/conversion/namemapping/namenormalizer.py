@@ -0,0 +1,128 @@
+"""Defines a class for normalizing speaker names."""
+from framework.core.conversion.namemapping.profileinfobuilder import ProfileInfoBuilder
+from framework.core.conversion.namemapping.speakeridbuilder import SpeakerIdBuilder
+from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from functools import lru_cache
+from typing import Iterable
+from typing import List
+from unidecode import unidecode
+
+DEFAULT_CACHE_SIZE = 16384
+
+
+class NameNormalizer:
+    """Computes the id, the search key and the profile info of speaker names.
+
+    Each value is computed once per name and kept in a bounded cache,
+    so resolving a name that was seen before is a dictionary hit.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        cache_size: int, optional
+            The maximum number of names kept in each cache.
+        """
+        id_builder = SpeakerIdBuilder()
+        profile_info_builder = ProfileInfoBuilder()
+        self.__speaker_ids = lru_cache(maxsize=cache_size)(
+            id_builder.build_speaker_id)
+        self.__search_keys = lru_cache(maxsize=cache_size)(build_search_key)
+        self.__profile_info = lru_cache(maxsize=cache_size)(
+            profile_info_builder.build_profile_info)
+
+    def prewarm(self, names: Iterable[str]):
+        """Compute the ids and the search keys of the provided names ahead of their use.
+
+        Parameters
+        ----------
+        names: iterable of str, required
+            The names to normalize.
+        """
+        for name in names:
+            self.__speaker_ids(name)
+            self.__search_keys(name)
+
+    def get_speaker_id(self, full_name: str) -> str:
+        """Get the speaker id built from the full name.
+
+        Parameters
+        ----------
+        full_name: str, required
+            The full name of the speaker.
+
+        Returns
+        -------
+        speaker_id: str
+            The id of the speaker.
+        """
+        return self.__speaker_ids(full_name)
+
+    def get_search_key(self, full_name: str) -> str:
+        """Get the key used for searching the speaker info of the full name.
+
+        Parameters
+        ----------
+        full_name: str, required
+            The full name of the speaker.
+
+        Returns
+        -------
+        key: str
+            The search key.
+        """
+        return self.__search_keys(full_name)
+
+    def get_profile_info(self, full_name: str) -> SpeakerInfo:
+        """Get the profile info built by splitting the full name.
+
+        The returned instance is shared by all the callers and should not be modified.
+
+        Parameters
+        ----------
+        full_name: str, required
+            The full name of the speaker.
+
+        Returns
+        -------
+        speaker_info: SpeakerInfo
+            The speaker info built from name.
+        """
+        return self.__profile_info(full_name)
+
+
+def tokenize_name(name: str) -> List[str]:
+    """Tokenize the name.
+
+    Parameters
+    ----------
+    name: str, required
+        The name to tokenize.
+
+    Returns
+    -------
+    tokens: list of str
+        The tokens of the name.
+    """
+    name = unidecode(name.lower())
+    name = name.replace('-', ' ')
+    name = name.strip()
+    return [tok.strip() for tok in name.split(' ') if len(tok.strip()) > 0]
+
+
+def build_search_key(full_name: str) -> str:
+    """Build the search key from the full name of the speaker.
+
+    Parameters
+    ----------
+    full_name: str, required
+        The full name of the speaker.
+
+    Returns
+    -------
+    key: str
+        The search key.
+    """
+    return '-'.join(sorted(tokenize_name(full_name)))
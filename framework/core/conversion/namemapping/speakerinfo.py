@@ -1,9 +1,19 @@
 """Defines a class for representing speaker info."""
 from typing import List
+import sys
+
+NAME_TRANSLATIONS = str.maketrans({'Ş': 'Ș', 'ş': 'ș'})
 
 
 class SpeakerInfo:
-    """Represents information about the speaker."""
+    """Represents information about the speaker.
+
+    The instances have no `__dict__` and the parts of the names are interned,
+    so the many instances read from the profile info take little memory.
+    """
+
+    __slots__ = ('__first_name', '__last_name', '__speaker_id', '__sex',
+                 '__profile_image')
 
     def __init__(self,
                  first_name: List[str],
@@ -26,7 +36,6 @@ class SpeakerInfo:
         profile_image: str, optional
             The URL of the profile image.
         """
-        self.__translations = str.maketrans({'Ş': 'Ș', 'ş': 'ș'})
         self.__first_name = self.__translate_name(first_name)
         self.__last_name = self.__translate_name(last_name)
         self.__speaker_id = None
@@ -140,4 +149,4 @@ class SpeakerInfo:
         translated_name: list of str
             The name with translated characters.
         """ ""
-        return [p.translate(self.__translations) for p in name]
+        return [sys.intern(p.translate(NAME_TRANSLATIONS)) for p in name]
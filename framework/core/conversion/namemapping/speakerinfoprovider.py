@@ -1,10 +1,15 @@
 """Defines class for providing speaker info."""
 from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from framework.core.conversion.namemapping.speakerinforegistry import SpeakerInfoRegistry
 from framework.core.conversion.namemapping.speakernameresolver import SpeakerNameResolver
 from framework.core.conversion.namemapping.speakerinforesolver import SpeakerInfoResolver
-from framework.core.conversion.namemapping.speakeridbuilder import SpeakerIdBuilder
-from framework.core.conversion.namemapping.profileinfobuilder import ProfileInfoBuilder
+from framework.core.conversion.namemapping.namenormalizer import NameNormalizer
+from framework.core.conversion.namemapping.namematchindex import NameMatchIndex
+from framework.core.conversion.namemapping.namematchindex import build_name_match_index
 from framework.core.conversion.namedtuples import NameCorrection
+from framework.core.conversion.namedtuples import SpeakerResolutionSnapshot
+from typing import Dict
+from typing import Iterable
 from typing import List
 import logging
 
@@ -12,38 +17,105 @@ import logging
 class SpeakerInfoProvider:
     """Provides speaker info."""
 
-    def __init__(self, name_corrections: List[NameCorrection],
-                 personal_info: List[SpeakerInfo]):
+    def __init__(self,
+                 name_corrections: List[NameCorrection],
+                 personal_info: Iterable[SpeakerInfo],
+                 name_match_threshold: float = None,
+                 prewarm_name_cache: bool = False):
         """Create a new instance of the class.
 
         Parameters
         ----------
         name_corrections: list of NameCorrection, required
             The list of name corrections that map names as they appear in JSON transcriptions to correct names of speakers.
-        personal_info: list of SpeakerInfo, required
-            The list with personal info of the speakers.
+        personal_info: iterable of SpeakerInfo, required
+            The personal info of the speakers, or a SpeakerInfoRegistry holding it.
+        name_match_threshold: float, optional
+            The minimum similarity, between 0 and 1, of a known name that replaces
+            a name which is missing from the name corrections. When None (default),
+            such names are kept as they are written.
+        prewarm_name_cache: bool, optional
+            When True, the ids and search keys of the names from the name
+            corrections are computed when the provider is created. Default is False.
         """
+        self.__name_corrections = tuple(name_corrections)
+        if not isinstance(personal_info, SpeakerInfoRegistry):
+            personal_info = SpeakerInfoRegistry(personal_info)
+        self.__personal_info = personal_info
         self.__id_map = {}
-        self.__id_builder = SpeakerIdBuilder()
-        self.__name_resolver = SpeakerNameResolver(name_corrections)
-        self.__info_resolver = SpeakerInfoResolver(personal_info)
+        self.__recent_ids = {}
+        self.__name_normalizer = NameNormalizer()
+        self.__name_resolver = SpeakerNameResolver(self.__name_corrections)
+        self.__info_resolver = SpeakerInfoResolver(self.__personal_info,
+                                                   self.__name_normalizer)
+        if prewarm_name_cache:
+            self.__name_normalizer.prewarm(
+                correction.actual_name
+                for correction in self.__name_corrections)
+        self.__name_match_threshold = name_match_threshold
+        self.__name_index = None
 
-    def get_speaker_id(self, speaker_name: str) -> str:
-        """Get the speaker id from the provided full name of the speaker.
+    def create_snapshot(self) -> SpeakerResolutionSnapshot:
+        """Create an immutable snapshot of the data used for resolving speakers.
+
+        The snapshot can be pickled and sent to other processes
+        in order to create identical providers with `create_speaker_info_provider`.
+
+        Returns
+        -------
+        snapshot: SpeakerResolutionSnapshot
+            The name corrections as a tuple and the registry of the personal info of the speakers.
+        """
+        return SpeakerResolutionSnapshot(self.__name_corrections,
+                                         self.__personal_info,
+                                         self.__name_match_threshold)
+
+    def export_id_map(self) -> Dict[str, str]:
+        """Export the speaker ids built since the previous export.
+
+        Returns
+        -------
+        id_map: dict of (str, str)
+            The map from speaker ids to actual names for the ids built since the
+            previous export, including the ids that were already known.
+        """
+        id_map, self.__recent_ids = self.__recent_ids, {}
+        return id_map
+
+    def merge_id_map(self, id_map: Dict[str, str]):
+        """Merge the provided speaker ids into the id map.
+
+        As with `get_speaker_id`, the name from the merged map replaces
+        the existing name of a speaker id, so merging the exports of several
+        processes in the order of the sessions gives the same id map
+        as building the ids in a single process.
 
         Parameters
         ----------
-        speaker_name: str, required
-            The full name of the speaker.
+        id_map: dict of (str, str), required
+            The map from speaker ids to actual names, as exported by another provider.
+        """
+        self.__id_map.update(id_map)
+
+    def get_speaker_id(self, actual_name: str) -> str:
+        """Get the speaker id from the actual name of the speaker.
+
+        The name is not resolved again, so the name resolution and its
+        messages happen only once, in `get_speaker_name`.
+
+        Parameters
+        ----------
+        actual_name: str, required
+            The name of the speaker, as returned by `get_speaker_name`.
 
         Returns
         -------
         speaker_id: str
             The id of the speaker.
         """
-        actual_name = self.get_speaker_name(speaker_name)
-        speaker_id = self.__id_builder.build_speaker_id(actual_name)
+        speaker_id = self.__name_normalizer.get_speaker_id(actual_name)
         self.__id_map[speaker_id] = actual_name
+        self.__recent_ids[speaker_id] = actual_name
         return speaker_id
 
     def get_personal_info(self, speaker_id: str) -> dict:
@@ -65,8 +137,7 @@ class SpeakerInfoProvider:
         speaker_info = self.__info_resolver.resolve(actual_name)
         if speaker_info is not None:
             return speaker_info
-        builder = ProfileInfoBuilder()
-        return builder.build_profile_info(actual_name)
+        return self.__name_normalizer.get_profile_info(actual_name)
 
     def get_speaker_name(self, full_name: str) -> str:
         """Get the speaker name.
@@ -82,7 +153,55 @@ class SpeakerInfoProvider:
             The name of the speaker.
         """
         actual_name = self.__name_resolver.resolve_name(full_name)
-        if actual_name is None:
+        if actual_name is not None:
+            return actual_name
+        name_index = self.__get_name_index()
+        if self.__name_match_threshold is not None:
+            match = name_index.find_best(full_name,
+                                         self.__name_match_threshold)
+            if match is not None:
+                logging.warning(
+                    "Resolved name '%s' to '%s' with similarity %.2f.",
+                    full_name, match.name, match.score)
+                return match.name
+        matches = name_index.find(full_name, limit=3)
+        if len(matches) == 0:
             logging.error("Could not resolve name '%s'.", full_name)
             return full_name
-        return actual_name
+        closest_names = ', '.join(f'{match.name} ({match.score:.2f})'
+                                  for match in matches)
+        logging.error("Could not resolve name '%s'. Closest names: %s.",
+                      full_name, closest_names)
+        return full_name
+
+    def __get_name_index(self) -> NameMatchIndex:
+        """Get the index of the known names, building it on first use.
+
+        Returns
+        -------
+        name_index: NameMatchIndex
+            The index of the actual names of the speakers.
+        """
+        if self.__name_index is None:
+            self.__name_index = build_name_match_index(self.__name_corrections,
+                                                       self.__personal_info)
+        return self.__name_index
+
+
+def create_speaker_info_provider(
+        snapshot: SpeakerResolutionSnapshot) -> SpeakerInfoProvider:
+    """Create a speaker info provider from the provided snapshot.
+
+    Parameters
+    ----------
+    snapshot: SpeakerResolutionSnapshot, required
+        The snapshot created by `SpeakerInfoProvider.create_snapshot`.
+
+    Returns
+    -------
+    speaker_info_provider: SpeakerInfoProvider
+        The speaker info provider.
+    """
+    return SpeakerInfoProvider(snapshot.name_corrections,
+                               snapshot.personal_info,
+                               snapshot.name_match_threshold)
@@ -1,20 +1,30 @@
 """Defines a class for reading profile info of MPs."""
-from ast import literal_eval
+from framework.core.conversion.namemapping.csvloader import iter_csv_rows
+from framework.core.conversion.namemapping.csvloader import load_with_cache
+from framework.core.conversion.namemapping.csvloader import parse_name_list
 from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from framework.core.conversion.namemapping.speakerinforegistry import SpeakerInfoRegistry
 from typing import Iterable
 from typing import List
 import logging
-import pandas as pd
 
 
 class SpeakerInfoReader:
     """Reads the profile info of speakers."""
 
-    def __init__(self):
-        """Create a new instance of the class."""
+    def __init__(self, cache_directory: str = None):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        cache_directory: str, optional
+            The directory where to cache the profile info read from a file.
+            When None (default), the file is read every time.
+        """
         self.__name_translations = str.maketrans({'Ş': 'Ș', 'ş': 'ș'})
+        self.__cache_directory = cache_directory
 
-    def read(self, file_path: str) -> List[SpeakerInfo]:
+    def read(self, file_path: str) -> SpeakerInfoRegistry:
         """Read the profile info from the provided file.
 
         Parameters
@@ -24,31 +34,43 @@ class SpeakerInfoReader:
 
         Returns
         -------
-        speaker_info: list of SpeakerInfo
+        speaker_info: SpeakerInfoRegistry
+            The profile info of speaker.
+        """
+        return load_with_cache(file_path, self.__cache_directory,
+                               self.__read_profile_info)
+
+    def __read_profile_info(self, file_path: str) -> SpeakerInfoRegistry:
+        """Read the profile info from the CSV file.
+
+        Parameters
+        ----------
+        file_path: str, required
+            The path of the CSV file containing profile  info.
+
+        Returns
+        -------
+        speaker_info: SpeakerInfoRegistry
             The profile info of speaker.
         """
         logging.info("Reading speaker info from %s.", file_path)
         names = set()
-        personal_info = []
-        df = pd.read_csv(file_path,
-                         converters={
-                             'first_name': literal_eval,
-                             'last_name': literal_eval
-                         })
-
-        for row in df.itertuples():
-            if row.full_name in names:
-                logging.info("Name '%s' already read; skipping.",
-                             row.full_name)
+        personal_info = SpeakerInfoRegistry()
+        for row in iter_csv_rows(file_path):
+            full_name = row['full_name']
+            if full_name in names:
+                logging.info("Name '%s' already read; skipping.", full_name)
                 continue
             profile_image = None if self.__is_empty(
-                row.profile_image) else row.profile_image
-            item = SpeakerInfo(self.__cleanup_name(row.first_name),
-                               self.__cleanup_name(row.last_name),
-                               sex=row.sex,
-                               profile_image=profile_image)
-            personal_info.append(item)
-            names.add(row.full_name)
+                row['profile_image']) else row['profile_image']
+            sex = 'U' if self.__is_empty(row['sex']) else row['sex']
+            item = SpeakerInfo(
+                self.__cleanup_name(parse_name_list(row['first_name'])),
+                self.__cleanup_name(parse_name_list(row['last_name'])),
+                sex=sex,
+                profile_image=profile_image)
+            personal_info.add(item)
+            names.add(full_name)
         return personal_info
 
     def __cleanup_name(self, name_parts: Iterable[str]) -> List[str]:
@@ -104,4 +126,4 @@ class SpeakerInfoReader:
         is_empty: bool
             True if value is empty; False otherwise.
         """
-        return pd.isnull(value) or pd.isna(value) or len(value) == 0
+        return value is None or len(value) == 0
@@ -0,0 +1,94 @@
+"""Defines a class for holding the profile info of all speakers."""
+from framework.core.conversion.namemapping.speakerinfo import SpeakerInfo
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+
+class SpeakerInfoRegistry:
+    """Holds the profile info of the speakers in columns indexed by position.
+
+    Each column is a list with one value per speaker, and the names are kept as
+    tuples of interned strings. The `SpeakerInfo` instances are created only
+    for the speakers that are looked up. The registry can be pickled
+    cheaply and sent to worker processes.
+    """
+
+    def __init__(self, speaker_data: Iterable[SpeakerInfo] = ()):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        speaker_data: iterable of SpeakerInfo, optional
+            The profile info of the speakers to add to the registry.
+        """
+        self.__first_names = []
+        self.__last_names = []
+        self.__speaker_ids = []
+        self.__sexes = []
+        self.__profile_images = []
+        for speaker_info in speaker_data:
+            self.add(speaker_info)
+
+    def __len__(self) -> int:
+        """Get the number of speakers in the registry."""
+        return len(self.__first_names)
+
+    def __getitem__(self, index: int) -> SpeakerInfo:
+        """Get the profile info of the speaker at the specified position.
+
+        Parameters
+        ----------
+        index: int, required
+            The position of the speaker in the registry.
+
+        Returns
+        -------
+        speaker_info: SpeakerInfo
+            The profile info of the speaker.
+        """
+        return SpeakerInfo(list(self.__first_names[index]),
+                           list(self.__last_names[index]),
+                           speaker_id=self.__speaker_ids[index],
+                           sex=self.__sexes[index],
+                           profile_image=self.__profile_images[index])
+
+    def __iter__(self) -> Iterator[SpeakerInfo]:
+        """Iterate over the profile info of the speakers in the registry."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def add(self, speaker_info: SpeakerInfo) -> int:
+        """Add the profile info of a speaker to the registry.
+
+        Parameters
+        ----------
+        speaker_info: SpeakerInfo, required
+            The profile info of the speaker.
+
+        Returns
+        -------
+        index: int
+            The position of the speaker in the registry.
+        """
+        self.__first_names.append(tuple(speaker_info.first_name))
+        self.__last_names.append(tuple(speaker_info.last_name))
+        self.__speaker_ids.append(speaker_info.speaker_id)
+        self.__sexes.append(speaker_info.sex)
+        self.__profile_images.append(speaker_info.profile_image)
+        return len(self.__first_names) - 1
+
+    def get_name_parts(self, index: int) -> Tuple[str, ...]:
+        """Get the parts of the first and last name of the speaker at the specified position.
+
+        Parameters
+        ----------
+        index: int, required
+            The position of the speaker in the registry.
+
+        Returns
+        -------
+        name_parts: tuple of str
+            The parts of the first name followed by the parts of the last name.
+        """
+        return self.__first_names[index] + self.__last_names[index]
@@ -1,6 +1,7 @@
 """Defines a class for building the debate section."""
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.sessions.jsontranscripttoxmlconverter import JsonTranscriptToXmlConverter
+from framework.core.conversion.sessionstatsaccumulator import SessionStatsAccumulator
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
 from lxml import etree
@@ -9,7 +10,11 @@ from lxml import etree
 class DebateSectionBuilder(JsonTranscriptToXmlConverter):
     """A builder that works on the debate section."""
 
-    def __init__(self, session_transcript: SessionTranscript, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None,
+                 session_stats: SessionStatsAccumulator = None):
         """Create a new instance of the class.
 
         Parameters
@@ -18,10 +23,17 @@ class DebateSectionBuilder(JsonTranscriptToXmlConverter):
             The session transcript.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
+        session_stats: SessionStatsAccumulator, optional
+            The statistics of the session, updated with the elements added to
+            the debate section.
         """
         JsonTranscriptToXmlConverter.__init__(self, session_transcript,
-                                              xml_file)
+                                              xml_file, xml_tree)
         self.__debate_section = None
+        self.__session_stats = session_stats
 
     @property
     def debate_section(self) -> etree.Element:
@@ -39,3 +51,14 @@ class DebateSectionBuilder(JsonTranscriptToXmlConverter):
             if div.get(XmlAttributes.element_type) == "debateSection":
                 self.__debate_section = div
                 return self.__debate_section
+
+    def update_statistics(self, element: etree.Element):
+        """Update the statistics of the session with an element of the debate section.
+
+        Parameters
+        ----------
+        element: etree.Element, required
+            The complete element appended to the debate section.
+        """
+        if self.__session_stats is not None:
+            self.__session_stats.add_debate_element(element)
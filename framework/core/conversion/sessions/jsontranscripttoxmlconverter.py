@@ -1,12 +1,16 @@
 """Defines a class for converting JSON transcript to XML."""
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.xmlutils import XmlDataManipulator
+from lxml import etree
 
 
 class JsonTranscriptToXmlConverter(XmlDataManipulator):
     """Base class for converting JSON transcript to XML.""" ""
 
-    def __init__(self, session_transcript: SessionTranscript, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -15,8 +19,11 @@ class JsonTranscriptToXmlConverter(XmlDataManipulator):
             The session transcript.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
         """
-        XmlDataManipulator.__init__(self, xml_file)
+        XmlDataManipulator.__init__(self, xml_file, xml_tree)
         self.__transcript = session_transcript
 
     @property
@@ -1,6 +1,6 @@
 """Defines a class for building the contents of the meeting elements.""" ""
-from babel.dates import format_date
 from datetime import datetime
+from framework.core.conversion.dateintervalindex import DateIntervalIndex
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.namedtuples import LegislativeTerm
 from framework.core.conversion.sessions.jsontranscripttoxmlconverter import JsonTranscriptToXmlConverter
@@ -9,7 +9,6 @@ from framework.core.xmlutils import Taxonomy
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
 from lxml import etree
-from typing import List
 from typing import Tuple
 import logging
 
@@ -17,21 +16,27 @@ import logging
 class MeetingElementContentsBuilder(JsonTranscriptToXmlConverter):
     """Builds the contents of the meeting elements."""
 
-    def __init__(self, session_transcript: SessionTranscript,
-                 legislative_terms: List[LegislativeTerm], xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 legislative_terms: DateIntervalIndex,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         session_transcript: SessionTranscript, required
             The session transcript.
-        legislative_terms: list of LegislativeTerm, required
-            The list of legislative terms.
+        legislative_terms: DateIntervalIndex, required
+            The index of legislative terms by date.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
         """
         JsonTranscriptToXmlConverter.__init__(self, session_transcript,
-                                              xml_file)
+                                              xml_file, xml_tree)
         self.__terms = legislative_terms
 
     def build_meeting_info(self):
@@ -62,8 +67,9 @@ class MeetingElementContentsBuilder(JsonTranscriptToXmlConverter):
         """
         term = self.__get_term(session_date)
         if term is None:
-            logging.error("Could not find legislative term for date %s.",
-                          format_date(session_date, "yyyy-MM-dd"))
+            logging.error(
+                "Could not find legislative term for date %s.",
+                self.session_transcript.format_session_date("yyyy-MM-dd"))
             parent = meeting.getparent()
             parent.remove(meeting)
         else:
@@ -78,13 +84,7 @@ class MeetingElementContentsBuilder(JsonTranscriptToXmlConverter):
         session_date: datetime, required
             The date of the session.
         """
-        for term in self.__terms:
-            end_date = datetime.max.date()
-            if term.end_date is not None:
-                end_date = term.end_date
-            if term.start_date <= session_date <= end_date:
-                return term
-        return None
+        return self.__terms.find(session_date)
 
     def __set_session_info(self, meeting: etree.Element,
                            session_date: datetime):
@@ -149,6 +149,7 @@ class MeetingElementContentsBuilder(JsonTranscriptToXmlConverter):
         session_date: datetime, required
             The date of the session.
         """
+        transcript = self.session_transcript
         meeting.set(XmlAttributes.meeting_n,
-                    format_date(session_date, "yyyyMMdd"))
-        meeting.text = format_date(session_date, "yyyy-MM-dd")
+                    transcript.format_session_date("yyyyMMdd"))
+        meeting.text = transcript.format_session_date("yyyy-MM-dd")
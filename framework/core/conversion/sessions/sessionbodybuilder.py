@@ -6,19 +6,64 @@ from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.jsonutils import Speaker
 from framework.core.conversion.namemapping.speakerinfoprovider import SpeakerInfoProvider
 from framework.core.conversion.sessions.debatesectionbuilder import DebateSectionBuilder
+from framework.core.conversion.sessions.sessionbodywriter import SessionBodyWriter
 from framework.core.conversion.sessions.sessionelementsidbuilder import SessionElementsIdBuilder
+from framework.core.conversion.sessionstatsaccumulator import SessionStatsAccumulator
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
 from lxml import etree
+from typing import Generator
 from typing import List
+from typing import Tuple
 import re
 
+# The keywords of the annotations denoting vocal phenomena and their types,
+# from the highest to the lowest priority.
+VOCAL_ANNOTATION_TYPES = [
+    ('gălăgie', 'noise'),
+    ('aplauze', 'noise'),
+    ('râsete', 'laughter'),
+    ('rumoare', 'murmuring'),
+    ('vocif', 'shouting'),
+]
+
+# Each alternative looks ahead for a keyword anywhere in the annotation;
+# the alternatives are tried in order so the first one that matches
+# gives the keyword with the highest priority.
+VOCAL_ANNOTATION_MATCHER = re.compile(
+    '|'.join('(?=.*({}))'.format(re.escape(keyword))
+             for keyword, _ in VOCAL_ANNOTATION_TYPES),
+    re.IGNORECASE | re.DOTALL)
+
+WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Collapse the whitespace of the text and replace unwanted characters.
+
+    Parameters
+    ----------
+    text: str, required
+        The text to normalize.
+
+    Returns
+    -------
+    normalized_text: str
+        The normalized text.
+    """
+    return WHITESPACE.sub(' ', text).translate(STR_TRANSLATIONS)
+
 
 class SessionBodyBuilder(DebateSectionBuilder):
     """Builds the nodes containing the session body."""
 
-    def __init__(self, session_transcript: SessionTranscript,
-                 speaker_info_provider: SpeakerInfoProvider, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 speaker_info_provider: SpeakerInfoProvider,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None,
+                 body_writer: SessionBodyWriter = None,
+                 session_stats: SessionStatsAccumulator = None):
         """Create a new instance of the class.
 
         Parameters
@@ -29,44 +74,76 @@ class SessionBodyBuilder(DebateSectionBuilder):
             The file containing session transcript in XML format.
         speaker_info_provider: SpeakerInfoProvider, required
             An instance of SpeakerInfoProvider used for building speaker id.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
+        body_writer: SessionBodyWriter, optional
+            When provided, each utterance is written by the body writer
+            as soon as it is built instead of being kept in the XML tree.
+        session_stats: SessionStatsAccumulator, optional
+            The statistics of the session, updated with the elements added to
+            the debate section.
         """
-        super().__init__(session_transcript, xml_file)
+        super().__init__(session_transcript, xml_file, xml_tree, session_stats)
         self.__element_id_builder = SessionElementsIdBuilder(self.xml_root)
         self.__speaker_info_provider = speaker_info_provider
+        self.__speaker_names = {}
+        self.__speaker_ids = {}
+        self.__body_writer = body_writer
 
     def build_session_body(self):
         """Build the session body."""
+        if self.__body_writer is not None:
+            self.__body_writer.begin(self.debate_section)
         session_segments = self.session_transcript.body
         if len(session_segments) == 0:
             return
 
-        chairman = self.__get_speaker(session_segments, 0)
+        chairman = session_segments[0].speaker
+        if chairman.is_empty:
+            raise ValueError("Could not determine speaker.")
         chairman_name = self.__get_speaker_name(chairman)
-        for idx, segment in enumerate(session_segments):
+        for segment, speaker in self.__iter_segment_speakers(session_segments):
             if segment.is_empty:
                 continue
 
-            speaker = self.__get_speaker(session_segments, idx)
             speaker_name = self.__get_speaker_name(speaker)
 
-            self.__build_speaker_note(speaker.announcement)
+            note = self.__build_speaker_note(speaker.announcement)
             utterance = self.__build_utterance(speaker_name, chairman_name)
-            for content_line in segment.contents:
-                if content_line.is_empty:
-                    continue
-
-                if len(content_line.annotations) == 0:
-                    self.__build_simple_segment(utterance, content_line.text)
-                else:
-                    self.__build_complex_segment(utterance, content_line)
-            if len(utterance) == 0:
-                gap = etree.SubElement(utterance, XmlElements.gap,
-                                       {"reason": "editorial"})
-                desc = etree.SubElement(gap, XmlElements.desc)
-                desc.text = "Lipsesc informații din cauza unei erori în modulul de descărcare date."
+            self.__build_utterance_contents(utterance, segment)
+            self.update_statistics(note)
+            self.update_statistics(utterance)
+            if self.__body_writer is not None:
+                self.__body_writer.write([note, utterance])
 
         self.save_changes()
 
+    def __build_utterance_contents(self, utterance: etree.Element,
+                                   segment: BodySegment):
+        """Build the segments of an utterance from the contents of a session segment.
+
+        Parameters
+        ----------
+        utterance: etree.Element, required
+            The utterance element.
+        segment: BodySegment, required
+            The session segment.
+        """
+        for content_line in segment.contents:
+            if content_line.is_empty:
+                continue
+
+            if len(content_line.annotations) == 0:
+                self.__build_simple_segment(utterance, content_line.text)
+            else:
+                self.__build_complex_segment(utterance, content_line)
+        if len(utterance) == 0:
+            gap = etree.SubElement(utterance, XmlElements.gap,
+                                   {"reason": "editorial"})
+            desc = etree.SubElement(gap, XmlElements.desc)
+            desc.text = "Lipsesc informații din cauza unei erori în modulul de descărcare date."
+
     def __build_simple_segment(self, utterance: etree.Element, text: str):
         """Build a segment element with text contents.
 
@@ -93,48 +170,79 @@ class SessionBodyBuilder(DebateSectionBuilder):
         content_line: SessionContentLine, required
             The contents of the segment.
         """
-        text = content_line.text
-        seg = '<seg xml:id="{seg_id}">'
+        seg = etree.SubElement(utterance, XmlElements.seg)
+        seg.set(XmlAttributes.xml_id,
+                self.__element_id_builder.get_segment_id())
+
+        text, position = content_line.text, 0
+        parts, annotations = [], []
         for annotation in content_line.annotations:
             annotation = annotation.strip()
-            first, *rest = text.split(annotation)
-            replacement = self.__convert_annotation_to_element(annotation)
-            seg = seg + "{} {} ".format(first, replacement)
-            text = ''.join(rest)
+            start = text.find(annotation, position)
+            if start < 0:
+                start = len(text)
+            parts.append(text[position:start])
+            annotations.append(self.__build_annotation(seg, annotation))
+            position = min(start + len(annotation), len(text))
+
+        seg.text = normalize_text(parts[0] + ' ')
+        for annotation, part in zip(annotations[:-1], parts[1:]):
+            annotation.tail = normalize_text(' ' + part + ' ')
+        annotations[-1].tail = normalize_text(' ' + text[position:])
+        self.__remove_blank_text(seg, annotations)
+
+    def __remove_blank_text(self, seg: etree.Element,
+                            annotations: List[etree.Element]):
+        """Remove the whitespace-only text of the segment.
+
+        The whitespace-only text is removed the same way as when parsing the segment
+        without blank text, i.e. only until the first non-blank text of the segment.
 
-        seg = seg + text + '</seg>'
-        seg = seg.format(seg_id=self.__element_id_builder.get_segment_id())
-        seg = re.sub(r'\s+', ' ', seg)
-        seg = seg.translate(STR_TRANSLATIONS)
-
-        utterance.append(etree.fromstring(seg))
+        Parameters
+        ----------
+        seg: etree.Element, required
+            The segment element.
+        annotations: list of etree.Element, required
+            The annotation elements of the segment.
+        """
+        if not seg.text.isspace():
+            return
+        seg.text = None
+        for annotation in annotations:
+            if not annotation.tail.isspace():
+                return
+            annotation.tail = None
 
-    def __convert_annotation_to_element(self, annotation: str) -> str:
-        """Convert the provided annotation to an XML string.
+    def __build_annotation(self, seg: etree.Element,
+                           annotation: str) -> etree.Element:
+        """Build the element of an annotation and add it to the segment.
 
         Parameters
         ----------
+        seg: etree.Element, required
+            The parent segment element.
         annotation: str, required
             The text of the annotation.
 
         Returns
         -------
-        xml_string: str
-            The XML string of the annotation being converted.
+        element: etree.Element
+            The `note` or `vocal` element of the annotation.
         """
-        template = '<note type="editorial">{}</note>'
-        text = annotation.lower()
-        if 'vocif' in text:
-            template = '<vocal type="shouting"><desc>{}</desc></vocal>'
-        if 'rumoare' in text:
-            template = '<vocal type="murmuring"><desc>{}</desc></vocal>'
-        if 'râsete' in text:
-            template = '<vocal type="laughter"><desc>{}</desc></vocal>'
-        if 'aplauze' in text:
-            template = '<vocal type="noise"><desc>{}</desc></vocal>'
-        if 'gălăgie' in text:
-            template = '<vocal type="noise"><desc>{}</desc></vocal>'
-        return template.format(annotation)
+        text = normalize_text(annotation) or None
+        match = VOCAL_ANNOTATION_MATCHER.match(annotation)
+        if match is None:
+            element = etree.SubElement(seg, XmlElements.note)
+            element.set(XmlAttributes.element_type, "editorial")
+            element.text = text
+            return element
+
+        element = etree.SubElement(seg, XmlElements.vocal)
+        element.set(XmlAttributes.element_type,
+                    VOCAL_ANNOTATION_TYPES[match.lastindex - 1][1])
+        desc = etree.SubElement(element, XmlElements.desc)
+        desc.text = text
+        return element
 
     def __build_utterance(self, speaker_name: str, chairman_name: str):
         """Build an utterance element and add it to the debate section.
@@ -154,49 +262,55 @@ class SessionBodyBuilder(DebateSectionBuilder):
         utterance = etree.SubElement(self.debate_section, XmlElements.u)
         speaker_type = "#chair" if speaker_name == chairman_name else "#regular"
         utterance.set(XmlAttributes.ana, speaker_type)
-        speaker_id = self.__speaker_info_provider.get_speaker_id(speaker_name)
-        utterance.set(XmlAttributes.who, speaker_id)
+        utterance.set(XmlAttributes.who, self.__get_speaker_id(speaker_name))
         utterance.set(XmlAttributes.xml_id,
                       self.__element_id_builder.get_utterance_id())
         return utterance
 
-    def __build_speaker_note(self, text: str):
+    def __build_speaker_note(self, text: str) -> etree.Element:
         """Build a speaker note element and add it to the debate section.
 
         Parameters
         ----------
         text: str, required
             The text of the note.
+
+        Returns
+        -------
+        note: etree.Element
+            The note element.
         """
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, "speaker")
         note.text = text
+        return note
 
-    def __get_speaker(self, session_segments: List[BodySegment],
-                      segment_index: int) -> Speaker:
-        """Get the speaker for the segment at the specified index.
+    def __iter_segment_speakers(
+        self, session_segments: List[BodySegment]
+    ) -> Generator[Tuple[BodySegment, Speaker], None, None]:
+        """Iterate over session segments together with their speakers.
+
+        A segment without a speaker belongs to the closest previous segment
+        that has a speaker.
 
         Parameters
         ----------
         session_segments: list of BodySegment, required
             The session segments.
-        segment_index: int, required
-            The index of the segment for which to determine the speaker.
 
         Returns
         -------
-        speaker: Speaker
-            The speaker associated with the current segment.
+        segment_speakers: generator of (BodySegment, Speaker) tuples
+            The segments and the speakers associated with them.
         """
-        # Iterate backwards from the current index until the first speaker that is not None
-        while (segment_index >= 0):
-            segment = session_segments[segment_index]
+        current_speaker = None
+        for segment in session_segments:
             speaker = segment.speaker
             if (speaker is not None) and (not speaker.is_empty):
-                return speaker
-            segment_index = segment_index - 1
-
-        raise ValueError("Could not determine speaker.")
+                current_speaker = speaker
+            if current_speaker is None:
+                raise ValueError("Could not determine speaker.")
+            yield segment, current_speaker
 
     def __get_session_chairman(self,
                                session_segments: List[BodySegment]) -> Speaker:
@@ -234,4 +348,28 @@ class SessionBodyBuilder(DebateSectionBuilder):
         if speaker is None:
             return None
 
-        return self.__speaker_info_provider.get_speaker_name(speaker.full_name)
+        full_name = speaker.full_name
+        if full_name not in self.__speaker_names:
+            provider = self.__speaker_info_provider
+            self.__speaker_names[full_name] = provider.get_speaker_name(
+                full_name)
+        return self.__speaker_names[full_name]
+
+    def __get_speaker_id(self, speaker_name: str) -> str:
+        """Get the id of the speaker with the provided name.
+
+        Parameters
+        ----------
+        speaker_name: str, required
+            The name of the speaker, as resolved by `__get_speaker_name`.
+
+        Returns
+        -------
+        speaker_id: str
+            The id of the speaker.
+        """
+        if speaker_name not in self.__speaker_ids:
+            provider = self.__speaker_info_provider
+            self.__speaker_ids[speaker_name] = provider.get_speaker_id(
+                speaker_name)
+        return self.__speaker_ids[speaker_name]
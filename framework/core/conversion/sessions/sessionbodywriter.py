@@ -0,0 +1,144 @@
+"""Defines a class that writes the session body while it is being built."""
+from framework.core.xmlutils import save_xml
+from framework.core.xmlutils import serialize_xml
+from lxml import etree
+from typing import Iterable
+from typing import Tuple
+import shutil
+import tempfile
+
+BODY_PLACEHOLDER = 'session-body'
+
+
+class SessionBodyWriter:
+    """Streams the elements of the session body to a temporary file.
+
+    Each element is serialized at the nesting level of the debate section, exactly as
+    it is serialized when saving the whole tree with the current serialization
+    profile, and then removed from the tree.
+    When the session is saved the streamed elements are written in place of
+    a placeholder left in the debate section.
+    """
+
+    def __init__(self):
+        """Create a new instance of the class."""
+        self.__placeholder = None
+        self.__frame = None
+        self.__frame_bounds = None
+        self.__spool = None
+        self.__is_empty = True
+
+    def begin(self, debate_section: etree.Element):
+        """Mark the place of the session body in the debate section.
+
+        Parameters
+        ----------
+        debate_section: etree.Element, required
+            The debate section of the session containing the elements built so far.
+        """
+        self.__placeholder = etree.Comment(BODY_PLACEHOLDER)
+        debate_section.append(self.__placeholder)
+        self.__frame = self.__build_frame(debate_section)
+        self.__frame_bounds = self.__get_frame_bounds()
+        self.__spool = tempfile.TemporaryFile()
+
+    def write(self, elements: Iterable[etree.Element]):
+        """Write the provided elements and remove them from the tree.
+
+        Parameters
+        ----------
+        elements: iterable of etree.Element, required
+            The consecutive elements of the debate section to write.
+        """
+        for element in elements:
+            self.__frame.append(element)
+
+        prefix, suffix = self.__frame_bounds
+        contents = serialize_xml(self.__frame.getroottree())
+        self.__spool.write(contents[len(prefix):len(contents) - len(suffix)])
+        self.__frame.clear()
+        self.__is_empty = False
+
+    def save(self, xml_tree: etree._ElementTree, output_file: str):
+        """Save the session to the output file.
+
+        Parameters
+        ----------
+        xml_tree: etree.ElementTree, required
+            The XML tree of the session containing the placeholder of the body.
+        output_file: str, required
+            The path of the output file.
+        """
+        if self.__is_empty:
+            self.__placeholder.getparent().remove(self.__placeholder)
+            self.__spool.close()
+            save_xml(xml_tree, output_file)
+            return
+
+        contents = serialize_xml(xml_tree)
+        start, end = self.__find_placeholder(contents)
+        with open(output_file, 'wb') as out:
+            out.write(contents[:start])
+            self.__spool.seek(0)
+            shutil.copyfileobj(self.__spool, out)
+            out.write(contents[end:])
+        self.__spool.close()
+
+    def __build_frame(self, debate_section: etree.Element) -> etree.Element:
+        """Build an empty copy of the debate section and of its ancestors.
+
+        Parameters
+        ----------
+        debate_section: etree.Element, required
+            The debate section.
+
+        Returns
+        -------
+        frame: etree.Element
+            The copy of the debate section.
+        """
+        ancestors = [debate_section] + list(debate_section.iterancestors())
+        frame = None
+        for element in reversed(ancestors):
+            if frame is None:
+                frame = etree.Element(element.tag, nsmap=element.nsmap)
+            else:
+                frame = etree.SubElement(frame, element.tag)
+        return frame
+
+    def __get_frame_bounds(self) -> Tuple[bytes, bytes]:
+        """Get the serialized contents of the frame around its child elements.
+
+        Returns
+        -------
+        (prefix, suffix): tuple of bytes
+            The contents of the frame before and after its child elements.
+        """
+        self.__frame.append(etree.Comment(BODY_PLACEHOLDER))
+        contents = serialize_xml(self.__frame.getroottree())
+        self.__frame.clear()
+        start, end = self.__find_placeholder(contents)
+        return contents[:start], contents[end:]
+
+    def __find_placeholder(self, contents: bytes) -> Tuple[int, int]:
+        """Find the placeholder of the body.
+
+        Parameters
+        ----------
+        contents: bytes, required
+            The serialized XML.
+
+        Returns
+        -------
+        (start, end): tuple of int
+            The start and the end of the placeholder, including its indentation
+            and line break when the XML is indented.
+        """
+        placeholder = etree.tostring(etree.Comment(BODY_PLACEHOLDER))
+        start = contents.index(placeholder)
+        end = start + len(placeholder)
+        line_start = contents.rfind(b'\n', 0, start) + 1
+        is_own_line = contents[end:end + 1] == b'\n'
+        if is_own_line and contents[line_start:start].strip() == b'':
+            return line_start, end + 1
+        return start, end
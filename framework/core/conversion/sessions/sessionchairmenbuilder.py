@@ -17,4 +17,5 @@ class SessionChairmenBuilder(DebateSectionBuilder):
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, "narrative")
         note.text = chairman
+        self.update_statistics(note)
         self.save_changes()
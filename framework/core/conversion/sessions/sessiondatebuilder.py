@@ -1,15 +1,18 @@
 """Defines a class for building the contents of date elements."""
-from babel.dates import format_date
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.sessions.jsontranscripttoxmlconverter import JsonTranscriptToXmlConverter
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
+from lxml import etree
 
 
 class SessionDateBuilder(JsonTranscriptToXmlConverter):
     """Builds the contents of date elements."""
 
-    def __init__(self, session_transcript: SessionTranscript, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -18,18 +21,21 @@ class SessionDateBuilder(JsonTranscriptToXmlConverter):
             The session transcript.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
         """
         JsonTranscriptToXmlConverter.__init__(self, session_transcript,
-                                              xml_file)
+                                              xml_file, xml_tree)
 
     def build_date_contents(self):
         """Build the content of date elements."""
-        session_date = self.session_transcript.session_date
+        transcript = self.session_transcript
         for date in self.xml_root.iterdescendants(tag=XmlElements.date):
             parent_tag = date.getparent().tag
             if parent_tag == XmlElements.setting or parent_tag == XmlElements.bibl:
                 date.set(XmlAttributes.when,
-                         format_date(session_date, "yyyy-MM-dd"))
-                date.text = format_date(session_date, "dd.MM.yyyy")
+                         transcript.format_session_date("yyyy-MM-dd"))
+                date.text = transcript.format_session_date("dd.MM.yyyy")
 
         self.save_changes()
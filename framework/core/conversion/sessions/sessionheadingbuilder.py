@@ -16,4 +16,5 @@ class SessionHeadingBuilder(DebateSectionBuilder):
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, "editorial")
         note.text = session_title
+        self.update_statistics(note)
         self.save_changes()
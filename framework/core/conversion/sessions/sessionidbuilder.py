@@ -2,24 +2,30 @@
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlDataManipulator
+from framework.core.xmlutils import load_xml_template
 
 
 class SessionIdBuilder(XmlDataManipulator):
     """Builds the session id."""
 
-    def __init__(self, template_file: str, transcript: SessionTranscript,
-                 output_file: str):
+    def __init__(self,
+                 template_file: str,
+                 transcript: SessionTranscript,
+                 output_file: str = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         template_file: str, required
-            The path of the session template file.
+            The path of the session template file. The template is parsed
+            once per process and each session starts from a copy of it.
         transcript: SessionTranscript, required
-        output_file, str, required
+        output_file, str, optional
             The path of the output XML file.
+            If `None` then the session XML is kept in memory only.
         """
-        XmlDataManipulator.__init__(self, template_file)
+        XmlDataManipulator.__init__(self, template_file,
+                                    load_xml_template(template_file))
         self.__transcript = transcript
         self.__output_file = output_file
 
@@ -28,4 +34,5 @@ class SessionIdBuilder(XmlDataManipulator):
         xml_id = "ParlaMint-RO_{}-id{}".format(self.__transcript.session_date,
                                                self.__transcript.session_id)
         self.xml_root.set(XmlAttributes.xml_id, xml_id)
-        self.save_changes(self.__output_file)
+        if self.__output_file is not None:
+            self.save_changes(self.__output_file)
@@ -3,12 +3,16 @@ from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.sessions.jsontranscripttoxmlconverter import JsonTranscriptToXmlConverter
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
+from lxml import etree
 
 
 class SessionIdNoBuilder(JsonTranscriptToXmlConverter):
     """Builds the idno element."""
 
-    def __init__(self, session_transcript: SessionTranscript, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -17,9 +21,12 @@ class SessionIdNoBuilder(JsonTranscriptToXmlConverter):
             The session transcript.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
         """
         JsonTranscriptToXmlConverter.__init__(self, session_transcript,
-                                              xml_file)
+                                              xml_file, xml_tree)
 
     def build_session_idno(self):
         """Build the contents of the idno element."""
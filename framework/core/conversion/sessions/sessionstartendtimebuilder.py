@@ -17,6 +17,7 @@ class SessionStartEndTimeBuilder(DebateSectionBuilder):
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, "time")
         note.text = start_time
+        self.update_statistics(note)
         self.save_changes()
 
     def build_session_end_time(self):
@@ -28,4 +29,5 @@ class SessionStartEndTimeBuilder(DebateSectionBuilder):
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, "time")
         note.text = end_time
+        self.update_statistics(note)
         self.save_changes()
@@ -1,5 +1,4 @@
 """Defines a class for building session summary."""
-from babel.dates import format_date
 from framework.core.conversion.sessions.debatesectionbuilder import DebateSectionBuilder
 from framework.core.xmlutils import Resources
 from framework.core.xmlutils import XmlAttributes
@@ -45,14 +44,17 @@ class SessionSummaryBuilder(DebateSectionBuilder):
         note = etree.SubElement(self.debate_section, XmlElements.note)
         note.set(XmlAttributes.element_type, note_type)
         note.text = text
+        self.update_statistics(note)
 
     def __build_summary_heading(self):
         """Build the heading nodes of the summary."""
         head = etree.SubElement(self.debate_section, XmlElements.head)
         head.text = Resources.Heading
+        self.update_statistics(head)
 
         session_head = etree.SubElement(self.debate_section, XmlElements.head)
         session_head.set(XmlAttributes.element_type, "session")
-        session_date = self.session_transcript.session_date
-        session_date = format_date(session_date, "d MMMM yyyy")
+        session_date = self.session_transcript.format_session_date(
+            "d MMMM yyyy")
         session_head.text = Resources.SessionHeading.format(session_date)
+        self.update_statistics(session_head)
@@ -1,5 +1,4 @@
 """Defines a class for building session title."""
-from babel.dates import format_date
 from framework.core.constants import SAMPLE_TAG
 from framework.core.conversion.jsonutils import SessionTranscript
 from framework.core.conversion.sessions.jsontranscripttoxmlconverter import JsonTranscriptToXmlConverter
@@ -8,12 +7,16 @@ from framework.core.xmlutils import Resources
 from framework.core.xmlutils import TitleTypes
 from framework.core.xmlutils import XmlAttributes
 from framework.core.xmlutils import XmlElements
+from lxml import etree
 
 
 class SessionTitleBuilder(JsonTranscriptToXmlConverter):
     """Builds the session title."""
 
-    def __init__(self, session_transcript: SessionTranscript, xml_file: str):
+    def __init__(self,
+                 session_transcript: SessionTranscript,
+                 xml_file: str,
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -22,9 +25,12 @@ class SessionTitleBuilder(JsonTranscriptToXmlConverter):
             The session transcript.
         xml_file: str, required
             The file containing session transcript in XML format.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared by the session builders. When provided, the
+            changes are kept in memory instead of being saved to `xml_file`.
         """
         JsonTranscriptToXmlConverter.__init__(self, session_transcript,
-                                              xml_file)
+                                              xml_file, xml_tree)
 
     def build_session_title(self, add_sample_tag: bool = False):
         """Build session title.
@@ -34,9 +40,9 @@ class SessionTitleBuilder(JsonTranscriptToXmlConverter):
         add_sample_tag: bool, optional
             Instructs the builder to add sample tag when true.
         """
-        session_date = self.session_transcript.session_date
-        ro_date = format_date(session_date, "d MMMM yyyy", locale="ro")
-        en_date = format_date(session_date, "MMMM d yyyy", locale="en")
+        transcript = self.session_transcript
+        ro_date = transcript.format_session_date("d MMMM yyyy", locale="ro")
+        en_date = transcript.format_session_date("MMMM d yyyy", locale="en")
 
         for elem in self.xml_root.iterdescendants(tag=XmlElements.title):
             if elem.getparent().tag != XmlElements.titleStmt:
@@ -0,0 +1,124 @@
+"""Defines a class that accumulates the statistics of a session while it is being built."""
+from framework.core.conversion.corpusroot.sessionspeakersreader import is_of_a_government_member
+from framework.core.conversion.wordcounter import WordCountAccumulator
+from framework.core.conversion.wordcounter import WordCounter
+from framework.core.xmlutils import XmlAttributes
+from framework.core.xmlutils import XmlElements
+from lxml import etree
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class SessionStatsAccumulator:
+    """Accumulates the statistics of a session transcript while it is being built.
+
+    The accumulator provides the same statistics as `SessionStatsCalculator`
+    without walking the XML tree once the session is built.
+    """
+
+    def __init__(self, word_counter: WordCounter):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        word_counter: WordCounter, required
+            The word counter used for the words of the debate section.
+        """
+        self.__words = WordCountAccumulator(word_counter)
+        self.__tag_counts = {}
+        self.__speaker_ids = set()
+        self.__gov_members = set()
+
+    def add_document(self, xml_root: etree.Element):
+        """Add the elements of the session built so far.
+
+        Parameters
+        ----------
+        xml_root: etree.Element, required
+            The root element of the session.
+        """
+        for element in xml_root.iterdescendants():
+            self.__add_tag(element)
+        for div in xml_root.iterdescendants(XmlElements.div):
+            if div.get(XmlAttributes.element_type) == "debateSection":
+                self.__words.add(div.itertext())
+                break
+
+    def add_debate_element(self, element: etree.Element):
+        """Add an element appended to the debate section.
+
+        Parameters
+        ----------
+        element: etree.Element, required
+            The element, which is not changed afterwards.
+        """
+        for descendant in element.iter():
+            self.__add_tag(descendant)
+        for utterance in element.iter(XmlElements.u):
+            self.__add_speaker(utterance)
+        self.__words.add(element.itertext())
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Get the number of times each tag appears in the document.
+
+        Returns
+        -------
+        tag_counts: dict of (str, int)
+            A dictionary containing each tag and the number of times it appears in the document.
+        """
+        return dict(self.__tag_counts)
+
+    def get_num_words(self) -> int:
+        """Get the number of words from the session transcription.
+
+        Returns
+        -------
+        num_words: int
+            The number of words in the transcription.
+        """
+        return self.__words.num_words
+
+    def get_num_speeches(self) -> int:
+        """Get the number of utterances.
+
+        Returns
+        -------
+        num_speeches: int
+            The number of speeches in the transcription.
+        """
+        return self.__tag_counts.get(XmlElements.u, 0)
+
+    def get_speaker_ids(self) -> Tuple[List[str], List[str]]:
+        """Get the ids of the speakers of the utterances.
+
+        Returns
+        -------
+        (speaker_ids, gov_members):  tuple of list of str
+            The list of unique speaker ids, and the list of unique government members.
+        """
+        return sorted(self.__speaker_ids), sorted(self.__gov_members)
+
+    def __add_speaker(self, utterance: etree.Element):
+        """Record the speaker of the provided utterance.
+
+        Parameters
+        ----------
+        utterance: etree.Element, required
+            The utterance, preceded by the note that announces its speaker.
+        """
+        speaker_id = utterance.get(XmlAttributes.who)
+        self.__speaker_ids.add(speaker_id)
+        if is_of_a_government_member(utterance):
+            self.__gov_members.add(speaker_id)
+
+    def __add_tag(self, element: etree.Element):
+        """Count the tag of the provided element.
+
+        Parameters
+        ----------
+        element: etree.Element, required
+            The element whose tag to count.
+        """
+        tag = str(element.tag)
+        self.__tag_counts[tag] = self.__tag_counts.get(tag, 0) + 1
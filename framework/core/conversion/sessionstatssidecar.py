@@ -0,0 +1,180 @@
+"""Defines the record of the session statistics saved next to a session file."""
+from datetime import date
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Tuple
+import json
+import logging
+
+SIDECAR_DIRECTORY = '.session-stats'
+
+
+class SessionStatsSidecar:
+    """Holds the statistics of a session as they are needed by the corpus root file.
+
+    The record is saved when the session is converted, so the root file
+    can be built without parsing the session file again.
+    """
+
+    def __init__(self, session_date: date, num_words: int, num_speeches: int,
+                 tag_counts: Dict[str, int], speaker_ids: List[str],
+                 gov_members: List[str]):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        session_date: date, required
+            The date of the session.
+        num_words: int, required
+            The number of words of the session.
+        num_speeches: int, required
+            The number of speeches of the session.
+        tag_counts: dict of (str, int), required
+            The values of the `tagUsage` elements of the session.
+        speaker_ids: list of str, required
+            The unique ids of the speakers.
+        gov_members: list of str, required
+            The unique ids of the speakers who are government members.
+        """
+        self.__session_date = session_date
+        self.__num_words = num_words
+        self.__num_speeches = num_speeches
+        self.__tag_counts = tag_counts
+        self.__speaker_ids = speaker_ids
+        self.__gov_members = gov_members
+
+    def get_session_date(self) -> date:
+        """Get the session date.
+
+        Returns
+        -------
+        session_date: datetime.date
+            The date of the session.
+        """
+        return self.__session_date
+
+    def get_num_words(self) -> int:
+        """Get the number of words from the session transcription.
+
+        Returns
+        -------
+        num_words: int
+            The number of words in the transcription.
+        """
+        return self.__num_words
+
+    def get_num_speeches(self) -> int:
+        """Get the number of utterances.
+
+        Returns
+        -------
+        num_speeches: int
+            The number of speeches in the transcription.
+        """
+        return self.__num_speeches
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Get the number of times each tag appears in the document.
+
+        Returns
+        -------
+        tag_counts: dict of (str, int)
+            A dictionary containing each tag and the number of times it appears in the document.
+        """
+        return dict(self.__tag_counts)
+
+    def get_speaker_ids(self) -> Tuple[List[str], List[str]]:
+        """Get the ids of the speakers of the session.
+
+        Returns
+        -------
+        (speaker_ids, gov_members):  tuple of list of str
+            The list of unique speaker ids, and the list of unique government members.
+        """
+        return list(self.__speaker_ids), list(self.__gov_members)
+
+    def save(self, session_file: str):
+        """Save the record next to the session file.
+
+        Parameters
+        ----------
+        session_file: str, required
+            The path of the session XML file.
+        """
+        sidecar_path = get_sidecar_path(session_file)
+        sidecar_path.parent.mkdir(exist_ok=True)
+        session_date = None
+        if self.__session_date is not None:
+            session_date = self.__session_date.isoformat()
+        contents = {
+            'session_date': session_date,
+            'num_words': self.__num_words,
+            'num_speeches': self.__num_speeches,
+            'tag_counts': self.__tag_counts,
+            'speaker_ids': self.__speaker_ids,
+            'government_members': self.__gov_members
+        }
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(contents, f, ensure_ascii=False)
+
+
+def get_sidecar_path(session_file: str) -> Path:
+    """Get the path of the statistics record of the session file.
+
+    Parameters
+    ----------
+    session_file: str, required
+        The path of the session XML file.
+
+    Returns
+    -------
+    sidecar_path: Path
+        The path of the JSON file containing the statistics of the session.
+    """
+    session_file = Path(session_file)
+    return session_file.parent / SIDECAR_DIRECTORY / f'{session_file.stem}.json'
+
+
+def load_session_stats(session_file: str) -> SessionStatsSidecar:
+    """Load the statistics record of the session file.
+
+    Parameters
+    ----------
+    session_file: str, required
+        The path of the session XML file.
+
+    Returns
+    -------
+    session_stats: SessionStatsSidecar
+        The statistics of the session if the record exists; otherwise None.
+    """
+    sidecar_path = get_sidecar_path(session_file)
+    if not sidecar_path.exists():
+        return None
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            contents = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning("Could not read session statistics %s: %r.",
+                        sidecar_path, e)
+        return None
+    session_date = contents['session_date']
+    return SessionStatsSidecar(
+        None if session_date is None else date.fromisoformat(session_date),
+        contents['num_words'], contents['num_speeches'],
+        contents['tag_counts'], contents['speaker_ids'],
+        contents['government_members'])
+
+
+def remove_session_stats(session_file: str):
+    """Remove the statistics record of the session file if it exists.
+
+    Parameters
+    ----------
+    session_file: str, required
+        The path of the session XML file.
+    """
+    sidecar_path = get_sidecar_path(session_file)
+    if sidecar_path.exists():
+        sidecar_path.unlink()
@@ -0,0 +1,93 @@
+"""Defines a class that loads session transcripts ahead of their conversion."""
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from framework.core.conversion.jsonutils import SessionTranscript
+from typing import Generator
+from typing import Iterable
+
+
+class TranscriptPrefetcher:
+    """Loads the upcoming session transcripts in background threads.
+
+    At most `read_ahead` transcripts are loaded beyond the one being converted,
+    so the memory used by the loaded transcripts stays bounded.
+    """
+
+    def __init__(self, input_files: Iterable[str], read_ahead: int = 2):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        input_files: iterable of str, required
+            The paths of the session transcripts in the order of their conversion.
+        read_ahead: int, optional
+            The number of transcripts to load ahead of the current one.
+            When 0, each transcript is loaded only when it is requested.
+        """
+        self.__input_files = iter(input_files)
+        self.__read_ahead = read_ahead
+        self.__executor = None
+        if read_ahead > 0:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=read_ahead, thread_name_prefix='transcript-reader')
+        self.__pending = deque()
+
+    def __enter__(self):
+        """Enter the runtime context of the prefetcher."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop loading transcripts when leaving the runtime context."""
+        self.close()
+
+    def __iter__(self) -> Generator[Future, None, None]:
+        """Iterate over the transcripts in the order of the input files.
+
+        Returns
+        -------
+        transcripts: generator of Future
+            The future results of loading each transcript as a SessionTranscript.
+            Loading errors are raised when the result of the future is requested.
+        """
+        self.__fill()
+        while len(self.__pending) > 0:
+            transcript = self.__pending.popleft()
+            self.__fill()
+            yield transcript
+
+    def close(self):
+        """Stop the background threads and discard the transcripts not yet requested."""
+        self.__pending.clear()
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+
+    def __fill(self):
+        """Start loading transcripts until the read-ahead limit is reached."""
+        while len(self.__pending) <= self.__read_ahead:
+            input_file = next(self.__input_files, None)
+            if input_file is None:
+                return
+            self.__pending.append(self.__load(input_file))
+
+    def __load(self, input_file: str) -> Future:
+        """Start loading the specified transcript.
+
+        Parameters
+        ----------
+        input_file: str, required
+            The path of the session transcript.
+
+        Returns
+        -------
+        transcript: Future
+            The future result of loading the transcript.
+        """
+        if self.__executor is not None:
+            return self.__executor.submit(SessionTranscript, input_file)
+        transcript = Future()
+        try:
+            transcript.set_result(SessionTranscript(input_file))
+        except Exception as e:
+            transcript.set_exception(e)
+        return transcript
@@ -0,0 +1,158 @@
+"""Defines a class for counting the words of session transcripts."""
+from framework.core.linguisticannotation.constants import MODEL
+from typing import Iterable
+import logging
+
+
+class TokenizerBackend:
+    """Constants for the backends used to tokenize text into words."""
+
+    Blank = "blank"
+    Model = "model"
+
+
+class WordCounter:
+    """Counts words using a lazily loaded spaCy tokenizer."""
+
+    def __init__(self,
+                 backend: str = TokenizerBackend.Model,
+                 batch_length: int = 100000):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        backend: str, optional
+            The backend of the tokenizer. `model` (default) uses the tokenizer
+            of the full Romanian model; `blank` uses the rules of a blank
+            Romanian pipeline without loading any model weights, which is
+            faster but was not checked to give the same counts as the model.
+        batch_length: int, optional
+            The approximate number of characters of each batch of text sent to the tokenizer.
+        """
+        if backend not in [TokenizerBackend.Blank, TokenizerBackend.Model]:
+            raise ValueError(f"Unknown tokenizer backend '{backend}'.")
+        self.__backend = backend
+        self.__batch_length = batch_length
+        self.__tokenizer = None
+
+    @property
+    def tokenizer(self):
+        """Get the tokenizer, loading it on first use."""
+        if self.__tokenizer is None:
+            self.__tokenizer = self.__load_tokenizer()
+        return self.__tokenizer
+
+    @property
+    def batch_length(self) -> int:
+        """Get the approximate number of characters of a batch of text."""
+        return self.__batch_length
+
+    def count_words(self, text_parts: Iterable[str]) -> int:
+        """Count the words from the provided text.
+
+        Parameters
+        ----------
+        text_parts: iterable of str, required
+            The consecutive parts of the text, e.g. as returned by `itertext()`.
+
+        Returns
+        -------
+        num_words: int
+            The number of tokens in the concatenated text.
+        """
+        accumulator = WordCountAccumulator(self)
+        accumulator.add(text_parts)
+        return accumulator.num_words
+
+    def count_batch_words(self, text: str) -> int:
+        """Count the words of a batch of text.
+
+        Parameters
+        ----------
+        text: str, required
+            The text of the batch.
+
+        Returns
+        -------
+        num_words: int
+            The number of tokens in the text.
+        """
+        return len(self.tokenizer(text))
+
+    def __load_tokenizer(self):
+        """Load the tokenizer of the configured backend.
+
+        Returns
+        -------
+        tokenizer: spacy.tokenizer.Tokenizer
+            The tokenizer.
+        """
+        # spaCy is imported here in order to avoid its start-up cost
+        # for processes that never count words.
+        import spacy
+        if self.__backend == TokenizerBackend.Model:
+            logging.info("Loading the tokenizer of %s.", MODEL)
+            nlp = spacy.load(MODEL,
+                             exclude=[
+                                 'tok2vec', 'tagger', 'parser', 'lemmatizer',
+                                 'senter', 'ner', 'attribute_ruler'
+                             ])
+        else:
+            logging.info("Loading blank Romanian tokenizer.")
+            nlp = spacy.blank('ro')
+        return nlp.tokenizer
+
+
+class WordCountAccumulator:
+    """Counts the words of a text whose parts are provided incrementally.
+
+    The parts are grouped into batches which are closed only between a part that
+    ends with whitespace and a part that does not start with whitespace; since the
+    tokenizer never builds a token across such a boundary, the number of tokens is
+    the same as when tokenizing the whole text at once.
+    """
+
+    def __init__(self, word_counter: WordCounter):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        word_counter: WordCounter, required
+            The word counter used to count the words of each batch.
+        """
+        self.__word_counter = word_counter
+        self.__batch = []
+        self.__batch_length = 0
+        self.__num_words = 0
+
+    @property
+    def num_words(self) -> int:
+        """Get the number of words of the text added so far."""
+        if len(self.__batch) == 0:
+            return self.__num_words
+        batch_words = self.__word_counter.count_batch_words(''.join(
+            self.__batch))
+        return self.__num_words + batch_words
+
+    def add(self, text_parts: Iterable[str]):
+        """Add the next consecutive parts of the text.
+
+        Parameters
+        ----------
+        text_parts: iterable of str, required
+            The consecutive parts of the text.
+        """
+        max_length = self.__word_counter.batch_length
+        for part in text_parts:
+            if len(part) == 0:
+                continue
+            if self.__batch_length >= max_length and self.__batch[-1][
+                    -1].isspace() and not part[0].isspace():
+                self.__count_batch()
+            self.__batch.append(part)
+            self.__batch_length += len(part)
+
+    def __count_batch(self):
+        """Count the words of the current batch and start a new one."""
+        self.__num_words = self.num_words
+        self.__batch, self.__batch_length = [], 0
@@ -0,0 +1,136 @@
+"""Defines a class that saves XML files in the background."""
+from concurrent.futures import Future
+from framework.core.xmlutils import save_xml
+from lxml import etree
+import queue
+import threading
+
+
+class WriteBehindQueue:
+    """Saves XML trees to their files in a background thread.
+
+    The queue holds at most `max_pending` trees waiting to be saved;
+    when it is full, adding a tree blocks until a tree is saved,
+    so the memory used by the pending trees stays bounded.
+    """
+
+    def __init__(self, max_pending: int = 2):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        max_pending: int, optional
+            The maximum number of trees waiting to be saved.
+            When 0, each tree is saved as soon as it is added.
+        """
+        self.__max_pending = max_pending
+        self.__saved = {}
+        self.__queue = None
+        self.__thread = None
+        if max_pending > 0:
+            self.__queue = queue.Queue(maxsize=max_pending)
+            self.__thread = threading.Thread(target=self.__save_pending,
+                                             name='xml-writer',
+                                             daemon=True)
+            self.__thread.start()
+
+    @property
+    def max_pending(self) -> int:
+        """Get the maximum number of trees waiting to be saved."""
+        return self.__max_pending
+
+    def __enter__(self):
+        """Enter the runtime context of the queue."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Save the pending trees when leaving the runtime context."""
+        self.close()
+
+    def save(self, xml_tree: etree._ElementTree, output_file: str):
+        """Add the tree to the queue of trees to save.
+
+        The tree must not be changed after it is added to the queue.
+
+        Parameters
+        ----------
+        xml_tree: etree._ElementTree, required
+            The XML tree to save.
+        output_file: str, required
+            The path of the output file.
+        """
+        saved = Future()
+        self.__saved[output_file] = saved
+        if self.__queue is None:
+            self.__save(xml_tree, output_file, saved)
+        else:
+            self.__queue.put((xml_tree, output_file, saved))
+
+    def is_saved(self, output_file: str) -> bool:
+        """Check whether the tree added for the output file was saved.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the output file.
+
+        Returns
+        -------
+        is_saved: bool
+            True if saving the tree completed or no tree was added for the file;
+            otherwise False.
+        """
+        saved = self.__saved.get(output_file)
+        return saved is None or saved.done()
+
+    def wait(self, output_file: str):
+        """Wait until the tree added for the output file is saved.
+
+        Parameters
+        ----------
+        output_file: str, required
+            The path of the output file.
+
+        Raises
+        ------
+        Exception
+            The error raised while saving the tree, if any.
+        """
+        saved = self.__saved.pop(output_file, None)
+        if saved is not None:
+            saved.result()
+
+    def close(self):
+        """Save the pending trees and stop the background thread."""
+        if self.__thread is None:
+            return
+        self.__queue.put(None)
+        self.__thread.join()
+        self.__thread = None
+
+    def __save_pending(self):
+        """Save the trees from the queue until the end marker is received."""
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                return
+            self.__save(*item)
+
+    def __save(self, xml_tree: etree._ElementTree, output_file: str,
+               saved: Future):
+        """Save the tree and record the result.
+
+        Parameters
+        ----------
+        xml_tree: etree._ElementTree, required
+            The XML tree to save.
+        output_file: str, required
+            The path of the output file.
+        saved: Future, required
+            The future receiving the result of saving the tree.
+        """
+        try:
+            save_xml(xml_tree, output_file)
+            saved.set_result(None)
+        except Exception as e:
+            saved.set_exception(e)
@@ -9,21 +9,24 @@ from framework.core.xmlutils import XmlElements
 from lxml import etree
 from typing import Callable
 from typing import Dict
-from typing import List
+from typing import Iterable
+from typing import Union
 
 
 class XmlTagCounter(XmlDataReader):
     """Counts the occurrences of XML tags."""
 
-    def __init__(self, xml_file: str):
+    def __init__(self, xml_file: str, xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_file: str, required
             The XML file for which to count tags.
+        xml_tree: etree.ElementTree, optional
+            The already loaded XML tree of the file.
         """
-        XmlDataReader.__init__(self, xml_file)
+        XmlDataReader.__init__(self, xml_file, xml_tree)
 
     def get_tag_counts(self) -> Dict[str, int]:
         """Compute the number of times each tag appears in the document.
@@ -44,19 +47,23 @@ class XmlTagCounter(XmlDataReader):
 class SessionStatsCalculator(XmlTagCounter):
     """Calculate the statistics for one session transcript."""
 
-    def __init__(self, xml_file: str, word_tokenizer: Callable[[str],
-                                                               List[str]]):
+    def __init__(self,
+                 xml_file: str,
+                 word_counter: Callable[[Iterable[str]], int],
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_file: str, required
             The file containing session transcript in XML format.
-        word_tokenizer: callback, required
-            A callback function that accepts a string as input, tokenizes it and returns a list of tokens.
+        word_counter: callback, required
+            A callback function that accepts the consecutive parts of a text and returns the number of words in the text.
+        xml_tree: etree.ElementTree, optional
+            The already loaded XML tree of the session transcript.
         """
-        XmlTagCounter.__init__(self, xml_file)
-        self.__tokenizer = word_tokenizer
+        XmlTagCounter.__init__(self, xml_file, xml_tree)
+        self.__word_counter = word_counter
 
     def get_num_words(self) -> int:
         """Compute the number of words from the session transcription.
@@ -70,8 +77,7 @@ class SessionStatsCalculator(XmlTagCounter):
         for div in self.xml_root.iterdescendants(XmlElements.div):
             if div.get(XmlAttributes.element_type) == "debateSection":
                 debate_section = div
-        text = "".join(debate_section.itertext())
-        num_words = len(self.__tokenizer(text))
+        num_words = self.__word_counter(debate_section.itertext())
         return num_words
 
     def get_num_speeches(self) -> int:
@@ -92,7 +98,10 @@ class SessionStatsCalculator(XmlTagCounter):
 class XmlTagCountWriter(XmlDataManipulator):
     """Update the tag counts in the XML file."""
 
-    def __init__(self, xml_file: str, tag_map: Dict[str, str]):
+    def __init__(self,
+                 xml_file: str,
+                 tag_map: Dict[str, str],
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -101,8 +110,10 @@ class XmlTagCountWriter(XmlDataManipulator):
             The path of the XML file for which to update the tag counts.
         tag_map: dictionary of (str, str), required
             The dictionary that maps the name of the 'gi' attribute to tag names of XML elements.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared with other manipulators; when provided the changes are kept in memory.
         """
-        XmlDataManipulator.__init__(self, xml_file)
+        XmlDataManipulator.__init__(self, xml_file, xml_tree)
         self.__tag_map = tag_map
 
     def update_tage_usage(self, tag_counts: Dict[str, int]):
@@ -150,8 +161,11 @@ class XmlTagCountWriter(XmlDataManipulator):
 class SessionStatsWriter(XmlTagCountWriter):
     """Update the values for tags containing session statistics."""
 
-    def __init__(self, xml_file: str, stats_provider: SessionStatsCalculator,
-                 tag_map: Dict[str, str]):
+    def __init__(self,
+                 xml_file: str,
+                 stats_provider: SessionStatsCalculator,
+                 tag_map: Dict[str, str],
+                 xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
@@ -159,11 +173,14 @@ class SessionStatsWriter(XmlTagCountWriter):
         xml_file: str, required
             The path of the XML file for which to update the statistics.
         stats_provider: SessionStatsCalculator, required
-            The object that provides the statistics values.
+            The object that provides the statistics values; any object with the same
+            `get_tag_counts`, `get_num_words` and `get_num_speeches` methods can be used.
         tag_map: dictionary of (str, str), required
             The dictionary that maps the name of the 'gi' attribute to tag names of XML elements.
+        xml_tree: etree.ElementTree, optional
+            The XML tree shared with other manipulators; when provided the changes are kept in memory.
         """
-        XmlTagCountWriter.__init__(self, xml_file, tag_map)
+        XmlTagCountWriter.__init__(self, xml_file, tag_map, xml_tree)
         self.__provider = stats_provider
 
     def update_statistics(self):
@@ -194,15 +211,17 @@ class SessionStatsWriter(XmlTagCountWriter):
 class SessionStatsReader(XmlDataManipulator):
     """Reads the statistics from session XML file."""
 
-    def __init__(self, xml_file: str):
+    def __init__(self, xml_file: str, xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_file: str, required
             The path of the session XML file from where to read stats.
+        xml_tree: etree.ElementTree, optional
+            The XML tree of the session; when provided the file is not loaded.
         """
-        XmlDataManipulator.__init__(self, xml_file)
+        XmlDataManipulator.__init__(self, xml_file, xml_tree)
 
     def get_session_date(self) -> datetime.date:
         """Get the session date.
@@ -280,19 +299,74 @@ class SessionStatsReader(XmlDataManipulator):
         return None
 
 
+class CorpusStatsAccumulator:
+    """Sums the statistics of the sessions added to the corpus."""
+
+    def __init__(self):
+        """Create a new instance of the class."""
+        self.__num_words = 0
+        self.__num_speeches = 0
+        self.__tag_counts = {}
+
+    def add(self, stats_provider: SessionStatsReader):
+        """Add the statistics of a session.
+
+        Parameters
+        ----------
+        stats_provider: SessionStatsReader, required
+            The provider of the session statistics.
+        """
+        self.__num_words += stats_provider.get_num_words()
+        self.__num_speeches += stats_provider.get_num_speeches()
+        for tag, num_occurences in stats_provider.get_tag_counts().items():
+            self.__tag_counts[tag] = self.__tag_counts.get(tag,
+                                                           0) + num_occurences
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """Get the number of times each tag appears in the added sessions.
+
+        Returns
+        -------
+        tag_counts: dict of (str, int)
+            A dictionary containing each tag and the number of times it appears in the sessions.
+        """
+        return dict(self.__tag_counts)
+
+    def get_num_words(self) -> int:
+        """Get the number of words of the added sessions.
+
+        Returns
+        -------
+        num_words: int
+            The number of words in the sessions.
+        """
+        return self.__num_words
+
+    def get_num_speeches(self) -> int:
+        """Get the number of speeches of the added sessions.
+
+        Returns
+        -------
+        num_speeches: int
+            The number of speeches in the sessions.
+        """
+        return self.__num_speeches
+
+
 class CorpusStatsWriter:
     """Updates the statistics for the root corpus file."""
 
     def __init__(self, xml_root: etree.Element,
-                 stats_provider: SessionStatsReader):
+                 stats_provider: Union[SessionStatsReader,
+                                       CorpusStatsAccumulator]):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_root: etree.Element, required
             The root element of the corpus file.
-        stats_provider: SessionStatsReader, required
-            The provider of the session statistics.
+        stats_provider: SessionStatsReader or CorpusStatsAccumulator, required
+            The provider of the statistics to add to the corpus.
         """
         self.__xml_root = xml_root
         self.__provider = stats_provider
@@ -1,7 +1,16 @@
 """Utilities for XML conversion."""
+from argparse import ArgumentParser
+from argparse import Namespace
 from lxml import etree
+from typing import Iterable
 from typing import List
 from pathlib import Path
+import copy
+import io
+import itertools
+import threading
+
+XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
 
 
 class XmlElements:
@@ -54,6 +63,7 @@ class XmlElements:
     title = '{http://www.tei-c.org/ns/1.0}title'
     titleStmt = '{http://www.tei-c.org/ns/1.0}titleStmt'
     u = '{http://www.tei-c.org/ns/1.0}u'
+    vocal = '{http://www.tei-c.org/ns/1.0}vocal'
     w = '{http://www.tei-c.org/ns/1.0}w'
 
 
@@ -140,6 +150,299 @@ class Taxonomy:
     Sitting = '#parla.sitting'
 
 
+class SerializationModes:
+    """Constants for the modes of saving XML files."""
+
+    Pretty = "pretty"
+    Compact = "compact"
+    Canonical = "canonical"
+
+
+class XmlParserProfile:
+    """The settings of the parser used for loading XML files.
+
+    The parser is created once for each thread and reused for every file
+    loaded by that thread.
+    """
+
+    def __init__(self, huge_tree: bool = False, collect_ids: bool = True):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        huge_tree: bool, optional
+            When True, the security limits of the parser on the size and
+            depth of the tree are disabled.
+        collect_ids: bool, optional
+            When False, the parser does not build the hash table of `xml:id`
+            values, which makes loading faster but disables the lookup of
+            elements by id.
+        """
+        self.__huge_tree = huge_tree
+        self.__collect_ids = collect_ids
+        self.__local = threading.local()
+
+    @property
+    def parser(self) -> etree.XMLParser:
+        """Get the parser of the current thread."""
+        parser = getattr(self.__local, 'parser', None)
+        if parser is None:
+            parser = etree.XMLParser(remove_blank_text=True,
+                                     huge_tree=self.__huge_tree,
+                                     collect_ids=self.__collect_ids)
+            self.__local.parser = parser
+        return parser
+
+    def parse(self, file_name: str) -> etree._ElementTree:
+        """Parse the specified XML file.
+
+        Parameters
+        ----------
+        file_name: str, required
+            The name of the XML file.
+
+        Returns
+        -------
+        xml_tree: etree.ElementTree
+            The XML tree from the file.
+        """
+        return etree.parse(file_name, self.parser)
+
+
+class XmlSerializationProfile:
+    """The settings used for saving XML files."""
+
+    def __init__(self, mode: str = SerializationModes.Pretty):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        mode: str, optional
+            The serialization mode. `pretty` (default) indents the elements,
+            `compact` writes the XML without indentation and `canonical`
+            writes the canonical form (C14N) of the XML.
+        """
+        modes = [
+            SerializationModes.Pretty, SerializationModes.Compact,
+            SerializationModes.Canonical
+        ]
+        if mode not in modes:
+            raise ValueError(f"Unknown serialization mode '{mode}'.")
+        self.__mode = mode
+
+    @property
+    def mode(self) -> str:
+        """Get the serialization mode."""
+        return self.__mode
+
+    def write(self, xml_tree: etree._ElementTree, file_name: str):
+        """Save the provided XML tree to the specified file.
+
+        Parameters
+        ----------
+        xml_tree: etree.ElementTree, required
+            The XML tree to save.
+        file_name: str, required
+            The file where to save the XML; can also be a file object opened in binary mode.
+        """
+        if self.__mode == SerializationModes.Canonical:
+            xml_tree.write_c14n(file_name)
+            return
+        xml_tree.write(file_name,
+                       pretty_print=self.__mode == SerializationModes.Pretty,
+                       encoding='utf-8',
+                       xml_declaration=True)
+
+    def serialize(self, xml_tree: etree._ElementTree) -> bytes:
+        """Serialize the provided XML tree.
+
+        Parameters
+        ----------
+        xml_tree: etree.ElementTree, required
+            The XML tree to serialize.
+
+        Returns
+        -------
+        contents: bytes
+            The contents of the file that would be saved by `write`.
+        """
+        buffer = io.BytesIO()
+        self.write(xml_tree, buffer)
+        return buffer.getvalue()
+
+    def write_streamed(self, xml_root: etree.Element,
+                       children: Iterable[etree.Element], file_name: str):
+        """Save the root element with the provided children, one child at a time.
+
+        The children are written with `etree.xmlfile` without being added to
+        the root, so they can be created while the file is written. The file
+        has the same contents as the one saved by `write` for a root containing
+        the children. The canonical form can't be written incrementally, so in
+        canonical mode, as well as when there are no children, the children are
+        moved to a copy of the root which is saved by `write`.
+
+        Parameters
+        ----------
+        xml_root: etree.Element, required
+            The root element; its own children are not written.
+        children: iterable of etree.Element, required
+            The children to write in the root element.
+        file_name: str, required
+            The file where to save the XML.
+        """
+        children = iter(children)
+        first_child = next(children, None)
+        if self.__mode == SerializationModes.Canonical or first_child is None:
+            root = etree.Element(xml_root.tag,
+                                 xml_root.attrib,
+                                 nsmap=xml_root.nsmap)
+            if first_child is not None:
+                root.append(first_child)
+                root.extend(children)
+            self.write(etree.ElementTree(root), file_name)
+            return
+        pretty_print = self.__mode == SerializationModes.Pretty
+        namespace = xml_root.nsmap.get(None)
+        attributes = {
+            get_prefixed_name(name): value
+            for name, value in xml_root.attrib.items()
+        }
+        with open(file_name, 'wb') as output_file:
+            with etree.xmlfile(output_file, encoding='UTF-8') as xml_file:
+                xml_file.write_declaration()
+                with xml_file.element(xml_root.tag,
+                                      attributes,
+                                      nsmap=xml_root.nsmap):
+                    for child in itertools.chain([first_child], children):
+                        child = remove_default_namespace(child, namespace)
+                        if pretty_print:
+                            etree.indent(child, space='  ', level=1)
+                            xml_file.write('\n  ')
+                        xml_file.write(child)
+                    if pretty_print:
+                        xml_file.write('\n')
+            if pretty_print:
+                output_file.write(b'\n')
+
+
+def get_prefixed_name(name: str) -> str:
+    """Get the name of an attribute as written in the XML file.
+
+    Parameters
+    ----------
+    name: str, required
+        The name of the attribute, qualified with its namespace.
+
+    Returns
+    -------
+    prefixed_name: str
+        The name with the `xml` prefix for the attributes from the XML namespace;
+        the provided name otherwise.
+    """
+    qualified_name = etree.QName(name)
+    if qualified_name.namespace == XML_NAMESPACE:
+        return f'xml:{qualified_name.localname}'
+    return name
+
+
+def remove_default_namespace(element: etree.Element,
+                             namespace: str) -> etree.Element:
+    """Copy the element without the default namespace of its parent.
+
+    The copy inherits the default namespace when it is written in its parent
+    element, instead of declaring the namespace again.
+
+    Parameters
+    ----------
+    element: etree.Element, required
+        The element to copy.
+    namespace: str, required
+        The default namespace of the parent element, or None.
+
+    Returns
+    -------
+    element: etree.Element
+        The copy of the element, without tail.
+    """
+    element = copy.deepcopy(element)
+    element.tail = None
+    if namespace is None:
+        return element
+    prefix = f'{{{namespace}}}'
+    for descendant in element.iter():
+        if isinstance(descendant.tag,
+                      str) and descendant.tag.startswith(prefix):
+            descendant.tag = descendant.tag[len(prefix):]
+    etree.cleanup_namespaces(element)
+    return element
+
+
+parser_profile = XmlParserProfile()
+serialization_profile = XmlSerializationProfile()
+
+
+def configure_xml_profiles(
+        huge_tree: bool = False,
+        collect_ids: bool = True,
+        serialization_mode: str = SerializationModes.Pretty):
+    """Configure the profiles used for loading and saving XML files.
+
+    Parameters
+    ----------
+    huge_tree: bool, optional
+        When True, the security limits of the parser on the size of the tree are disabled.
+    collect_ids: bool, optional
+        When False, the parser does not build the hash table of `xml:id` values.
+    serialization_mode: str, optional
+        The serialization mode: `pretty` (default), `compact` or `canonical`.
+    """
+    global parser_profile, serialization_profile
+    parser_profile = XmlParserProfile(huge_tree, collect_ids)
+    serialization_profile = XmlSerializationProfile(serialization_mode)
+    template_cache.clear()
+
+
+def add_xml_profile_arguments(parser: ArgumentParser):
+    """Add the command-line arguments that configure the XML profiles.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser, required
+        The parser of the command-line arguments.
+    """
+    parser.add_argument(
+        '--xml-format',
+        help="The format of the saved XML files: indented, without "
+        "indentation, or in canonical form (C14N).",
+        choices=[
+            SerializationModes.Pretty, SerializationModes.Compact,
+            SerializationModes.Canonical
+        ],
+        default=SerializationModes.Pretty)
+    parser.add_argument(
+        '--huge-tree',
+        help="When present, disable the limits of the XML parser on the "
+        "size of the loaded files.",
+        action='store_true')
+    parser.add_argument(
+        '--no-collect-ids',
+        help="When present, the XML parser does not index the xml:id "
+        "attributes of the loaded files.",
+        action='store_false',
+        dest='collect_ids')
+
+
+def configure_xml_profiles_from_arguments(args: Namespace):
+    """Configure the XML profiles from the command-line arguments.
+
+    Parameters
+    ----------
+    args: argparse.Namespace, required
+        The command-line arguments added by `add_xml_profile_arguments`.
+    """
+    configure_xml_profiles(args.huge_tree, args.collect_ids, args.xml_format)
+
+
 def load_xml(file_name):
     """Load the specified XML file.
 
@@ -153,9 +456,7 @@ def load_xml(file_name):
     xml_tree: etree.ElementTree
         The XML tree from the file.
     """
-    parser = etree.XMLParser(remove_blank_text=True)
-    xml_tree = etree.parse(file_name, parser)
-    return xml_tree
+    return parser_profile.parse(file_name)
 
 
 def save_xml(xml: etree._ElementTree, file_name: str):
@@ -166,27 +467,160 @@ def save_xml(xml: etree._ElementTree, file_name: str):
     xml : etree.ElementRoot, required
         The XML tree to save to disk.
     file_name : str, required
+        The file where to save the XML; can also be a file object opened in binary mode.
+    """
+    serialization_profile.write(xml, file_name)
+
+
+def save_xml_streamed(xml_root: etree.Element,
+                      children: Iterable[etree.Element], file_name: str):
+    """Save the root element with the provided children, one child at a time.
+
+    Parameters
+    ----------
+    xml_root: etree.Element, required
+        The root element; its own children are not written.
+    children: iterable of etree.Element, required
+        The children to write in the root element.
+    file_name: str, required
         The file where to save the XML.
     """
-    xml.write(file_name,
-              pretty_print=True,
-              encoding='utf-8',
-              xml_declaration=True)
+    serialization_profile.write_streamed(xml_root, children, file_name)
+
+
+def serialize_xml(xml: etree._ElementTree) -> bytes:
+    """Serialize the provided XML tree the same way as it is saved by `save_xml`.
+
+    Parameters
+    ----------
+    xml : etree.ElementRoot, required
+        The XML tree to serialize.
+
+    Returns
+    -------
+    contents: bytes
+        The serialized XML tree.
+    """
+    return serialization_profile.serialize(xml)
+
+
+class XmlTemplateCache:
+    """Keeps the parsed XML templates in memory and provides copies of them."""
+
+    def __init__(self):
+        """Create a new instance of the class."""
+        self.__templates = {}
+
+    def get_template(self, file_name: str) -> etree._ElementTree:
+        """Get a copy of the XML tree from the specified template file.
+
+        The template file is parsed only the first time it is requested,
+        or when it was changed since it was last parsed. The whitespace-only
+        text of the template is removed, as it would be by saving and loading
+        the file again once the elements that hold it get children.
+
+        Parameters
+        ----------
+        file_name: str, required
+            The path of the template file.
+
+        Returns
+        -------
+        xml_tree: etree.ElementTree
+            A deep copy of the template XML tree that can be safely modified.
+        """
+        file_path = Path(file_name).resolve()
+        file_stat = file_path.stat()
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self.__templates.get(file_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, remove_blank_text(load_xml(file_name)))
+            self.__templates[file_path] = cached
+        _, xml_tree = cached
+        return copy.deepcopy(xml_tree)
+
+    def clear(self):
+        """Remove all templates from the cache."""
+        self.__templates.clear()
+
+
+template_cache = XmlTemplateCache()
+
+
+def remove_blank_text(xml_tree: etree._ElementTree) -> etree._ElementTree:
+    """Remove the whitespace-only text and tails from the elements of the XML tree.
+
+    The parser removes only the whitespace between elements, so an element
+    that holds only whitespace keeps it. Such whitespace would be mixed with
+    the children added to the element, and counted as a word.
+
+    Parameters
+    ----------
+    xml_tree: etree.ElementTree, required
+        The XML tree.
+
+    Returns
+    -------
+    xml_tree: etree.ElementTree
+        The provided XML tree.
+    """
+    for node in xml_tree.iter():
+        if isinstance(node.tag, str) and is_blank(node.text):
+            node.text = None
+        if is_blank(node.tail):
+            node.tail = None
+    return xml_tree
+
+
+def is_blank(text: str) -> bool:
+    """Determine whether the text contains only whitespace.
+
+    Parameters
+    ----------
+    text: str, required
+        The text, or None.
+
+    Returns
+    -------
+    is_blank: bool
+        True if the text is not None and contains only whitespace; False otherwise.
+    """
+    return text is not None and len(text.strip()) == 0
+
+
+def load_xml_template(file_name: str) -> etree._ElementTree:
+    """Load the specified XML template file using the template cache.
+
+    Parameters
+    ----------
+    file_name: str, required
+        The name of the XML template file.
+
+    Returns
+    -------
+    xml_tree: etree.ElementTree
+        A copy of the XML tree from the template file.
+    """
+    return template_cache.get_template(file_name)
 
 
 class XmlDataReader:
     """Provide basic abstractions for reading a XML file."""
 
-    def __init__(self, xml_file: str):
+    def __init__(self, xml_file: str, xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_file: str, required
             The path of the XML file.
+        xml_tree: etree.ElementTree, optional
+            An already loaded XML tree. When provided, the file is not parsed
+            and the instance works directly on the given tree.
         """
         self.__xml_file = xml_file
-        self.__xml_tree = load_xml(xml_file)
+        self.__xml_tree = xml_tree if xml_tree is not None else load_xml(
+            xml_file)
 
     @property
     def xml_file(self) -> str:
@@ -207,15 +641,25 @@ class XmlDataReader:
 class XmlDataManipulator(XmlDataReader):
     """Provide basic abstractions for manipulating a XML file."""
 
-    def __init__(self, xml_file: str):
+    def __init__(self, xml_file: str, xml_tree: etree._ElementTree = None):
         """Create a new instance of the class.
 
         Parameters
         ----------
         xml_file: str, required
             The path of the XML file.
+        xml_tree: etree.ElementTree, optional
+            An XML tree shared with other manipulators. When provided, the
+            changes are kept in memory and the owner of the tree is
+            responsible for saving it.
         """
-        XmlDataReader.__init__(self, xml_file)
+        XmlDataReader.__init__(self, xml_file, xml_tree)
+        self.__is_shared_tree = xml_tree is not None
+
+    @property
+    def is_shared_tree(self) -> bool:
+        """Return True if the XML tree is shared with other manipulators; otherwise False."""
+        return self.__is_shared_tree
 
     def save_changes(self, output_file: str = None):
         """Save the changes made to the XML tree.
@@ -224,8 +668,11 @@ class XmlDataManipulator(XmlDataReader):
         ----------
         output_file: str, optional
             The file where to save the changes.
-            If `None` then changes will be saved to the input file.
+            If `None` then changes will be saved to the input file, unless
+            the XML tree is shared in which case the changes are kept in memory.
         """
+        if output_file is None and self.is_shared_tree:
+            return
         xml_file = output_file if output_file is not None else self.xml_file
         save_xml(self.xml_tree, xml_file)
 
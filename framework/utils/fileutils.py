@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Utility functions for finding data files."""
+from fnmatch import fnmatch
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+from typing import Tuple
+
+
+@lru_cache(maxsize=None)
+def scan_directory(data_directory: str) -> Tuple[Path, ...]:
+    """Scan the specified directory and its subdirectories for files.
+
+    The result is cached, so the directory is scanned only once per run.
+
+    Parameters
+    ----------
+    data_directory: str, required
+        The path of the directory to scan.
+
+    Returns
+    -------
+    files: tuple of Path
+        The sorted paths of the files from the directory tree.
+    """
+    return tuple(
+        sorted(f for f in Path(data_directory).rglob('*') if f.is_file()))
+
+
+def find_files(data_directory: str, file_name_pattern: str) -> List[Path]:
+    """Find the files whose name matches the pattern in the directory tree.
+
+    Parameters
+    ----------
+    data_directory: str, required
+        The path of the directory to search.
+    file_name_pattern: str, required
+        The pattern of the file names.
+
+    Returns
+    -------
+    files: list of Path
+        The sorted paths of the matching files.
+    """
+    return [
+        f for f in scan_directory(str(data_directory))
+        if fnmatch(f.name, file_name_pattern)
+    ]
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+"""Defines a class for counting the speakers of session transcripts."""
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict
+from typing import List
+import json
+import logging
+
+CENSUS_CACHE_VERSION = 1
+
+
+def is_guest(speaker: dict) -> bool:
+    """Determine whether the provided speaker is a guest or a member of the Parliament.
+
+    Parameters
+    ----------
+    speaker: dict, required
+        The speaker.
+
+    Returns
+    -------
+    is_guest: bool
+        True if the speaker is a guest; False if the speaker is a member of the Parliament.
+    """
+    profile_url = speaker['profile_url']
+    return profile_url is None or len(profile_url) == 0
+
+
+def scan_session_speakers(session_file: str) -> Dict[str, dict]:
+    """Count the speakers of the session transcript.
+
+    Parameters
+    ----------
+    session_file: str, required
+        The path of the JSON file containing the session transcript.
+
+    Returns
+    -------
+    speakers: dict of (str, dict)
+        The aggregates of the speakers from the session, keyed by full name.
+        Each aggregate contains the number of sections of the speaker and
+        the first record of the speaker as a guest and as a member.
+    """
+    logging.debug("Reading speakers from %s.", session_file)
+    with open(session_file, 'r', encoding='utf8') as input_file:
+        session = json.load(input_file)
+    if 'sections' not in session:
+        logging.error("Could not find session sections in %s.", session_file)
+        return {}
+
+    speakers = {}
+    for section in session['sections']:
+        speaker = section['speaker']
+        contents = section['contents']
+        if contents is None or len(contents) == 0:
+            continue
+        if speaker is None:
+            logging.warning("Found null speaker in section %s.", section)
+            continue
+        aggregate = speakers.setdefault(speaker['full_name'], {
+            'count': 0,
+            'guest_record': None,
+            'member_record': None
+        })
+        aggregate['count'] += 1
+        record_key = 'guest_record' if is_guest(speaker) else 'member_record'
+        if aggregate[record_key] is None:
+            aggregate[record_key] = speaker
+    return speakers
+
+
+class SpeakerCensus:
+    """Counts the speakers of the session transcripts from a directory.
+
+    The session files are scanned in a pool of processes and only the
+    aggregates of each speaker name are kept. The aggregates of each file
+    can be cached, so the files that did not change are not scanned again.
+    """
+
+    def __init__(self, workers: int = None, cache_file: str = None):
+        """Create a new instance of the class.
+
+        Parameters
+        ----------
+        workers: int, optional
+            The number of processes that scan the session files.
+            When None (default), the number of CPUs is used.
+        cache_file: str, optional
+            The path of the JSON file where to cache the aggregates of each session file.
+            When None (default), all the files are scanned.
+        """
+        self.__workers = workers
+        self.__cache_file = Path(
+            cache_file) if cache_file is not None else None
+
+    def take(self, sessions_directory: str) -> Dict[str, dict]:
+        """Count the speakers of the session transcripts from the directory.
+
+        Parameters
+        ----------
+        sessions_directory: str, required
+            The directory containing the JSON files with session transcripts.
+
+        Returns
+        -------
+        speakers: dict of (str, dict)
+            The aggregates of the speakers keyed by full name, in the order
+            in which the speakers first appear. Each aggregate contains the
+            number of sections of the speaker, the first and last session,
+            whether the speaker appears as a guest and as a member, the profile URL,
+            and the first record of the speaker as a guest and as a member.
+        """
+        session_files = sorted(Path(sessions_directory).glob("*.json"))
+        cache = self.__load_cache()
+        file_states = {f.name: self.__get_file_state(f) for f in session_files}
+        pending_files = [
+            str(f) for f in session_files
+            if cache.get(f.name, {}).get('state') != file_states[f.name]
+        ]
+        logging.info("Scanning %s of %s session files.", len(pending_files),
+                     len(session_files))
+        for session_file, speakers in zip(pending_files,
+                                          self.__scan_files(pending_files)):
+            name = Path(session_file).name
+            cache[name] = {'state': file_states[name], 'speakers': speakers}
+
+        census = {}
+        for session_file in session_files:
+            for full_name, aggregate in cache[
+                    session_file.name]['speakers'].items():
+                update_aggregate(census, full_name, aggregate,
+                                 session_file.stem)
+        self.__save_cache({f.name: cache[f.name] for f in session_files})
+        return census
+
+    def __scan_files(self, session_files: List[str]) -> List[Dict[str, dict]]:
+        """Scan the session files for speakers.
+
+        Parameters
+        ----------
+        session_files: list of str, required
+            The paths of the session files.
+
+        Returns
+        -------
+        speakers: list of dict of (str, dict)
+            The aggregates of the speakers of each session file, in the order of the files.
+        """
+        if self.__workers == 1 or len(session_files) < 2:
+            return [scan_session_speakers(f) for f in session_files]
+        with Pool(processes=self.__workers) as pool:
+            return pool.map(scan_session_speakers, session_files, chunksize=8)
+
+    def __get_file_state(self, session_file: Path) -> List[int]:
+        """Get the size and modification time of the session file.
+
+        Parameters
+        ----------
+        session_file: Path, required
+            The path of the session file.
+
+        Returns
+        -------
+        state: list of int
+            The size and the modification time, in nanoseconds, of the file.
+        """
+        stat = session_file.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def __load_cache(self) -> Dict[str, dict]:
+        """Load the aggregates of the session files from the cache.
+
+        Returns
+        -------
+        cache: dict of (str, dict)
+            The state and the aggregates of the speakers of each cached file, keyed by file name.
+        """
+        if self.__cache_file is None or not self.__cache_file.exists():
+            return {}
+        try:
+            with open(self.__cache_file, 'r', encoding='utf-8') as f:
+                contents = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning("Could not read speaker census cache %s: %r.",
+                            self.__cache_file, e)
+            return {}
+        if contents.get('version') != CENSUS_CACHE_VERSION:
+            return {}
+        return contents['files']
+
+    def __save_cache(self, cache: Dict[str, dict]):
+        """Save the aggregates of the session files to the cache.
+
+        Parameters
+        ----------
+        cache: dict of (str, dict), required
+            The state and the aggregates of the speakers of each file, keyed by file name.
+        """
+        if self.__cache_file is None:
+            return
+        self.__cache_file.parent.mkdir(parents=True, exist_ok=True)
+        contents = {'version': CENSUS_CACHE_VERSION, 'files': cache}
+        temp_file = self.__cache_file.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(contents, f, ensure_ascii=False)
+        temp_file.replace(self.__cache_file)
+
+
+def update_aggregate(census: Dict[str, dict], full_name: str, aggregate: dict,
+                     session_name: str):
+    """Add the aggregate of a speaker from a session to the census.
+
+    Parameters
+    ----------
+    census: dict of (str, dict), required
+        The aggregates of the speakers keyed by full name.
+    full_name: str, required
+        The full name of the speaker.
+    aggregate: dict, required
+        The aggregate of the speaker from the session.
+    session_name: str, required
+        The name of the session file, without extension.
+    """
+    if full_name not in census:
+        census[full_name] = {
+            'count': 0,
+            'first_session': session_name,
+            'last_session': session_name,
+            'is_guest': False,
+            'is_member': False,
+            'profile_url': None,
+            'guest_record': None,
+            'member_record': None
+        }
+    speaker = census[full_name]
+    speaker['count'] += aggregate['count']
+    speaker['last_session'] = session_name
+    for record_key in ['guest_record', 'member_record']:
+        if speaker[record_key] is None:
+            speaker[record_key] = aggregate[record_key]
+    speaker['is_guest'] = speaker['guest_record'] is not None
+    speaker['is_member'] = speaker['member_record'] is not None
+    if speaker['member_record'] is not None:
+        speaker['profile_url'] = speaker['member_record']['profile_url']
+
+
+def build_name_records(census: Dict[str, dict]) -> List[dict]:
+    """Build the records of the unique speaker names from the census.
+
+    Parameters
+    ----------
+    census: dict of (str, dict), required
+        The aggregates of the speakers keyed by full name.
+
+    Returns
+    -------
+    records: list of dict
+        The unique names, with an empty correct name and the aggregates of each name.
+    """
+    return [{
+        'name': full_name,
+        'correct_name': '',
+        'count': speaker['count'],
+        'first_session': speaker['first_session'],
+        'last_session': speaker['last_session'],
+        'is_guest': speaker['is_guest'],
+        'is_member': speaker['is_member'],
+        'profile_url': speaker['profile_url']
+    } for full_name, speaker in census.items()]
+
+
+def build_speaker_records(census: Dict[str, dict], guests: bool) -> List[dict]:
+    """Build the records of the guests or of the members of the Parliament from the census.
+
+    Parameters
+    ----------
+    census: dict of (str, dict), required
+        The aggregates of the speakers keyed by full name.
+    guests: bool, required
+        Whether to build the records of the guests or of the members.
+
+    Returns
+    -------
+    records: list of dict
+        The first record of each speaker as a guest or as a member.
+    """
+    record_key = 'guest_record' if guests else 'member_record'
+    return [
+        speaker[record_key] for speaker in census.values()
+        if speaker[record_key] is not None
+    ]
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+"""Merge the shards of ParlaMint-RO corpus built separately by build-corpus.py."""
+from argparse import Namespace, ArgumentParser
+from framework.core.conversion.buildmanifest import BuildManifest
+from framework.core.conversion.buildmanifest import MANIFEST_FILE
+from framework.core.conversion.corpusroot.organizationslistreader import OrganizationsListReader
+from framework.core.conversion.corpusroot.personregistry import PersonRegistry
+from framework.core.conversion.corpusroot.personregistry import REGISTRY_FILE
+from framework.core.conversion.corpusroot.rootcorpusfilebuilder import RootCorpusFileBuilder
+from framework.core.conversion.corpussetup import build_speaker_info_provider
+from framework.core.conversion.corpussetup import prepare_corpus_directory
+from framework.core.conversion.sessionstatssidecar import get_sidecar_path
+from framework.core.conversion.sessionstatssidecar import remove_session_stats
+from framework.core.xmlutils import XmlElements
+from framework.core.xmlutils import XsiIncludeElementsReader
+from framework.core.xmlutils import add_xml_profile_arguments
+from framework.core.xmlutils import configure_xml_profiles_from_arguments
+from framework.utils.loggingutils import configure_logging
+from pathlib import Path
+from typing import List
+from typing import Tuple
+import logging
+import shutil
+
+
+def copy_session_file(session_file: Path, output_dir: Path) -> Path:
+    """Copy the session file and its statistics record to the output directory.
+
+    Parameters
+    ----------
+    session_file: Path, required
+        The path of the session file in the shard directory.
+    output_dir: Path, required
+        The path of the output directory.
+
+    Returns
+    -------
+    output_file: Path
+        The path of the copied session file.
+    """
+    output_file = output_dir / session_file.name
+    shutil.copyfile(session_file, output_file)
+    sidecar_path = get_sidecar_path(str(session_file))
+    if sidecar_path.exists():
+        output_sidecar_path = get_sidecar_path(str(output_file))
+        output_sidecar_path.parent.mkdir(exist_ok=True)
+        shutil.copyfile(sidecar_path, output_sidecar_path)
+    return output_file
+
+
+def collect_session_files(
+        shards: List[str]) -> List[Tuple[str, Path, BuildManifest]]:
+    """Collect the session files built by the shards.
+
+    Parameters
+    ----------
+    shards: list of str, required
+        The output directories of the shards.
+
+    Returns
+    -------
+    session_files: list of (str, Path, BuildManifest) tuples
+        The name of each session file, the directory of its shard and the manifest
+        of the shard, sorted by the name of the session file.
+    """
+    session_files = {}
+    for shard_directory in shards:
+        shard_dir = Path(shard_directory)
+        shard_manifest = BuildManifest(str(shard_dir / MANIFEST_FILE))
+        file_names = shard_manifest.get_built_session_files()
+        logging.info("Found %s sessions in shard %s.", len(file_names),
+                     shard_dir)
+        for file_name in file_names:
+            if file_name in session_files:
+                logging.warning(
+                    "Session %s from shard %s was already built by shard %s; skipping.",
+                    file_name, shard_dir, session_files[file_name][1])
+                continue
+            session_files[file_name] = (file_name, shard_dir, shard_manifest)
+    return [session_files[file_name] for file_name in sorted(session_files)]
+
+
+def add_session_file(root_builder: RootCorpusFileBuilder, session_file: Path,
+                     output_file: Path) -> bool:
+    """Add the copied session file to the corpus root file.
+
+    Parameters
+    ----------
+    root_builder: RootCorpusFileBuilder, required
+        The builder of the corpus root file.
+    session_file: Path, required
+        The path of the session file in the shard directory.
+    output_file: Path, required
+        The path of the copied session file.
+
+    Returns
+    -------
+    added: bool
+        True if the session was added; otherwise False.
+    """
+    try:
+        root_builder.add_corpus_file(str(output_file))
+        return True
+    except Exception as e:
+        if output_file.exists():
+            output_file.unlink()
+        remove_session_stats(str(output_file))
+        logging.exception("Failed to add session %s. Exception: %r",
+                          session_file, e)
+        return False
+
+
+def main(args):
+    """Entry point of the module."""
+    taxonomy_files = XsiIncludeElementsReader(
+        args.corpus_root_template).get_included_files(XmlElements.classDecl)
+    participant_description_files = XsiIncludeElementsReader(
+        args.corpus_root_template).get_included_files(XmlElements.particDesc)
+
+    output_dir = prepare_corpus_directory(
+        args.output_directory, taxonomy_files + participant_description_files)
+    speaker_info_provider = build_speaker_info_provider(
+        args.speaker_name_map,
+        args.profile_info,
+        cache_directory=args.speaker_data_cache)
+
+    org_list_reader = OrganizationsListReader(
+        str(output_dir / participant_description_files[0].name))
+    person_registry = PersonRegistry(
+        str(output_dir / participant_description_files[1].name),
+        str(output_dir / REGISTRY_FILE))
+    root_file_path = str(output_dir / Path("ParlaMint-RO.xml"))
+    root_builder = RootCorpusFileBuilder(root_file_path,
+                                         args.corpus_root_template,
+                                         speaker_info_provider,
+                                         person_registry, org_list_reader,
+                                         args.build_sample)
+    manifest = BuildManifest(str(output_dir / MANIFEST_FILE))
+
+    session_files = collect_session_files(args.shards)
+    total, processed, failed = 0, 0, 0
+    # The sessions are added in the order of their names, as in a single build,
+    # so that the speaker ids resolve to the same personal info.
+    try:
+        for file_name, shard_dir, shard_manifest in session_files:
+            total = total + 1
+            session_file = shard_dir / file_name
+            if not session_file.exists():
+                logging.error("Session file %s is missing.", session_file)
+                failed = failed + 1
+                continue
+            output_file = copy_session_file(session_file, output_dir)
+            speaker_ids = shard_manifest.get_speaker_ids(file_name)
+            speaker_info_provider.merge_id_map(speaker_ids)
+            converted = add_session_file(root_builder, session_file,
+                                         output_file)
+            if converted:
+                processed = processed + 1
+            else:
+                failed = failed + 1
+            manifest.record_session(str(output_file),
+                                    shard_manifest.get_inputs(file_name),
+                                    converted, speaker_ids)
+    finally:
+        root_builder.finalize()
+        manifest.save()
+        person_registry.close()
+
+    logging.info("Merged: %s/%s", processed, total)
+    if failed > 0:
+        logging.info("Failed: %s/%s", failed, total)
+    logging.info("That's all folks!")
+
+
+def parse_arguments() -> Namespace:
+    """Parse command-line arguments.
+
+    Returns
+    -------
+    args: argparse.Namespace
+        The command-line arguments.
+    """
+    parser = ArgumentParser(
+        description='Merge the shards of ParlaMint-RO corpus.')
+    parser.add_argument(
+        'shards',
+        help="The output directories of build-corpus.py for each shard.",
+        nargs='+')
+    parser.add_argument('--corpus-root-template',
+                        help="The path of the corpus root template.",
+                        default='data/templates/corpus-root-template.xml')
+    parser.add_argument(
+        '--speaker-name-map',
+        help="The path of the CSV file mapping speaker names to correct names.",
+        type=str,
+        default='data/speakers/speaker-name-map.csv')
+    parser.add_argument('--profile-info',
+                        help="The CSV file containing profile info.",
+                        default='data/speakers/profile-info.csv')
+    parser.add_argument(
+        '--speaker-data-cache',
+        help="When present, the directory where the data read from the "
+        "speaker name map and profile info files is cached, keyed by the "
+        "hash of the files.")
+    parser.add_argument('-o',
+                        '--output-directory',
+                        help="The directory where to save corpus files.",
+                        default="corpus")
+    parser.add_argument(
+        '--sample',
+        help="When present, the shards were built as a sample corpus.",
+        action='store_true',
+        dest='build_sample')
+    add_xml_profile_arguments(parser)
+    parser.add_argument(
+        '-l',
+        '--log-level',
+        help="The level of details to print when running.",
+        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        default='info')
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    configure_logging(args.log_level, 'merge_corpus_shards.log')
+    configure_xml_profiles_from_arguments(args)
+    main(args)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Suggests corrections for the speaker names missing from the name map."""
+import argparse
+import logging
+import pandas as pd
+from framework.core.conversion.namemapping.namecorrectionsreader import NameCorrectionsReader
+from framework.core.conversion.namemapping.namematchindex import build_name_match_index
+from framework.core.conversion.namemapping.speakerinforeader import SpeakerInfoReader
+from framework.core.conversion.namemapping.speakernameresolver import SpeakerNameResolver
+from framework.utils.loggingutils import configure_logging
+from framework.utils.speakercensus import SpeakerCensus
+from framework.utils.dataframeutils import save_data_frame
+
+
+def main(args):
+    """Suggest the most similar known names for the unresolved speaker names."""
+    name_corrections = NameCorrectionsReader().read(args.speaker_name_map)
+    personal_info = SpeakerInfoReader().read(args.profile_info)
+    name_resolver = SpeakerNameResolver(name_corrections)
+    name_index = build_name_match_index(name_corrections, personal_info)
+
+    census = SpeakerCensus(args.workers,
+                           args.census_cache).take(args.sessions_dir)
+    unresolved_names = [
+        name for name in census if name_resolver.resolve_name(name) is None
+    ]
+    logging.info("Found %s unresolved names.", len(unresolved_names))
+
+    records = []
+    for name in sorted(unresolved_names):
+        for match in name_index.find(name, args.limit, args.min_score):
+            records.append({
+                'name': name,
+                'correct_name': match.name,
+                'score': round(match.score, 4)
+            })
+    columns = ['name', 'correct_name', 'score']
+    save_data_frame(pd.DataFrame.from_records(records, columns=columns),
+                    args.suggestions_file)
+    logging.info("That's all folks!")
+
+
+def parse_arguments():
+    """Parse the command-line arguments.
+
+    Returns
+    -------
+    args: argparse.Namespace
+        The command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Suggest corrections for unresolved speaker names.')
+    parser.add_argument(
+        '--sessions-dir',
+        help="The path of the directory containing crawled sessions.",
+        type=str,
+        default="./data/sessions/")
+    parser.add_argument(
+        '--speaker-name-map',
+        help="The path of the CSV file mapping speaker names to correct names.",
+        type=str,
+        default='./data/speakers/speaker-name-map.csv')
+    parser.add_argument('--profile-info',
+                        help="The CSV file containing profile info.",
+                        type=str,
+                        default='./data/speakers/profile-info.csv')
+    parser.add_argument(
+        '--suggestions-file',
+        help="The path of the CSV file where to save the suggested names.",
+        type=str,
+        default="./data/speakers/name-suggestions.csv")
+    parser.add_argument(
+        '--limit',
+        help="The maximum number of suggested names for each unresolved name.",
+        type=int,
+        default=3)
+    parser.add_argument(
+        '--min-score',
+        help="The minimum similarity, between 0 and 1, of the suggested names.",
+        type=float,
+        default=0.5)
+    parser.add_argument('--workers',
+                        help="The number of processes scanning the sessions. "
+                        "Defaults to the number of CPUs.",
+                        type=int,
+                        default=None)
+    parser.add_argument(
+        '--census-cache',
+        help="The JSON file caching the speakers of each session, "
+        "so that only new or changed sessions are scanned again.",
+        type=str,
+        default="./data/speakers/.speaker-census-cache.json")
+    parser.add_argument(
+        '-l',
+        '--log-level',
+        help="The level of details to print when running.",
+        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        default='info')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    configure_logging(args.log_level)
+    main(args)